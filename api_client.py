@@ -0,0 +1,181 @@
+"""배출구 데이터 추출 HTTP API 클라이언트 (표준 라이브러리만 사용)
+
+사용 예:
+    python api_client.py 계획서.pdf 검토서.pdf                       # 제출 → 완료 대기 → 정리양식.xlsx 저장
+    python api_client.py 계획서.pdf --form B --json 결과.json --url http://127.0.0.1:8600
+
+api_server.py로 띄운 서버에 PDF를 제출하고 상태를 조회하여 결과를 받는다.
+서버가 바쁘면(503) Retry-After만큼 기다렸다가 다시 제출한다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from api_server import DEFAULT_HOST, DEFAULT_OUTLETS, DEFAULT_PORT, RETRY_AFTER_SECONDS
+from extraction_profiles import PROFILE_CHOICES, PROFILE_DEFAULT
+from jobs import JOB_DONE, JOB_FAILED, JOB_QUEUED
+
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+POLL_INTERVAL = 1.0
+
+class ApiClientError(Exception):
+    """서버가 오류 응답을 보냄 (status: HTTP 상태 코드, retry_after: 503일 때 권장 대기 시간)"""
+    
+    def __init__(self, status, message, retry_after=None):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+        self.retry_after = retry_after
+
+def encode_multipart(fields, files):
+    """(본문 바이트, Content-Type) 반환: fields는 {이름: 문자열}, files는 {이름: (파일명, 바이트)}"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode('utf-8')
+            + str(value).encode('utf-8') + b'\r\n'
+        )
+    for name, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: application/pdf\r\n\r\n'.encode('utf-8') + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+class ApiClient:
+    """API 서버 호출 래퍼 (응답 JSON을 딕셔너리로 반환)"""
+    
+    def __init__(self, base_url=DEFAULT_URL, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+    
+    def _request(self, method, path, body=None, content_type=None):
+        request = Request(self.base_url + path, data=body, method=method)
+        if content_type:
+            request.add_header('Content-Type', content_type)
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                return response.status, response.read()
+        except HTTPError as e:
+            content = e.read()
+            try:
+                message = json.loads(content)['error']
+            except (ValueError, KeyError, TypeError):
+                message = content.decode('utf-8', 'replace') or e.reason
+            retry_after = e.headers.get('Retry-After')
+            raise ApiClientError(e.code, message, int(retry_after) if retry_after else None) from None
+    
+    def _json(self, method, path, body=None, content_type=None):
+        return json.loads(self._request(method, path, body, content_type)[1])
+    
+    def submit(self, plan_path, review_path=None, outlets=None, strict=False, form=PROFILE_DEFAULT, max_retries=0,
+               page_timeout=None):
+        """PDF 제출 후 작업 상태 반환 (대기열이 가득 차면 max_retries번까지 Retry-After만큼 기다려 재시도)
+        
+        page_timeout(초)을 주면 서버가 페이지 감시로 추출한다 (넘긴 페이지는 건너뛰고, 다시 제출하면 이어서 처리).
+        """
+        files = {}
+        for name, path in (('plan', plan_path), ('review', review_path)):
+            if path:
+                with open(path, 'rb') as f:
+                    files[name] = (os.path.basename(path), f.read())
+        fields = {'outlets': ','.join(outlets or DEFAULT_OUTLETS), 'strict': int(bool(strict)), 'form': form}
+        if page_timeout:
+            fields['page_timeout'] = page_timeout
+        body, content_type = encode_multipart(fields, files)
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return self._json('POST', '/jobs', body, content_type)
+            except ApiClientError as e:
+                if e.status != 503 or attempt == max_retries:
+                    raise
+                time.sleep(e.retry_after or RETRY_AFTER_SECONDS)
+    
+    def status(self, job_id):
+        return self._json('GET', f'/jobs/{job_id}')
+    
+    def wait(self, job_id, poll_interval=POLL_INTERVAL, timeout=None, on_status=None):
+        """작업이 끝날 때까지 상태를 조회하여 마지막 상태 반환 (timeout 초가 지나면 TimeoutError)"""
+        started = time.monotonic()
+        while True:
+            status = self.status(job_id)
+            if on_status:
+                on_status(status)
+            if status['status'] in (JOB_DONE, JOB_FAILED):
+                return status
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(f"작업 {job_id}이 {timeout}초 안에 끝나지 않았습니다 ({status['status']})")
+            time.sleep(poll_interval)
+    
+    def result(self, job_id):
+        """결과 JSON (추출 행, 검증 이슈, 비교 결과, 페이지별 처리 현황)"""
+        return self._json('GET', f'/jobs/{job_id}/result')
+    
+    def download_excel(self, job_id, path):
+        """정리양식.xlsx를 path에 저장하고 바이트 수 반환"""
+        _, content = self._request('GET', f'/jobs/{job_id}/result.xlsx')
+        with open(path, 'wb') as f:
+            f.write(content)
+        return len(content)
+    
+    def health(self):
+        return self._json('GET', '/health')
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="배출구 데이터 추출 API에 PDF를 제출하고 결과를 받습니다.")
+    parser.add_argument('plan', help="계획서 PDF")
+    parser.add_argument('review', nargs='?', help="검토서 PDF (선택)")
+    parser.add_argument('--url', default=DEFAULT_URL, help=f"API 서버 주소 (기본: {DEFAULT_URL})")
+    parser.add_argument('--outlets', nargs='+', default=DEFAULT_OUTLETS, help="추출할 배출구 타입 (기본: #A #B #C)")
+    parser.add_argument('--strict', action='store_true', help="페이지 사전 필터를 끄고 모든 페이지를 검사")
+    parser.add_argument('--form', default=PROFILE_DEFAULT, choices=PROFILE_CHOICES,
+                        help="문서 형태 (추출 프로파일, '자동'이면 앞쪽 페이지로 감지)")
+    parser.add_argument('-o', '--output', default='정리양식.xlsx', help="저장할 엑셀 파일 경로")
+    parser.add_argument('--json', help="결과 JSON을 저장할 경로 (선택)")
+    parser.add_argument('--retries', type=int, default=5, help="서버가 바쁠 때(503) 재시도 횟수")
+    parser.add_argument('--page-timeout', type=float, metavar='SECONDS',
+                        help="페이지 감시: 이 시간(초)을 넘기는 페이지는 건너뜀 (다시 제출하면 이어서 처리)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    client = ApiClient(args.url)
+    
+    submitted = client.submit(
+        args.plan, args.review, args.outlets, args.strict, args.form, args.retries, args.page_timeout
+    )
+    note = " (처리 중인 같은 작업에 연결)" if submitted.get('deduplicated') else ""
+    print(f"📤 작업 {submitted['id']} 제출{note}")
+    
+    last = {}
+    
+    def show(status):
+        shown = (status['status'], status['message'])
+        if last.get('shown') == shown:
+            return
+        last['shown'] = shown
+        position = f" (앞에 {status['queue_position']}건)" if status['status'] == JOB_QUEUED else ""
+        print(f"  {status['status']}{position} {status['message']}")
+    
+    status = client.wait(submitted['id'], on_status=show)
+    if status['status'] == JOB_FAILED:
+        print(f"❌ 처리 실패: {status['message']}")
+        return 1
+    
+    size = client.download_excel(status['id'], args.output)
+    print(f"✅ {args.output} 저장 ({size:,}바이트) 요약: {json.dumps(status['summary'], ensure_ascii=False)}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(client.result(status['id']), f, ensure_ascii=False, indent=1)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
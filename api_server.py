@@ -0,0 +1,494 @@
+"""배출구 데이터 추출 HTTP API 서버 (Streamlit 없이 실행)
+
+사용 예:
+    python api_server.py --port 8600 --workers 2 --max-queue 8
+    python api_client.py 계획서.pdf 검토서.pdf --url http://127.0.0.1:8600
+
+엔드포인트 (응답은 JSON, 오류는 {"error": 메시지})
+    POST /jobs                   multipart/form-data로 PDF 제출 → 202 작업 상태
+                                 필드: plan(필수), review(선택), outlets('#A,#B,#C'), strict('1'), form('기본', '자동'이면 형태 감지),
+                                       page_timeout(초, 주면 페이지 감시: 넘긴 페이지는 건너뛰고 다시 제출하면 이어서 처리)
+    GET  /jobs/{id}              작업 상태 (대기/실행중/완료/실패, 대기 순번, 경과 시간, 완료 시 요약)
+    GET  /jobs/{id}/result       결과 JSON (추출 행, 검증 이슈, 비교 결과, 페이지별 처리 현황)
+    GET  /jobs/{id}/result.xlsx  정리양식.xlsx
+    GET  /health                 상태별 작업 수와 한도
+
+업로드는 요청 스레드에서 작업 디렉터리에 저장하고 곧바로 응답하며, 처리(pipeline.process_documents)는
+크기가 정해진 프로세스 풀(--workers)에서 실행한다. 대기열은 jobs.JobManager가 관리한다.
+    - 대기 중인 작업이 --max-queue개이면 새 제출은 503과 Retry-After로 거절한다.
+    - 요청 본문이 --max-upload-mb보다 크면 413으로 거절한다 (본문은 메모리에서 파싱).
+    - 같은 PDF·옵션으로 대기·실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려준다 (200, deduplicated).
+끝난 작업의 결과 파일은 JobManager 보관 한도(개수·시간)를 넘어 작업이 정리될 때 함께 지운다.
+"""
+import argparse
+import email.policy
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from email.parser import BytesParser
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
+
+from batch_cli import get_standards
+from extraction_cache import ExtractionCache
+from extraction_profiles import PROFILE_CHOICES, PROFILE_DEFAULT
+from jobs import DEFAULT_MAX_JOBS, JOB_DONE, JOB_FAILED, JOB_QUEUED, JobManager, QueueFullError
+from page_supervisor import PageSupervision, unfinished_pages
+from pipeline import PLAN_LABEL, REVIEW_LABEL, process_documents
+from standards import DEFAULT_STANDARDS_DIR, JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8600
+DEFAULT_MAX_QUEUE = 8
+DEFAULT_MAX_UPLOAD_MB = 256
+DEFAULT_OUTLETS = ['#A', '#B', '#C']
+RETRY_AFTER_SECONDS = 10  # 대기열이 가득 찼을 때 다시 요청하기까지 권장 시간
+
+# 작업 디렉터리 안의 파일 이름
+PLAN_FILENAME = 'plan.pdf'
+REVIEW_FILENAME = 'review.pdf'
+RESULT_FILENAME = 'result.json'
+EXCEL_FILENAME = '정리양식.xlsx'
+
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+EXCEL_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+class ApiError(Exception):
+    """HTTP 오류 응답으로 변환되는 예외"""
+    
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+@lru_cache(maxsize=1)
+def get_extraction_cache():
+    """워커 프로세스마다 하나인 추출 결과 캐시 (디스크 계층은 프로세스 간 공유)"""
+    return ExtractionCache()
+
+def _json_safe(value):
+    """json으로 쓸 수 있는 값으로 변환 (NaN/inf → None, numpy 스칼라·배열 → 파이썬 값)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if hasattr(value, 'tolist'):  # numpy 스칼라·배열
+        return _json_safe(value.tolist())
+    return value
+
+def _row_records(data):
+    """RowStore를 행 딕셔너리 목록으로 (DataFrame 변환과 같은 컬럼 구성)"""
+    return data.to_dataframe().to_dict('records') if len(data) else []
+
+def _write_atomic(path, write):
+    """임시 파일에 쓴 뒤 교체 (처리 중에 결과를 읽어도 불완전한 파일이 보이지 않도록)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+def process_request(job_dir, has_review, outlet_types, strict=False, form=PROFILE_DEFAULT,
+                    standards_dir=DEFAULT_STANDARDS_DIR, use_cache=True, page_timeout=None):
+    """워커 프로세스: 작업 디렉터리의 PDF를 처리하여 결과 JSON과 정리양식.xlsx를 저장하고 요약을 반환
+    
+    PDF는 처리가 끝나면 (실패해도) 지운다. 병렬성은 풀 크기로 조절하므로 문서 안에서는 페이지를 순서대로 파싱한다.
+    page_timeout(초)을 주면 페이지 감시(page_supervisor)로 추출한다. 감시 워커 프로세스는 문서를 차례로 처리하며
+    하나씩만 띄우고, 그동안 이 워커는 기다리기만 하므로 작업마다 파싱하는 프로세스는 여전히 하나이다.
+    """
+    plan_path = os.path.join(job_dir, PLAN_FILENAME)
+    review_path = os.path.join(job_dir, REVIEW_FILENAME) if has_review else None
+    try:
+        result = process_documents(
+            plan_path, review_path, outlet_types,
+            standards_index=get_standards(standards_dir) if standards_dir else None,
+            cache=get_extraction_cache() if use_cache else None, strict=strict, profile=form,
+            supervision=PageSupervision(page_timeout=page_timeout) if page_timeout else None,
+            isolate=False  # 이미 풀 워커 안이므로 문서별 프로세스를 더 띄우지 않음 (풀 크기가 곧 프로세스 상한)
+        )
+    finally:
+        for path in (plan_path, review_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+    
+    plan_data, review_data = result['plan_data'], result['review_data']
+    summary = {
+        '계획서건수': len(plan_data),
+        '검토서건수': len(review_data),
+        '원시데이터수': len(result['plan_raw_data']) + len(result['review_raw_data']),
+        '검증이슈': len(result['validation_issues']),
+        '비교차이': len(result['comparison_results']),
+        '미매칭': len(result['unmatched_items']),
+        '기준초과': sum(
+            judgement == JUDGEMENT_EXCEEDED
+            for data in (plan_data, review_data)
+            for (judgement,) in data.iter_values([JUDGEMENT_COLUMN])
+        ),
+        '추출프로파일': result['extraction_profiles'],
+        '캐시적중': result['cache_hits'],
+        '미완료페이지': len(unfinished_pages(result['plan_page_info'] + result['review_page_info'])),
+    }
+    document = {
+        '요약': summary,
+        PLAN_LABEL: _row_records(plan_data),
+        REVIEW_LABEL: _row_records(review_data),
+        '검증이슈': result['validation_issues'],
+        '비교결과': result['comparison_results'],
+        '미매칭': result['unmatched_items'],
+        '페이지': {PLAN_LABEL: result['plan_page_info'], REVIEW_LABEL: result['review_page_info']},
+    }
+    
+    _write_atomic(os.path.join(job_dir, EXCEL_FILENAME), lambda f: f.write(result['excel_bytes']))
+    _write_atomic(
+        os.path.join(job_dir, RESULT_FILENAME),
+        lambda f: f.write(json.dumps(_json_safe(document), ensure_ascii=False, default=str).encode('utf-8'))
+    )
+    return summary
+
+def parse_multipart(content_type, body):
+    """multipart/form-data 본문을 {필드 이름: 바이트} 딕셔너리로"""
+    if not content_type.startswith('multipart/form-data'):
+        raise ApiError(415, "multipart/form-data로 제출해야 합니다.")
+    message = BytesParser(policy=email.policy.HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+    )
+    if not message.is_multipart():
+        raise ApiError(400, "multipart 본문을 해석할 수 없습니다.")
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        if name:
+            fields[name] = part.get_payload(decode=True) or b''
+    return fields
+
+def parse_options(fields):
+    """폼 필드에서 처리 옵션 (배출구 타입, 엄격 모드, 문서 형태, 페이지 제한 시간) 추출"""
+    def text(name, default=''):
+        if name not in fields:
+            return default
+        try:
+            return fields[name].decode('utf-8').strip()
+        except UnicodeDecodeError:
+            raise ApiError(400, f"{name} 필드가 UTF-8 텍스트가 아닙니다.") from None
+    
+    outlets = [outlet.strip() for outlet in text('outlets').split(',') if outlet.strip()] or list(DEFAULT_OUTLETS)
+    form = text('form', PROFILE_DEFAULT) or PROFILE_DEFAULT
+    if form not in PROFILE_CHOICES:
+        raise ApiError(400, f"알 수 없는 문서 형태: {form} (선택: {', '.join(PROFILE_CHOICES)})")
+    try:
+        page_timeout = float(text('page_timeout') or 0) or None
+    except ValueError:
+        raise ApiError(400, f"page_timeout은 초 단위 숫자여야 합니다: {text('page_timeout')}") from None
+    if page_timeout is not None and not (0 < page_timeout < math.inf):
+        raise ApiError(400, f"page_timeout은 0보다 큰 유한한 값이어야 합니다: {text('page_timeout')}")
+    return {
+        'outlet_types': outlets, 'strict': text('strict').lower() in TRUE_VALUES, 'form': form,
+        'page_timeout': page_timeout
+    }
+
+def dedupe_key(plan, review, options):
+    """PDF 내용과 처리 옵션으로 만든 중복 제출 판별 키"""
+    digest = hashlib.sha256()
+    for content in (plan, review or b''):
+        digest.update(hashlib.sha256(content).digest())
+    digest.update(json.dumps(options, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+class ExtractionService:
+    """작업 제출·조회 로직 (HTTP 처리와 분리, 프로세스 풀 + JobManager 대기열)
+    
+    JobManager의 작업 스레드 수와 프로세스 풀 크기를 같게 두어, 실행 중인 작업마다 워커 프로세스가
+    하나씩 배정되고 나머지는 JobManager 대기열에서 기다린다.
+    """
+    
+    def __init__(self, work_dir=None, workers=DEFAULT_MAX_JOBS, max_queue=DEFAULT_MAX_QUEUE,
+                 max_upload_bytes=DEFAULT_MAX_UPLOAD_MB * 1024 * 1024, standards_dir=DEFAULT_STANDARDS_DIR,
+                 use_cache=True):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.max_upload_bytes = max_upload_bytes
+        self.standards_dir = standards_dir
+        self.use_cache = use_cache
+        self._owns_work_dir = work_dir is None
+        self.work_dir = work_dir or tempfile.mkdtemp(prefix='emission-api-')
+        os.makedirs(self.work_dir, exist_ok=True)
+        
+        self._lock = threading.RLock()
+        self._job_dirs = {}  # 작업 ID → 작업 디렉터리
+        self._pool = self._new_pool()
+        self.jobs = JobManager(
+            max_workers=self.workers, max_queued=max_queue, on_discard=self._discard_job
+        )
+    
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+    
+    def _run_in_pool(self, job_dir, has_review, options, progress):
+        """작업 스레드: 워커 프로세스에 처리를 맡기고 끝날 때까지 대기"""
+        progress(0.0, "워커 프로세스에서 처리 중...")
+        with self._lock:
+            pool = self._pool
+        try:
+            summary = pool.submit(
+                process_request, job_dir, has_review, standards_dir=self.standards_dir, use_cache=self.use_cache,
+                **options
+            ).result()
+        except BrokenProcessPool:
+            # 워커 프로세스가 비정상 종료(메모리 부족 등)하면 풀을 새로 만들어 다음 작업은 계속 처리
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = self._new_pool()
+            pool.shutdown(wait=False)
+            raise
+        progress(1.0, "처리 완료")
+        return summary
+    
+    def _discard_job(self, job):
+        with self._lock:
+            job_dir = self._job_dirs.pop(job.id, None)
+        if job_dir:
+            shutil.rmtree(job_dir, ignore_errors=True)
+    
+    def queue_full(self):
+        return self.jobs.counts()[JOB_QUEUED] >= self.max_queue
+    
+    def submit(self, plan, review, options):
+        """PDF 바이트와 옵션으로 작업 제출 → (Job, 중복 제출 여부)"""
+        job_dir = os.path.join(self.work_dir, uuid.uuid4().hex)
+        os.makedirs(job_dir)
+        for filename, content in ((PLAN_FILENAME, plan), (REVIEW_FILENAME, review)):
+            if content:
+                with open(os.path.join(job_dir, filename), 'wb') as f:
+                    f.write(content)
+        
+        with self._lock:
+            try:
+                job = self.jobs.submit(
+                    self._run_in_pool, job_dir, bool(review), options,
+                    label=PLAN_LABEL, dedupe_key=dedupe_key(plan, review, options)
+                )
+            except QueueFullError:
+                shutil.rmtree(job_dir, ignore_errors=True)
+                raise
+            deduplicated = job.id in self._job_dirs
+            if not deduplicated:
+                self._job_dirs[job.id] = job_dir
+        if deduplicated:
+            shutil.rmtree(job_dir, ignore_errors=True)
+        return job, deduplicated
+    
+    def get_job(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ApiError(404, f"작업을 찾을 수 없습니다: {job_id} (없거나 보관 기간이 지남)")
+        return job
+    
+    def job_status(self, job):
+        status = {
+            'id': job.id,
+            'status': job.status,
+            'progress': round(job.progress, 3),
+            'message': job.error if job.status == JOB_FAILED else job.message,
+            'created': datetime.fromtimestamp(job.created).isoformat(timespec='seconds'),
+            'elapsed': round(job.elapsed(), 2),
+        }
+        if job.status == JOB_QUEUED:
+            status['queue_position'] = self.jobs.queue_position(job)
+        if job.status == JOB_DONE:
+            status['summary'] = job.result
+            status['result'] = f"/jobs/{job.id}/result"
+            status['excel'] = f"/jobs/{job.id}/result.xlsx"
+        return status
+    
+    def result_path(self, job_id, filename):
+        """끝난 작업의 결과 파일 경로 (아직 끝나지 않았거나 실패했으면 409)"""
+        job = self.get_job(job_id)
+        if job.status == JOB_FAILED:
+            raise ApiError(409, f"작업이 실패했습니다: {job.error}")
+        if job.status != JOB_DONE:
+            raise ApiError(409, f"작업이 아직 끝나지 않았습니다 ({job.status})")
+        with self._lock:
+            job_dir = self._job_dirs.get(job_id)
+        path = os.path.join(job_dir, filename) if job_dir else None
+        if not path or not os.path.exists(path):
+            raise ApiError(410, "결과 파일이 정리되었습니다.")
+        return path
+    
+    def health(self):
+        return {
+            'jobs': self.jobs.counts(),
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'max_upload_mb': self.max_upload_bytes // (1024 * 1024),
+        }
+    
+    def shutdown(self):
+        self.jobs.shutdown(wait=False)
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._owns_work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """경로를 ExtractionService 호출로 연결하는 요청 처리기 (서비스는 self.server.service)"""
+    
+    server_version = 'EmissionAPI/1.0'
+    
+    ROUTES = (
+        ('GET', re.compile(r'^/health$'), 'handle_health'),
+        ('POST', re.compile(r'^/jobs$'), 'handle_submit'),
+        ('GET', re.compile(r'^/jobs/([0-9a-f]+)$'), 'handle_status'),
+        ('GET', re.compile(r'^/jobs/([0-9a-f]+)/result$'), 'handle_result'),
+        ('GET', re.compile(r'^/jobs/([0-9a-f]+)/result\.xlsx$'), 'handle_excel'),
+    )
+    
+    @property
+    def service(self):
+        return self.server.service
+    
+    def do_GET(self):
+        self._dispatch('GET')
+    
+    def do_POST(self):
+        self._dispatch('POST')
+    
+    def _dispatch(self, method):
+        path = self.path.split('?', 1)[0]
+        try:
+            for route_method, pattern, handler_name in self.ROUTES:
+                match = pattern.match(path)
+                if match:
+                    if route_method != method:
+                        raise ApiError(405, f"{method} {path}는 지원하지 않습니다.")
+                    getattr(self, handler_name)(*match.groups())
+                    return
+            raise ApiError(404, f"알 수 없는 경로: {path}")
+        except ApiError as e:
+            self.send_json(e.status, {'error': e.message}, e.headers)
+        except Exception as e:
+            self.log_error("처리 중 오류: %r", e)
+            self.send_json(500, {'error': f"{type(e).__name__}: {e}"})
+    
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', JSON_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_file(self, path, content_type, download_name=None):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        if download_name:
+            self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(download_name)}")
+        self.end_headers()
+        with open(path, 'rb') as f:
+            shutil.copyfileobj(f, self.wfile)
+    
+    def handle_health(self):
+        self.send_json(200, self.service.health())
+    
+    def handle_submit(self):
+        retry_after = {'Retry-After': str(RETRY_AFTER_SECONDS)}
+        # 본문을 읽기 전에 대기열을 확인하여 바쁠 때는 업로드를 받지 않음
+        if self.service.queue_full():
+            raise ApiError(503, "대기 중인 작업이 많습니다. 잠시 후 다시 제출하세요.", retry_after)
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise ApiError(411, "Content-Length가 필요합니다.")
+        try:
+            length = int(length)
+        except ValueError:
+            raise ApiError(400, f"Content-Length가 정수가 아닙니다: {length}") from None
+        if length < 0:
+            raise ApiError(400, f"Content-Length가 음수입니다: {length}")
+        if length > self.service.max_upload_bytes:
+            raise ApiError(413, f"업로드 한도({self.service.max_upload_bytes // (1024 * 1024)}MB)를 넘었습니다.")
+        
+        fields = parse_multipart(self.headers.get('Content-Type', ''), self.rfile.read(length))
+        if not fields.get('plan'):
+            raise ApiError(400, "계획서 PDF(plan 필드)가 필요합니다.")
+        options = parse_options(fields)
+        try:
+            job, deduplicated = self.service.submit(fields['plan'], fields.get('review'), options)
+        except QueueFullError as e:
+            raise ApiError(503, str(e), retry_after)
+        
+        status = self.service.job_status(job)
+        status['deduplicated'] = deduplicated
+        self.send_json(200 if deduplicated else 202, status, {'Location': f"/jobs/{job.id}"})
+    
+    def handle_status(self, job_id):
+        self.send_json(200, self.service.job_status(self.service.get_job(job_id)))
+    
+    def handle_result(self, job_id):
+        self.send_file(self.service.result_path(job_id, RESULT_FILENAME), JSON_CONTENT_TYPE)
+    
+    def handle_excel(self, job_id):
+        self.send_file(self.service.result_path(job_id, EXCEL_FILENAME), EXCEL_CONTENT_TYPE, EXCEL_FILENAME)
+
+class ApiServer(ThreadingHTTPServer):
+    """요청마다 스레드 하나 (요청 스레드는 업로드 저장과 조회만 하므로 가벼움)"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, service):
+        super().__init__(address, ApiRequestHandler)
+        self.service = service
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="배출구 데이터 추출 HTTP API 서버")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="바인딩 주소 (기본: 로컬 전용 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="포트")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_MAX_JOBS, help="동시에 처리할 작업 수 (워커 프로세스 수)")
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help="대기열 최대 길이 (넘으면 503 + Retry-After)")
+    parser.add_argument('--max-upload-mb', type=int, default=DEFAULT_MAX_UPLOAD_MB, help="요청 본문 최대 크기 (MB)")
+    parser.add_argument('--standards', default=DEFAULT_STANDARDS_DIR,
+                        help="별표8/별표15 기준표(CSV/엑셀) 디렉터리 (없으면 배출기준 초과 판정 생략)")
+    parser.add_argument('--work-dir', help="업로드·결과 파일 디렉터리 (기본: 임시 디렉터리, 종료 시 삭제)")
+    parser.add_argument('--no-cache', action='store_true', help="추출 결과 캐시를 쓰지 않음")
+    return parser
+
+def _stop_on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    service = ExtractionService(
+        work_dir=args.work_dir, workers=args.workers, max_queue=args.max_queue,
+        max_upload_bytes=args.max_upload_mb * 1024 * 1024, standards_dir=args.standards, use_cache=not args.no_cache
+    )
+    server = ApiServer((args.host, args.port), service)
+    print(f"🌐 http://{args.host}:{server.server_port} (작업자 {service.workers}개, 대기열 {service.max_queue}개)")
+    signal.signal(signal.SIGTERM, _stop_on_sigterm)  # 서비스 관리자의 종료 요청도 Ctrl+C처럼 정리 후 종료
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
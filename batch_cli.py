@@ -0,0 +1,431 @@
+"""계획서/검토서 PDF 일괄 처리 CLI (Streamlit 없이 실행)
+
+사용 예:
+    python batch_cli.py ./월말정산 --output-dir ./결과 --jobs 8
+    python batch_cli.py "./월말정산/*.pdf" --outlets "#A" "#B" "#C" "#D"
+    python batch_cli.py ./월말정산 --standards ./기준표
+    python batch_cli.py ./월말정산 --profile  # 쌍마다 '시설명_처리프로파일.json' 저장
+    python batch_cli.py ./월말정산 --form B   # 문서 형태를 지정 ('자동'이면 앞쪽 페이지로 감지, 기본: '기본' 설정)
+    python batch_cli.py ./월말정산 --export parquet --no-excel  # 쌍마다 '시설명_데이터/' 디렉터리에 Parquet만 저장
+    python batch_cli.py ./월말정산 --page-timeout 60  # 60초 넘게 걸리는 페이지는 건너뛰고, 중단되면 다시 실행 시 이어서 처리
+
+파일명에 '계획서'/'검토서'가 들어간 PDF를 같은 시설명끼리 짝지어 처리한다.
+예: 'OO공장_계획서.pdf' + 'OO공장_검토서.pdf' → 'OO공장_정리양식.xlsx'
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+
+import pandas as pd
+
+from bulk_export import EXPORT_FORMATS, TABLE_INTEGRATED, build_export_tables, write_directory
+from comparison import compare_plan_review
+from excel_export import create_standardized_excel
+from extraction_profiles import PROFILE_CHOICES, PROFILE_DEFAULT
+from page_supervisor import (
+    DEFAULT_PAGE_MEMORY_BYTES, DEFAULT_PAGE_TIMEOUT, PageSupervision, has_unfinished_checkpoint,
+    parse_pdf_tables_supervised, unfinished_pages
+)
+from pdf_extractor import DEFAULT_WORKERS, extract_page_rows, iter_extracted_pages
+from pdf_io import MB
+from profiling import NULL_PROFILER, StageProfiler
+from row_store import RowStore
+from standards import DEFAULT_STANDARDS_DIR, JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED, attach_standards, load_standards
+from validation import validate_data_accuracy
+
+PLAN_KEYWORD = '계획서'
+REVIEW_KEYWORD = '검토서'
+OUTPUT_SUFFIX = '_정리양식.xlsx'
+PROFILE_SUFFIX = '_처리프로파일.json'
+EXPORT_SUFFIX = '_데이터'
+SUMMARY_FILENAME = '배치요약_{timestamp}.xlsx'
+
+# --profile 계측 수준
+PROFILE_TIME = 'time'
+PROFILE_MEMORY = 'memory'
+
+def collect_pdf_files(inputs):
+    """디렉터리 또는 glob 패턴 목록에서 PDF 파일 경로 수집"""
+    pdf_files = set()
+    
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = glob.glob(os.path.join(item, '*'))
+        else:
+            candidates = glob.glob(item)
+        
+        for path in candidates:
+            if os.path.isfile(path) and path.lower().endswith('.pdf'):
+                pdf_files.add(os.path.abspath(path))
+    
+    return sorted(pdf_files)
+
+def pair_key(filename, keyword):
+    """파일명에서 계획서/검토서 표기를 제거한 시설 키"""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    stem = stem.replace(keyword, '')
+    return re.sub(r'[\s_\-.()]+', ' ', stem).strip()
+
+def pair_documents(pdf_files):
+    """파일명 규칙으로 (시설 키, 계획서, 검토서) 목록 생성
+    
+    검토서가 없는 계획서는 단독으로 처리하고, 계획서가 없는 검토서와
+    어느 쪽 표기도 없는 파일은 경고 목록으로 돌려준다.
+    시설 키가 같은 계획서(또는 검토서)가 여러 개이면 어느 것을 짝지을지 알 수 없으므로 모두 제외하고 경고한다
+    (다른 입력 디렉터리의 같은 파일명 등). 검토서가 겹치면 계획서는 단독으로 처리한다.
+    """
+    plan_paths = {}
+    review_paths = {}
+    warnings = []
+    
+    for path in pdf_files:
+        name = os.path.basename(path)
+        if PLAN_KEYWORD in name:
+            plan_paths.setdefault(pair_key(name, PLAN_KEYWORD), []).append(path)
+        elif REVIEW_KEYWORD in name:
+            review_paths.setdefault(pair_key(name, REVIEW_KEYWORD), []).append(path)
+        else:
+            warnings.append(f"계획서/검토서 표기가 없어 제외: {name}")
+    
+    def unique(paths_by_key, label):
+        documents = {}
+        for key, paths in sorted(paths_by_key.items()):
+            if len(paths) == 1:
+                documents[key] = paths[0]
+            else:
+                warnings.append(f"시설 키 '{key}'인 {label}가 {len(paths)}개라 제외: {', '.join(paths)}")
+        return documents
+    
+    plans = unique(plan_paths, PLAN_KEYWORD)
+    reviews = unique(review_paths, REVIEW_KEYWORD)
+    
+    for key in sorted(set(reviews) - set(plans)):
+        warnings.append(f"짝이 되는 계획서가 없어 제외: {os.path.basename(reviews[key])}")
+    
+    pairs = [(key, plans[key], reviews.get(key)) for key in sorted(plans)]
+    return pairs, warnings
+
+def output_path_for(key, output_dir):
+    """시설 키에 해당하는 정리양식 파일 경로"""
+    safe_key = key.replace(' ', '_') or 'output'
+    return os.path.join(output_dir, f"{safe_key}{OUTPUT_SUFFIX}")
+
+def profile_path_for(output_path):
+    """정리양식 파일 옆에 저장하는 처리 프로파일 경로"""
+    return output_path[:-len(OUTPUT_SUFFIX)] + PROFILE_SUFFIX
+
+def export_dir_for(output_path):
+    """정리양식 파일 옆에 만드는 대량 내보내기 디렉터리 경로"""
+    return output_path[:-len(OUTPUT_SUFFIX)] + EXPORT_SUFFIX
+
+def output_names(output_path, excel=True, export_format=None):
+    """요약에 기록하는 출력 파일·디렉터리 이름"""
+    names = [os.path.basename(output_path)] if excel else []
+    if export_format:
+        names.append(os.path.basename(export_dir_for(output_path)) + '/')
+    return ', '.join(names)
+
+def output_targets(output_path, excel=True, export_format=None):
+    """최신 여부를 판단할 출력 파일 목록 (정리양식, 대량 내보내기의 통합데이터 파일)"""
+    targets = [output_path] if excel else []
+    if export_format:
+        targets.append(os.path.join(export_dir_for(output_path), f"{TABLE_INTEGRATED}.{export_format}"))
+    return targets
+
+def is_up_to_date(output_path, input_paths):
+    """출력 파일(또는 출력 파일 목록의 모든 파일)이 모든 입력 파일보다 최신이면 True"""
+    output_paths = [output_path] if isinstance(output_path, str) else list(output_path)
+    if not output_paths or not all(os.path.exists(path) for path in output_paths):
+        return False
+    output_mtime = min(os.path.getmtime(path) for path in output_paths)
+    return all(os.path.getmtime(path) <= output_mtime for path in input_paths if path)
+
+def has_pages_to_retry(input_paths, strict, form, supervision):
+    """페이지 감시로 다시 시도하도록 했고(retry_failed) 입력 PDF의 체크포인트에 건너뜀·실패 페이지가 남아 있으면 True
+    
+    일부완료로 끝난 쌍도 출력 파일은 쓰므로, 파일 시각만으로는 최신으로 보여 다시 처리되지 않는다.
+    """
+    if supervision is None or not supervision.retry_failed:
+        return False
+    return any(
+        has_unfinished_checkpoint(path, strict, form, supervision.checkpoint_dir) for path in input_paths if path
+    )
+
+@lru_cache(maxsize=None)
+def get_standards(directory):
+    """작업자 프로세스마다 한 번만 읽는 배출기준 인덱스"""
+    return load_standards(directory)
+
+def extract_and_validate(pdf_path, selected_outlets, strict=False, standards_index=None,
+                         profiler=NULL_PROFILER, label=PLAN_KEYWORD, form=PROFILE_DEFAULT, supervision=None):
+    """스트리밍 추출한 페이지에 배출기준을 붙이고 곧바로 검증하여 (데이터, 원시데이터, 검증이슈, 추출 프로파일, page_info) 반환
+    
+    추출과 검증이 페이지 단위로 섞여 실행되므로 profiler에는 한 단계('계획서 추출·검증')로 기록한다.
+    form은 추출 프로파일 이름이며, 반환하는 추출 프로파일은 자동 감지 결과를 반영한 이름이다.
+    supervision(page_supervisor.PageSupervision)이 있으면 1단계를 페이지 감시로 모두 마친 뒤 페이지별로 검증한다.
+    """
+    data = RowStore()
+    raw_data = RowStore.raw()
+    validation_issues = []
+    page_info = []
+    
+    with profiler.stage(f"{label} 추출·검증") as details:
+        if supervision is not None:
+            parsed_pages = parse_pdf_tables_supervised(pdf_path, strict=strict, profile=form, supervision=supervision)
+            pages = (extract_page_rows(page_entry, selected_outlets) for page_entry in parsed_pages)
+        else:
+            pages = iter_extracted_pages(pdf_path, selected_outlets, strict=strict, profile=form)
+        for page_data, info, page_raw_data in pages:
+            if standards_index:
+                attach_standards(page_data, standards_index)
+            validation_issues.extend(validate_data_accuracy(page_data, row_offset=len(data)))
+            data.extend(page_data)
+            raw_data.extend(page_raw_data)
+            page_info.append(info)
+        if page_info:
+            form = page_info[0].get('프로파일', form)
+        details.update(페이지수=len(page_info), 행수=len(data), 프로파일=form)
+    profiler.add_pages(label, page_info)
+    
+    return data, raw_data, validation_issues, form, page_info
+
+def process_pair(key, plan_path, review_path, output_path, selected_outlets, strict=False,
+                 standards_dir=DEFAULT_STANDARDS_DIR, profile=None, form=PROFILE_DEFAULT, excel=True, export_format=None,
+                 supervision=None):
+    """워커 프로세스: 한 쌍을 추출·검증하여 정리양식 파일을 작성하고 요약을 반환
+    
+    profile이 'time'이면 단계별 시간을, 'memory'이면 최대 메모리까지 기록한 처리 프로파일을 함께 저장한다.
+    form은 추출 프로파일(문서 형태) 이름이다. export_format(parquet/csv/jsonl)을 주면 '시설명_데이터/'에
+    표별 파일을 쓰고, excel이 False이면 정리양식 파일은 만들지 않는다.
+    supervision이 있으면 페이지 감시로 추출하며, 건너뜀·실패 페이지가 있으면 상태를 '일부완료'로 남긴다.
+    """
+    started = time.perf_counter()
+    summary = {
+        '시설': key,
+        '계획서': os.path.basename(plan_path),
+        '검토서': os.path.basename(review_path) if review_path else '',
+        '계획서건수': 0,
+        '검토서건수': 0,
+        '원시데이터수': 0,
+        '검증이슈': 0,
+        '비교차이': 0,
+        '미매칭': 0,
+        '기준초과': 0,
+        '추출프로파일': '',
+        '미완료페이지': 0,
+        '상태': '완료',
+        '오류': '',
+        '출력파일': output_names(output_path, excel, export_format),
+        '처리시간(초)': 0.0
+    }
+    
+    profiler = NULL_PROFILER
+    if profile:
+        profiler = StageProfiler(
+            track_memory=profile == PROFILE_MEMORY, 시설=key, 계획서=summary['계획서'], 검토서=summary['검토서'],
+            배출구타입=list(selected_outlets), 엄격모드=strict, 추출프로파일=form
+        )
+    
+    try:
+        standards_index = get_standards(standards_dir) if standards_dir else None
+        plan_data, plan_raw_data, plan_validation, plan_form, plan_page_info = extract_and_validate(
+            plan_path, selected_outlets, strict, standards_index, profiler, PLAN_KEYWORD, form, supervision
+        )
+        forms = [plan_form]
+        
+        review_data = RowStore()
+        review_raw_data = RowStore.raw()
+        review_validation = []
+        review_page_info = []
+        if review_path:
+            review_data, review_raw_data, review_validation, review_form, review_page_info = extract_and_validate(
+                review_path, selected_outlets, strict, standards_index, profiler, REVIEW_KEYWORD, form, supervision
+            )
+            forms.append(review_form)
+        
+        validation_issues = plan_validation + review_validation
+        
+        comparison_results, unmatched_items = [], []
+        if review_path:
+            with profiler.stage("비교"):
+                comparison_results, unmatched_items = compare_plan_review(plan_data, review_data)
+        
+        if excel:
+            with profiler.stage("엑셀 생성"):
+                excel_file = create_standardized_excel(
+                    plan_data, review_data, validation_issues,
+                    comparison_results, unmatched_items, plan_raw_data + review_raw_data
+                )
+            
+            # 중단 시 불완전한 파일이 최신으로 보이지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = f"{output_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(excel_file.getvalue())
+            os.replace(tmp_path, output_path)
+        
+        if export_format:
+            with profiler.stage("대량 내보내기", 형식=export_format):
+                tables = build_export_tables({
+                    PLAN_KEYWORD: (plan_data, plan_raw_data, plan_page_info),
+                    REVIEW_KEYWORD: (review_data, review_raw_data, review_page_info),
+                }, validation_issues)
+                write_directory(tables, export_dir_for(output_path), export_format)
+        
+        if profile:
+            with open(profile_path_for(output_path), 'w', encoding='utf-8') as f:
+                f.write(profiler.to_json())
+        
+        summary.update({
+            '계획서건수': len(plan_data),
+            '검토서건수': len(review_data),
+            '원시데이터수': len(plan_raw_data) + len(review_raw_data),
+            '검증이슈': len(validation_issues),
+            '비교차이': len(comparison_results),
+            '미매칭': len(unmatched_items),
+            '기준초과': sum(
+                judgement == JUDGEMENT_EXCEEDED
+                for data in (plan_data, review_data)
+                for (judgement,) in data.iter_values([JUDGEMENT_COLUMN])
+            ),
+            '추출프로파일': '/'.join(dict.fromkeys(forms)),
+            '미완료페이지': len(unfinished_pages(plan_page_info + review_page_info)),
+        })
+        if summary['미완료페이지']:
+            summary['상태'] = '일부완료'
+    except Exception as e:
+        summary['상태'] = '실패'
+        summary['오류'] = f"{type(e).__name__}: {e}"
+        summary['출력파일'] = ''
+        traceback.print_exc(file=sys.stderr)
+    
+    summary['처리시간(초)'] = round(time.perf_counter() - started, 2)
+    return summary
+
+def run_batch(inputs, output_dir, selected_outlets, jobs=1, force=False, strict=False, log=print,
+              standards_dir=DEFAULT_STANDARDS_DIR, profile=None, form=PROFILE_DEFAULT, excel=True, export_format=None,
+              supervision=None):
+    """입력 PDF를 짝지어 병렬 처리하고 (요약 목록, 요약 파일 경로)를 반환
+    
+    출력 파일이 입력보다 최신인 쌍은 건너뛴다. 단, supervision.retry_failed이면 체크포인트에 건너뜀·실패
+    페이지가 남은 쌍(일부완료)은 다시 처리한다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    pairs, warnings = pair_documents(collect_pdf_files(inputs))
+    for warning in warnings:
+        log(f"⚠️ {warning}")
+    
+    summaries = []
+    pending = []
+    for key, plan_path, review_path in pairs:
+        output_path = output_path_for(key, output_dir)
+        if (
+            not force
+            and is_up_to_date(output_targets(output_path, excel, export_format), [plan_path, review_path])
+            and not has_pages_to_retry([plan_path, review_path], strict, form, supervision)
+        ):
+            log(f"⏭️ {key}: 출력 파일이 최신이므로 건너뜀")
+            summaries.append({
+                '시설': key,
+                '계획서': os.path.basename(plan_path),
+                '검토서': os.path.basename(review_path) if review_path else '',
+                '상태': '건너뜀(최신)',
+                '출력파일': output_names(output_path, excel, export_format)
+            })
+        else:
+            pending.append((key, plan_path, review_path, output_path))
+    
+    log(f"📦 처리 대상 {len(pending)}쌍 / 전체 {len(pairs)}쌍 (작업자 {jobs}개)")
+    
+    if jobs <= 1:
+        for done, args in enumerate(pending, 1):
+            summary = process_pair(
+                *args, selected_outlets, strict, standards_dir, profile, form, excel, export_format, supervision
+            )
+            summaries.append(summary)
+            log(f"[{done}/{len(pending)}] {summary['시설']}: {summary['상태']} {summary['오류']}".rstrip())
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    process_pair, *args, selected_outlets, strict, standards_dir, profile, form, excel, export_format,
+                    supervision
+                )
+                for args in pending
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                summary = future.result()
+                summaries.append(summary)
+                log(f"[{done}/{len(pending)}] {summary['시설']}: {summary['상태']} {summary['오류']}".rstrip())
+    
+    summaries.sort(key=lambda summary: summary['시설'])
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    summary_path = os.path.join(output_dir, SUMMARY_FILENAME.format(timestamp=timestamp))
+    pd.DataFrame(summaries).to_excel(summary_path, sheet_name='배치요약', index=False)
+    
+    return summaries, summary_path
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="계획서/검토서 PDF를 일괄 처리하여 정리양식.xlsx를 생성합니다."
+    )
+    parser.add_argument('inputs', nargs='+', help="PDF가 들어 있는 디렉터리 또는 glob 패턴")
+    parser.add_argument('-o', '--output-dir', default='정리양식_출력', help="결과 파일을 저장할 디렉터리")
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_WORKERS, help="동시에 처리할 쌍의 수 (기본: CPU 수)")
+    parser.add_argument('--outlets', nargs='+', default=['#A', '#B', '#C'], help="추출할 배출구 타입 (기본: #A #B #C)")
+    parser.add_argument('--force', action='store_true', help="출력 파일이 최신이어도 다시 처리")
+    parser.add_argument('--strict', action='store_true', help="페이지 사전 필터를 끄고 모든 페이지를 검사 (감사용)")
+    parser.add_argument('--standards', default=DEFAULT_STANDARDS_DIR,
+                        help="별표8/별표15 기준표(CSV/엑셀) 디렉터리 (없으면 배출기준 초과 판정 생략)")
+    parser.add_argument('--profile', nargs='?', const=PROFILE_TIME, choices=[PROFILE_TIME, PROFILE_MEMORY],
+                        help="쌍마다 단계별·페이지별 처리 시간 프로파일(JSON) 저장 ('memory'는 최대 메모리도 기록, 느려짐)")
+    parser.add_argument('--form', default=PROFILE_DEFAULT, choices=PROFILE_CHOICES,
+                        help="문서 형태별 추출 프로파일 (기본: 기본 = pdfplumber 기본 설정, 자동 = 앞쪽 페이지로 감지)")
+    parser.add_argument('--export', choices=EXPORT_FORMATS,
+                        help="쌍마다 '시설명_데이터/'에 통합데이터·원시데이터·검증이슈·페이지통계를 서식 없는 파일로 저장")
+    parser.add_argument('--no-excel', action='store_true', help="서식 있는 정리양식.xlsx를 만들지 않음 (--export와 함께 사용)")
+    parser.add_argument('--page-timeout', type=float, nargs='?', const=DEFAULT_PAGE_TIMEOUT, metavar='SECONDS',
+                        help="페이지 감시: 페이지마다 제한 시간(초, 값을 생략하면 %(const)g)을 넘기면 건너뛰고, 끝난 페이지는 "
+                             "체크포인트에 저장하여 중단 후 다시 실행하면 이어서 처리")
+    parser.add_argument('--page-memory-mb', type=int, default=(DEFAULT_PAGE_MEMORY_BYTES or 0) // MB,
+                        help="페이지 감시: 추출 워커 메모리 예산 (MB, 넘기면 그 페이지를 건너뜀, 0이면 끔)")
+    parser.add_argument('--retry-failed-pages', action='store_true',
+                        help="페이지 감시: 체크포인트에 건너뜀·실패로 남은 페이지를 다시 시도 (출력 파일이 최신이어도 그 쌍은 재처리)")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.no_excel and not args.export:
+        parser.error("--no-excel은 --export와 함께 사용해야 합니다.")
+    if args.retry_failed_pages and args.page_timeout is None:
+        parser.error("--retry-failed-pages는 --page-timeout과 함께 사용해야 합니다.")
+    
+    supervision = None
+    if args.page_timeout is not None:
+        supervision = PageSupervision(
+            page_timeout=args.page_timeout, page_memory_bytes=args.page_memory_mb * MB or None,
+            retry_failed=args.retry_failed_pages
+        )
+    
+    summaries, summary_path = run_batch(
+        args.inputs, args.output_dir, args.outlets,
+        jobs=max(1, args.jobs), force=args.force, strict=args.strict,
+        standards_dir=args.standards, profile=args.profile, form=args.form,
+        excel=not args.no_excel, export_format=args.export, supervision=supervision
+    )
+    
+    failed = [summary for summary in summaries if summary['상태'] == '실패']
+    print(f"✅ 완료 {len(summaries) - len(failed)}쌍, 실패 {len(failed)}쌍 → 요약: {summary_path}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
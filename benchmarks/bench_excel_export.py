@@ -0,0 +1,209 @@
+"""엑셀 내보내기 벤치마크: 스트리밍 엔진 vs 기존(일반 Workbook) 작성기
+
+사용 예:
+    python benchmarks/bench_excel_export.py --rows 10000 50000
+
+합성 행 데이터로 두 작성기의 소요 시간, 최대 추적 메모리(tracemalloc), 파일 크기를 비교한다.
+기존 작성기는 스트리밍 엔진 도입 전 create_standardized_excel을 그대로 옮겨 둔 것이다.
+(기존 작성기는 검토서 행을 빈 행으로, 검증/비교/요약 시트를 쓰지 않으므로 작업량이 더 적다.)
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+import openpyxl
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from excel_export import create_standardized_excel
+
+SUBSTANCES = ['먼지', '황산화물', '질소산화물', '일산화탄소', '염화수소', '벤젠']
+TABLE_TYPES = ['emission_standards', 'emission_data', 'general']
+
+def make_rows(count, seed=0):
+    """통합데이터/원시데이터용 합성 행 생성"""
+    rnd = random.Random(seed)
+    headers = ['배출구', '물질명', '농도', '배출량', '단위', '비고']
+    rows = []
+    for i in range(count):
+        outlet = f"#{rnd.choice('ABC')}{i % 50 + 1}"
+        row = [outlet, rnd.choice(SUBSTANCES), f"{rnd.uniform(1, 500):,.2f}", f"{rnd.uniform(100, 5000):,.1f}", 'mg/Sm3', '']
+        rows.append({
+            '페이지': i // 20 + 1,
+            '테이블': 1,
+            '테이블타입': rnd.choice(TABLE_TYPES),
+            '배출구타입': outlet[:2],
+            '배출구번호': outlet,
+            '원본배출구': outlet,
+            '물질명': row[1],
+            '농도': row[2],
+            '배출량': row[3],
+            '최대배출기준': str(rnd.randint(10, 300)),
+            '허가배출기준': str(rnd.randint(5, 200)),
+            '최대배출기준근거': '별표8.xlsx',
+            '허가배출기준근거': '별표15.xlsx',
+            '비고': '',
+            '단위': 'mg/Sm3',
+            '원본행': row,
+            '헤더': headers
+        })
+    return rows
+
+def legacy_create_standardized_excel(plan_data, review_data, validation_issues, comparison_results, unmatched_items, raw_data=None):
+    """표준화된 엑셀 파일 생성 (개선됨)"""
+    
+    # 새 워크북 생성
+    wb = openpyxl.Workbook()
+    
+    # 기본 시트 제거
+    wb.remove(wb.active)
+    
+    # 스타일 정의
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # 1. 통합 데이터 시트
+    ws_integrated = wb.create_sheet("통합데이터")
+    
+    # 헤더 설정 (확장됨)
+    headers = [
+        '구분', '페이지', '테이블', '테이블타입', '배출구번호', '원본배출구', '물질명', 
+        '농도', '배출량', '단위', '최대배출기준', '허가배출기준', 
+        '최대배출기준근거', '허가배출기준근거', '비고'
+    ]
+    
+    for col, header in enumerate(headers, 1):
+        cell = ws_integrated.cell(row=1, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+        cell.alignment = Alignment(horizontal='center')
+    
+    # 계획서 데이터 추가
+    row = 2
+    for data_row in plan_data:
+        ws_integrated.cell(row=row, column=1, value="계획서")
+        ws_integrated.cell(row=row, column=2, value=data_row.get('페이지', ''))
+        ws_integrated.cell(row=row, column=3, value=data_row.get('테이블', ''))
+        ws_integrated.cell(row=row, column=4, value=data_row.get('테이블타입', ''))
+        ws_integrated.cell(row=row, column=5, value=data_row.get('배출구번호', ''))
+        ws_integrated.cell(row=row, column=6, value=data_row.get('원본배출구', ''))
+        ws_integrated.cell(row=row, column=7, value=data_row.get('물질명', ''))
+        ws_integrated.cell(row=row, column=8, value=data_row.get('농도', ''))
+        ws_integrated.cell(row=row, column=9, value=data_row.get('배출량', ''))
+        ws_integrated.cell(row=row, column=10, value=data_row.get('단위', ''))
+        ws_integrated.cell(row=row, column=11, value=data_row.get('최대배출기준', ''))
+        ws_integrated.cell(row=row, column=12, value=data_row.get('허가배출기준', ''))
+        ws_integrated.cell(row=row, column=13, value=data_row.get('최대배출기준근거', ''))
+        ws_integrated.cell(row=row, column=14, value=data_row.get('허가배출기준근거', ''))
+        ws_integrated.cell(row=row, column=15, value=data_row.get('비고', ''))
+        
+        # 테이블 타입별 색상 적용
+        table_type = data_row.get('테이블타입', '')
+        if table_type == 'emission_standards':
+            type_color = PatternFill(start_color="E8F5E8", end_color="E8F5E8", fill_type="solid")
+        elif table_type == 'emission_data':
+            type_color = PatternFill(start_color="E8F0FF", end_color="E8F0FF", fill_type="solid")
+        else:
+            type_color = PatternFill(start_color="FFF8E1", end_color="FFF8E1", fill_type="solid")
+        
+        # 테두리 및 색상 적용
+        for col in range(1, 16):
+            cell = ws_integrated.cell(row=row, column=col)
+            cell.border = border
+            if col == 4:  # 테이블타입 컬럼
+                cell.fill = type_color
+        
+        row += 1
+    
+    # 검토서 데이터 추가 (동일한 방식)
+    for data_row in review_data:
+        ws_integrated.cell(row=row, column=1, value="검토서")
+        # ... (계획서와 동일한 로직)
+        row += 1
+    
+    # 열 너비 조정
+    column_widths = [8, 6, 6, 12, 12, 15, 20, 10, 10, 8, 15, 15, 20, 20, 25]
+    for col, width in enumerate(column_widths, 1):
+        ws_integrated.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+    
+    # 2. 원시 데이터 시트 (새로 추가)
+    if raw_data:
+        ws_raw = wb.create_sheet("원시데이터")
+        
+        raw_headers = ['페이지', '테이블', '테이블타입', '원본행데이터', '헤더정보']
+        for col, header in enumerate(raw_headers, 1):
+            cell = ws_raw.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = PatternFill(start_color="FF9800", end_color="FF9800", fill_type="solid")
+            cell.border = border
+            cell.alignment = Alignment(horizontal='center')
+        
+        for row_idx, raw_row in enumerate(raw_data, 2):
+            ws_raw.cell(row=row_idx, column=1, value=raw_row.get('페이지', ''))
+            ws_raw.cell(row=row_idx, column=2, value=raw_row.get('테이블', ''))
+            ws_raw.cell(row=row_idx, column=3, value=raw_row.get('테이블타입', ''))
+            ws_raw.cell(row=row_idx, column=4, value=str(raw_row.get('원본행', '')))
+            ws_raw.cell(row=row_idx, column=5, value=str(raw_row.get('헤더', '')))
+            
+            for col in range(1, 6):
+                ws_raw.cell(row=row_idx, column=col).border = border
+    
+    # 기존 시트들 (데이터검증, 비교결과 등) 추가
+    # ... (기존 코드와 동일)
+    
+    # 메모리에서 파일 생성
+    output = BytesIO()
+    wb.save(output)
+    output.seek(0)
+    
+    return output
+
+def measure(label, func, *args):
+    """함수 실행 시간, 최대 추적 메모리, 결과 크기 측정 (tracemalloc 부하가 시간에 섞이지 않도록 따로 실행)"""
+    started = time.perf_counter()
+    output = func(*args)
+    elapsed = time.perf_counter() - started
+    
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    size = len(output.getvalue())
+    print(f"  {label:<10} {elapsed:8.2f}s  최대 메모리 {peak / 1e6:8.1f}MB  파일 {size / 1e6:6.2f}MB")
+    return elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="엑셀 내보내기 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 30000], help="계획서 행 수 (여러 개 지정 가능)")
+    args = parser.parse_args(argv)
+    
+    for count in args.rows:
+        plan_data = make_rows(count, seed=1)
+        review_data = make_rows(count // 2, seed=2)
+        raw_data = plan_data + review_data
+        validation_issues = [
+            {'행번호': i + 1, '배출구': row['원본배출구'], '물질명': row['물질명'], '페이지': row['페이지'],
+             '테이블타입': row['테이블타입'], '문제점': '최대배출기준 근거 누락'}
+            for i, row in enumerate(plan_data[::10])
+        ]
+        
+        print(f"계획서 {count:,}행 + 검토서 {len(review_data):,}행 + 원시데이터 {len(raw_data):,}행")
+        legacy = measure("기존", legacy_create_standardized_excel, plan_data, review_data, validation_issues, [], [], raw_data)
+        streaming = measure("스트리밍", create_standardized_excel, plan_data, review_data, validation_issues, [], [], raw_data)
+        print(f"  → {legacy / streaming:.1f}배 빠름")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""전체 처리 단계 벤치마크: 합성 PDF 코퍼스로 추출 → 검증 → 엑셀 생성 측정
+
+사용 예:
+    python benchmarks/bench_pipeline.py                       # small, medium을 기준값과 비교
+    python benchmarks/bench_pipeline.py --sizes small medium huge
+    python benchmarks/bench_pipeline.py --save-baseline       # 현재 결과를 기준값으로 저장
+
+문서 크기별 합성 PDF(synthetic_pdf.py)를 benchmarks/corpus/에 한 번 만들어 두고 재사용한다.
+문서마다 새 프로세스에서 extract_table_from_pdf, validate_data_accuracy, create_standardized_excel을
+차례로 실행하여 단계별 시간, 처리량(페이지/초, 행/초), 그 단계까지의 최대 RSS를 보고한다.
+benchmarks/baselines.json에는 단계마다 네 지표를 모두 저장하며, 시간·최대 RSS가 허용 비율(--tolerance)보다
+늘거나 처리량이 그만큼 줄어든 단계가 있으면 종료 코드 1 (시간만 있는 이전 형식의 기준값은 시간만 비교).
+기준값은 측정한 기계에 따라 달라지므로 비교는 같은 기계에서 저장한 기준값으로 한다.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from profiling import STAGE_KEY, TIME_KEY, StageProfiler
+from synthetic_pdf import write_synthetic_pdf
+
+CORPUS_DIR = os.path.join(BENCH_DIR, 'corpus')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baselines.json')
+
+# 문서 크기: (페이지 수, 테이블당 행 수)
+SIZES = {
+    'small': (10, 20),
+    'medium': (100, 30),
+    'huge': (1000, 40),
+}
+DEFAULT_SIZES = ['small', 'medium']
+DEFAULT_TOLERANCE = 0.25
+MIN_COMPARE_SECONDS = 0.05  # 이보다 짧은 단계는 측정 잡음이 커서 회귀 판정에서 제외
+SEED = 0
+
+RSS_KEY = '최대RSS(MB)'
+PAGES_PER_SECOND_KEY = '페이지/초'
+ROWS_PER_SECOND_KEY = '행/초'
+
+# 기준값과 비교하는 지표: (키, 출력 이름, 클수록 나쁜지, 측정 잡음이 큰 짧은 단계는 제외하는지)
+BASELINE_METRICS = [
+    (TIME_KEY, '시간', True, True),
+    (PAGES_PER_SECOND_KEY, '쪽/s', False, True),
+    (ROWS_PER_SECOND_KEY, '행/s', False, True),
+    (RSS_KEY, 'RSS', True, False),
+]
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / 1e6 if sys.platform == 'darwin' else peak * 1024 / 1e6, 1)
+
+def corpus_pdf(name):
+    """크기 이름에 해당하는 합성 PDF 경로 (없으면 생성)"""
+    pages, rows = SIZES[name]
+    path = os.path.join(CORPUS_DIR, f"synthetic_{pages}p_{rows}r_s{SEED}.pdf")
+    if not os.path.exists(path):
+        os.makedirs(CORPUS_DIR, exist_ok=True)
+        print(f"  코퍼스 생성: {os.path.relpath(path)}")
+        write_synthetic_pdf(path, pages, rows, SEED)
+    return path
+
+def run_document(pdf_path, workers=1):
+    """새 프로세스에서 실행: 단계별 측정 기록 목록 반환 (최대 RSS가 문서별로 분리되도록)"""
+    from excel_export import create_standardized_excel
+    from pdf_extractor import extract_table_from_pdf
+    from validation import validate_data_accuracy
+    
+    profiler = StageProfiler()
+    
+    with profiler.stage('추출') as details:
+        data, page_info, raw_data = extract_table_from_pdf(pdf_path, workers=workers)
+        details.update(페이지수=len(page_info), 행수=len(data), **{RSS_KEY: peak_rss_mb()})
+    
+    with profiler.stage('검증', 페이지수=len(page_info), 행수=len(data)) as details:
+        validation_issues = validate_data_accuracy(data)
+        details[RSS_KEY] = peak_rss_mb()
+    
+    with profiler.stage('엑셀 생성', 페이지수=len(page_info), 행수=len(data)) as details:
+        create_standardized_excel(data, [], validation_issues, [], [], raw_data)
+        details[RSS_KEY] = peak_rss_mb()
+    
+    for record in profiler.stages:
+        seconds = max(record[TIME_KEY], 1e-9)
+        record[PAGES_PER_SECOND_KEY] = round(record['페이지수'] / seconds, 1)
+        record[ROWS_PER_SECOND_KEY] = round(record['행수'] / seconds, 1)
+    return profiler.stages
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baselines(baselines, results):
+    """결과를 크기별로 기준값 파일에 병합 저장"""
+    baselines.setdefault('문서', {})
+    for name, stages in results.items():
+        baselines['문서'][name] = {
+            record[STAGE_KEY]: {key: record.get(key) for key, _, _, _ in BASELINE_METRICS} for record in stages
+        }
+    baselines['환경'] = environment()
+    write_baselines(baselines)
+
+def write_baselines(baselines):
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, ensure_ascii=False, indent=1)
+        f.write('\n')
+
+def compare_stage(record, previous, tolerance):
+    """단계 측정값을 기준값과 비교하여 (지표별 비교 문구 목록, 회귀한 지표 이름 목록) 반환
+    
+    previous는 {지표: 값} 또는 이전 형식의 시간(초) 숫자이다.
+    """
+    if not isinstance(previous, dict):
+        previous = {TIME_KEY: previous}
+    noisy = max(previous.get(TIME_KEY) or 0, record[TIME_KEY]) < MIN_COMPARE_SECONDS
+    
+    notes, regressed = [], []
+    for key, label, higher_is_worse, skip_noisy in BASELINE_METRICS:
+        before, now = previous.get(key), record.get(key)
+        if not before or now is None or (skip_noisy and noisy):
+            continue
+        ratio = now / before
+        worse = ratio > 1 + tolerance if higher_is_worse else ratio < 1 / (1 + tolerance)
+        notes.append(f"{label} {ratio:.2f}배{' ⚠️' if worse else ''}")
+        if worse:
+            regressed.append(label)
+    return notes, regressed
+
+def environment():
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'cpu': os.cpu_count()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 처리 단계 벤치마크 (합성 PDF 코퍼스)")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=DEFAULT_SIZES, help="측정할 문서 크기")
+    parser.add_argument('--workers', type=int, default=1, help="추출 워커 수 (기본: 1, 순차)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="기준값 대비 허용 비율: 시간·RSS 증가, 처리량 감소 (기본: 0.25 = 25%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="현재 결과를 기준값으로 저장")
+    args = parser.parse_args(argv)
+    
+    baselines = load_baselines()
+    if baselines.get('환경') and baselines['환경'].get('platform') != platform.platform():
+        print(f"⚠️ 기준값은 다른 환경에서 측정됨: {baselines['환경']}")
+    
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    regressions = []
+    for name in args.sizes:
+        pages, rows = SIZES[name]
+        print(f"[{name}] {pages}쪽, 테이블당 {rows}행")
+        pdf_path = corpus_pdf(name)
+        with context.Pool(1) as pool:
+            stages = pool.apply(run_document, (pdf_path, args.workers))
+        results[name] = stages
+        
+        baseline = baselines.get('문서', {}).get(name, {})
+        for record in stages:
+            line = (f"  {record[STAGE_KEY]:<6} {record[TIME_KEY]:8.2f}s  {record[PAGES_PER_SECOND_KEY]:9.1f}쪽/s  "
+                    f"{record[ROWS_PER_SECOND_KEY]:11.1f}행/s  RSS {record[RSS_KEY] or '-'}MB")
+            previous = baseline.get(record[STAGE_KEY])
+            if previous:
+                notes, regressed = compare_stage(record, previous, args.tolerance)
+                if notes:
+                    line += f"  기준 대비 {', '.join(notes)}"
+                if regressed:
+                    line += " 회귀"
+                    regressions.append(f"{name}/{record[STAGE_KEY]}({', '.join(regressed)})")
+            print(line)
+    
+    if args.save_baseline:
+        save_baselines(baselines, results)
+        print(f"기준값 저장: {os.path.relpath(BASELINE_PATH)}")
+        return 0
+    
+    if regressions:
+        print(f"❌ 기준값보다 나빠진 단계: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""추출 프로파일 검증·벤치마크: 프로파일마다 기본 설정과 같은 행이 나오는지와 추출 시간 비교
+
+사용 예:
+    python benchmarks/bench_profiles.py                      # 합성 코퍼스 small, medium
+    python benchmarks/bench_profiles.py 계획서.pdf 검토서.pdf  # 실제 문서 추가
+
+각 PDF를 프로파일(기본, A, B, C, 자동)별로 extract_table_from_pdf로 추출하여 추출 행·원시 행이
+기본 프로파일과 같은지 확인하고 추출 시간을 보고한다. 행이 다른 프로파일이 있으면 종료 코드 1.
+extraction_profiles.py의 table_settings를 바꿀 때 이 검사를 통과하는지 확인한다.
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from bench_pipeline import DEFAULT_SIZES, SIZES, corpus_pdf
+from extraction_profiles import PROFILE_CHOICES, PROFILE_DEFAULT
+from pdf_extractor import extract_table_from_pdf
+
+def extract_rows(pdf_path, profile):
+    """(추출 행, 원시 행, 쓰인 프로파일, 시간) 반환"""
+    started = time.perf_counter()
+    data, page_info, raw_data = extract_table_from_pdf(pdf_path, ['#A', '#B', '#C', '#D', '#E'], profile=profile)
+    elapsed = time.perf_counter() - started
+    used = page_info[0].get('프로파일', profile) if page_info else profile
+    return list(data), list(raw_data), used, elapsed
+
+def check_document(pdf_path, profiles):
+    """문서 하나를 프로파일별로 추출하여 기본 프로파일과 비교, 다른 프로파일 이름 목록 반환"""
+    baseline_rows, baseline_raw, _, baseline_time = extract_rows(pdf_path, PROFILE_DEFAULT)
+    print(f"  {PROFILE_DEFAULT:<4} {baseline_time:8.2f}s  {len(baseline_rows)}행")
+    
+    mismatches = []
+    for profile in profiles:
+        if profile == PROFILE_DEFAULT:
+            continue
+        rows, raw_rows, used, elapsed = extract_rows(pdf_path, profile)
+        same = rows == baseline_rows and raw_rows == baseline_raw
+        label = f"{profile}→{used}" if used != profile else profile
+        print(f"  {label:<4} {elapsed:8.2f}s  {len(rows)}행  기본 대비 {elapsed / baseline_time:.2f}배  "
+              f"{'같은 행' if same else '❌ 행 다름'}")
+        if not same:
+            mismatches.append(profile)
+    return mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="추출 프로파일 검증·벤치마크")
+    parser.add_argument('pdfs', nargs='*', help="추가로 검사할 PDF")
+    parser.add_argument('--sizes', nargs='*', choices=list(SIZES), default=DEFAULT_SIZES, help="합성 코퍼스 크기")
+    parser.add_argument('--profiles', nargs='+', choices=PROFILE_CHOICES, default=list(PROFILE_CHOICES),
+                        help="검사할 프로파일")
+    args = parser.parse_args(argv)
+    
+    documents = [corpus_pdf(name) for name in args.sizes] + args.pdfs
+    failures = []
+    for pdf_path in documents:
+        print(f"[{os.path.basename(pdf_path)}]")
+        failures += [f"{os.path.basename(pdf_path)}/{profile}" for profile in check_document(pdf_path, args.profiles)]
+    
+    if failures:
+        print(f"❌ 기본 설정과 행이 다른 프로파일: {', '.join(failures)}")
+        return 1
+    print("✅ 모든 프로파일이 기본 설정과 같은 행을 추출")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
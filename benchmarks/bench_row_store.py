@@ -0,0 +1,92 @@
+"""행 저장소 벤치마크: RowStore vs 행 딕셔너리 목록
+
+사용 예:
+    python benchmarks/bench_row_store.py --rows 50000 200000
+
+합성 배출기준 테이블을 parse_table로 처리한 결과를 RowStore 그대로 둘 때와
+기존처럼 행 딕셔너리 목록으로 둘 때의 보유 메모리(tracemalloc)와 DataFrame 변환 시간을 비교한다.
+파싱한 테이블(셀) 자체의 메모리는 두 경우 모두 공유하므로 측정에서 제외한다.
+RowStore 쪽에는 수집 시 파싱한 수치·단위·상태 컬럼이 포함된다.
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from pdf_extractor import parse_table
+
+HEADER = ['배출구', '물질명', '농도', '배출량', '단위', '최대배출기준', '허가배출기준', '최대배출기준 근거', '허가배출기준 근거', '비고']
+SUBSTANCES = ['먼지', '황산화물', '질소산화물', '일산화탄소', '염화수소', '벤젠']
+ROWS_PER_TABLE = 40
+
+def make_tables(count, seed=0):
+    """한 테이블에 ROWS_PER_TABLE행씩 담은 합성 배출기준 테이블 목록"""
+    rnd = random.Random(seed)
+    tables = []
+    for start in range(0, count, ROWS_PER_TABLE):
+        table = [list(HEADER)]
+        for i in range(start, min(start + ROWS_PER_TABLE, count)):
+            table.append([
+                f"#{rnd.choice('ABC')}{i % 50 + 1}", rnd.choice(SUBSTANCES),
+                f"{rnd.uniform(1, 500):.2f}", f"{rnd.uniform(100, 5000):,.1f}", 'mg/Sm3',
+                str(rnd.randint(10, 300)), str(rnd.randint(5, 200)),
+                '대기환경보전법 시행규칙 별표8', '별표15', ''
+            ])
+        tables.append(table)
+    return tables
+
+def retained(build):
+    """build()가 만든 객체가 계속 보유하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="행 저장소 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[50000], help="행 수 (여러 개 지정 가능)")
+    args = parser.parse_args(argv)
+    
+    for count in args.rows:
+        tables = make_tables(count)
+        
+        def build_store():
+            store = None
+            for table_idx, table in enumerate(tables):
+                rows, _ = parse_table(table, 'emission_standards', table_idx // 5 + 1, table_idx % 5, ['#A', '#B', '#C'])
+                if store is None:
+                    store = rows
+                else:
+                    store.extend(rows)
+            return store
+        
+        build_store()  # 헤더 매핑·수치 파싱 캐시를 먼저 채워 캐시 메모리가 측정에 섞이지 않도록
+        store, store_bytes = retained(build_store)
+        dict_rows, dict_bytes = retained(lambda: list(store))
+        
+        _, store_frame_time = timed(store.to_dataframe)
+        _, dict_frame_time = timed(lambda: pd.DataFrame(dict_rows))
+        
+        print(f"{len(store):,}행")
+        print(f"  행 딕셔너리  보유 메모리 {dict_bytes / 1e6:8.1f}MB  DataFrame 변환 {dict_frame_time:6.2f}s")
+        print(f"  RowStore    보유 메모리 {store_bytes / 1e6:8.1f}MB  DataFrame 변환 {store_frame_time:6.2f}s")
+        print(f"  → 메모리 {dict_bytes / store_bytes:.1f}배 절감")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""데이터 검증 벤치마크: 컬럼 단위 검증 엔진 vs 기존 행 반복 검증
+
+사용 예:
+    python benchmarks/bench_validation.py --rows 100000
+
+계획서+검토서를 합친 합성 행 데이터(일부 행은 형식 오류 포함)로 두 구현의 소요 시간을 비교하고,
+이슈 보고 결과가 같은지 확인한다. 기존 구현은 컬럼 단위 엔진 도입 전 validate_data_accuracy를
+그대로 옮겨 둔 것이다. 컬럼 단위 엔진은 추출 결과와 같이 RowStore에 담긴 데이터를 검증하며,
+수치 필드 파싱은 수집 단계에서 한 번 하므로 따로 측정한다.
+수치 파싱 도입으로 '10이하', 'N.D' 등은 더 이상 형식 오류가 아니므로, 섞어 넣는 오류 값은
+두 구현이 똑같이 오류로 보는 값만 사용한다.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from bench_excel_export import make_rows
+from row_store import RowStore
+from validation import validate_data_accuracy
+
+# 형식 오류를 섞어 넣을 값
+NOISY_VALUES = {
+    '배출구번호': ['', 'a1', '#1A', '배출구'],
+    '농도': ['약 5', '측정예정'],
+    '배출량': ['미측정', '1,2OO'],
+    '최대배출기준근거': [''],
+}
+
+def legacy_validate_data_accuracy(data, row_offset=0):
+    """데이터 정확성 검증 및 불확실한 데이터 기록 (개선됨)"""
+    validation_issues = []
+    
+    for idx, row in enumerate(data):
+        issues = []
+        
+        # 필수 필드 체크
+        required_fields = ['배출구번호', '물질명']
+        for field in required_fields:
+            if not row.get(field) or str(row[field]).strip() == '':
+                issues.append(f"필수 필드 누락: {field}")
+        
+        # 배출구 번호 형식 체크
+        outlet_num = row.get('배출구번호', '')
+        if outlet_num and not re.match(r'^#?[A-Z]+\d*$', outlet_num):
+            issues.append(f"배출구번호 형식 오류: {outlet_num}")
+        
+        # 숫자 필드 검증
+        numeric_fields = ['농도', '배출량', '최대배출기준', '허가배출기준']
+        for field in numeric_fields:
+            value = row.get(field, '')
+            if value and value != '-':
+                # 숫자, 쉼표, 점, 하이픈, 슬래시, 공백만 허용
+                clean_value = str(value).replace(',', '').replace(' ', '').replace('/', '').replace('-', '')
+                if clean_value and not re.match(r'^[\d.]+$', clean_value):
+                    issues.append(f"숫자 형식 오류: {field} = {value}")
+        
+        # 배출기준과 근거 일치성 체크
+        if row.get('최대배출기준') and not row.get('최대배출기준근거'):
+            issues.append("최대배출기준 근거 누락")
+        
+        # 테이블 타입별 추가 검증
+        table_type = row.get('테이블타입', '')
+        if table_type == 'emission_standards':
+            if not (row.get('최대배출기준') or row.get('허가배출기준')):
+                issues.append("배출기준 테이블에 기준값 없음")
+        
+        if issues:
+            validation_issues.append({
+                '행번호': row_offset + idx + 1,
+                '배출구': row.get('원본배출구', ''),
+                '물질명': row.get('물질명', ''),
+                '페이지': row.get('페이지', ''),
+                '테이블타입': table_type,
+                '문제점': ', '.join(issues)
+            })
+    
+    return validation_issues
+
+def make_noisy_rows(count, error_rate=0.05, seed=0):
+    """합성 행에 일정 비율로 형식 오류 값을 섞어 반환"""
+    rows = make_rows(count, seed=seed)
+    rnd = random.Random(seed)
+    for row in rows:
+        if rnd.random() < error_rate:
+            field = rnd.choice(list(NOISY_VALUES))
+            row[field] = rnd.choice(NOISY_VALUES[field])
+    return rows
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="데이터 검증 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000], help="계획서+검토서 합계 행 수 (여러 개 지정 가능)")
+    args = parser.parse_args(argv)
+    
+    mismatched = False
+    for count in args.rows:
+        data = make_noisy_rows(count // 2, seed=1) + make_noisy_rows(count - count // 2, seed=2)
+        
+        store = RowStore()
+        store.extend(data)
+        _, ingest = timed(store.parse_numeric)
+        
+        legacy_issues, legacy = timed(legacy_validate_data_accuracy, data)
+        issues, columnar = timed(validate_data_accuracy, store)
+        
+        same = issues == legacy_issues
+        mismatched |= not same
+        print(f"{len(data):,}행: 이슈 {len(issues):,}건 ({'일치' if same else '불일치'})")
+        print(f"  기존     {legacy:8.3f}s")
+        print(f"  컬럼 단위 {columnar:8.3f}s  → {legacy / columnar:.1f}배 빠름 (수집 시 수치 파싱 {ingest:.3f}s 별도)")
+    
+    return 1 if mismatched else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""병렬 추출 분기점 벤치마크: 페이지 수별 순차 추출과 워커 프로세스 추출 시간 비교
+
+사용 예:
+    python benchmarks/bench_workers.py                       # 8~128쪽, 워커 = 쓸 수 있는 CPU 수 (최소 2)
+    python benchmarks/bench_workers.py --pages 16 32 64 --workers 4
+    python benchmarks/bench_workers.py --save-baseline       # 측정한 분기점을 baselines.json에 저장
+
+페이지 수별 합성 PDF(synthetic_pdf.py)를 순차(_parse_serial)와 워커 프로세스(_parse_parallel)로 1단계 파싱하여
+시간을 비교하고, 워커 쪽이 빨라지는 가장 작은 페이지 수(분기점)를 보고한다.
+측정값으로 워커 기동 비용(spawn, 모듈 import, PDF 다시 열기)과 페이지당 파싱 시간을 구해
+CPU 수별 예상 분기점도 함께 보여 준다. pdf_extractor.MIN_PARALLEL_PAGES는 이 결과로 정한다.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from bench_pipeline import CORPUS_DIR, SEED, environment, load_baselines, write_baselines
+from extraction_profiles import PROFILE_DEFAULT
+from pdf_extractor import MIN_PARALLEL_PAGES, _parse_parallel, _parse_serial
+from pdf_io import available_cpus
+from synthetic_pdf import write_synthetic_pdf
+
+DEFAULT_PAGES = [8, 16, 32, 64, 128]
+ROWS = 20
+ESTIMATE_CPUS = (2, 4, 8)
+
+def corpus_pages_pdf(pages):
+    path = os.path.join(CORPUS_DIR, f"synthetic_{pages}p_{ROWS}r_s{SEED}.pdf")
+    if not os.path.exists(path):
+        os.makedirs(CORPUS_DIR, exist_ok=True)
+        print(f"  코퍼스 생성: {os.path.relpath(path)}")
+        write_synthetic_pdf(path, pages, ROWS, SEED)
+    return path
+
+def timed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+def estimated_crossover(startup, page_seconds, workers, cpus):
+    """기동 비용을 병렬 이득이 넘는 페이지 수 (CPU가 하나면 없음)"""
+    parallel = min(workers, cpus)
+    if parallel <= 1:
+        return None
+    return math.ceil(startup / (page_seconds * (1 - 1 / parallel)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="병렬 추출 분기점 벤치마크")
+    parser.add_argument('--pages', nargs='+', type=int, default=DEFAULT_PAGES, help="측정할 페이지 수")
+    parser.add_argument('--workers', type=int, default=max(2, available_cpus()), help="워커 프로세스 수")
+    parser.add_argument('--save-baseline', action='store_true', help="측정한 분기점을 기준값 파일에 저장")
+    args = parser.parse_args(argv)
+    
+    cpus = available_cpus()
+    print(f"쓸 수 있는 CPU {cpus}개, 워커 {args.workers}개, 현재 MIN_PARALLEL_PAGES {MIN_PARALLEL_PAGES}")
+    
+    crossover = None
+    measurements = []
+    for pages in sorted(args.pages):
+        pdf_path = corpus_pages_pdf(pages)
+        serial = timed(_parse_serial, pdf_path, None, False, PROFILE_DEFAULT)
+        parallel = timed(_parse_parallel, pdf_path, pages, args.workers, None, False, PROFILE_DEFAULT)
+        # 워커 쪽 시간 = 기동 비용 + 순차 시간 / 실제 병렬도
+        startup = parallel - serial / min(args.workers, cpus)
+        measurements.append({'페이지수': pages, '순차(초)': round(serial, 3), '워커(초)': round(parallel, 3),
+                             '기동비용(초)': round(startup, 3)})
+        print(f"  {pages:5d}쪽  순차 {serial:7.2f}s  워커 {parallel:7.2f}s  ({serial / parallel:.2f}배)  "
+              f"기동 비용 {startup:5.2f}s")
+        if crossover is None and parallel < serial:
+            crossover = pages
+    
+    page_seconds = sum(m['순차(초)'] for m in measurements) / sum(m['페이지수'] for m in measurements)
+    startup = max(m['기동비용(초)'] for m in measurements)
+    print(f"측정한 분기점: {f'{crossover}쪽' if crossover else '없음 (측정 범위에서 워커가 더 느림)'}")
+    print(f"페이지당 {page_seconds:.3f}s, 워커 기동 비용 최대 {startup:.2f}s 기준 예상 분기점: " + ", ".join(
+        f"CPU {count}개 {estimated_crossover(startup, page_seconds, count, count)}쪽"
+        for count in ESTIMATE_CPUS
+    ))
+    
+    if args.save_baseline:
+        baselines = load_baselines()
+        baselines['병렬분기점'] = {
+            '환경': environment(), '워커': args.workers, '분기점(쪽)': crossover,
+            '페이지당(초)': round(page_seconds, 4), '기동비용(초)': round(startup, 3), '측정': measurements,
+        }
+        write_baselines(baselines)
+        print("분기점 저장: benchmarks/baselines.json")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""벤치마크용 합성 배출 테이블 PDF 생성기
+
+사용 예:
+    python benchmarks/synthetic_pdf.py 합성_100쪽.pdf --pages 100 --rows 30
+
+앱이 처리하는 테이블 형태를 괘선 테이블로 그린다 (pdfplumber extract_tables가 선 기준으로 인식).
+    A형태: 단일 헤더 배출 데이터 (배출구/물질명/농도/배출량/단위/비고)
+    B형태: 2행 복합 배출기준 헤더 (최대배출기준·허가배출기준 아래 기준/근거 서브헤더, 병합 셀)
+    C형태: 제목 행이 붙은 테이블이 다음 페이지로 이어짐 (이어지는 페이지는 헤더 없이 행만)
+테이블이 없는 본문 페이지도 섞어 페이지 사전 필터가 건너뛰는 경우를 포함한다.
+같은 인자와 seed면 항상 같은 PDF(바이트 단위 동일)가 만들어진다. reportlab이 필요하다 (pip install reportlab).
+"""
+import argparse
+import random
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfgen import canvas
+
+FONT_NAME = 'HYSMyeongJo-Medium'  # reportlab 내장 한글 CID 글꼴 (글꼴 파일 불필요)
+FONT_SIZE = 7
+ROW_HEIGHT = 16
+MARGIN = 40
+MAX_ROWS_PER_PAGE = int((A4[1] - 2 * MARGIN) // ROW_HEIGHT) - 4  # 제목·헤더 행 여유
+
+SUBSTANCES = ['먼지', '황산화물', '질소산화물', '일산화탄소', '염화수소', '벤젠']
+OUTLET_TYPES = 'ABCDE'  # 기본 추출 대상(#A/#B/#C) 밖의 #D/#E도 섞어 배출구 필터링을 포함
+
+# 페이지 순서 (문서 길이만큼 반복)
+PAGE_SEQUENCE = ['본문', 'A', 'B', 'C', 'C계속']
+BODY_TEXT = "대기오염물질 배출시설 설치 허가 신청에 따른 시설 개요 및 운영 계획을 기술한다. "
+
+A_HEADER = ['배출구', '물질명', '농도', '배출량', '단위', '비고']
+B_HEADERS = [
+    ['배출구', '물질명', '최대배출기준', None, '허가배출기준', None],
+    ['', '', '기준', '근거', '기준', '근거'],
+]
+B_SPANS = [(0, 2, 3), (0, 4, 5)]  # (행, 시작 열, 끝 열) 가로 병합
+C_TITLE = ['배출시설 현황', None, None, None]
+C_HEADER = ['배출구', '오염물질', '배출농도', '연간배출량']
+C_SPANS = [(0, 0, 3)]
+
+def _outlet(rnd, number):
+    return f"#{rnd.choice(OUTLET_TYPES)}{number}"
+
+def a_rows(rnd, count):
+    return [
+        [_outlet(rnd, i + 1), rnd.choice(SUBSTANCES), f"{rnd.uniform(1, 500):.2f}",
+         f"{rnd.uniform(100, 5000):,.1f}", 'mg/Sm3', rnd.choice(['-', '', '정기측정'])]
+        for i in range(count)
+    ]
+
+def b_rows(rnd, count):
+    return [
+        [_outlet(rnd, i + 1), rnd.choice(SUBSTANCES), str(rnd.randint(10, 300)), rnd.choice(['별표8', '별표 8']),
+         f"{rnd.randint(5, 200)} 이하", rnd.choice(['별표 15 제3호', '별표15'])]
+        for i in range(count)
+    ]
+
+def c_rows(rnd, count, start=0):
+    return [
+        [_outlet(rnd, start + i + 1), rnd.choice(SUBSTANCES), f"{rnd.uniform(1, 300):.1f}", f"{rnd.uniform(1, 90):.2f}"]
+        for i in range(count)
+    ]
+
+def _draw_table(pdf, top, rows, widths, spans=()):
+    """괘선 테이블을 그리고 다음 요소를 그릴 y 좌표를 반환 (spans는 가로 병합 셀)"""
+    merged = {}
+    for row_idx, first, last in spans:
+        merged[(row_idx, first)] = last
+        for col_idx in range(first + 1, last + 1):
+            merged[(row_idx, col_idx)] = None
+    
+    y = top
+    for row_idx, row in enumerate(rows):
+        y -= ROW_HEIGHT
+        x = MARGIN
+        for col_idx, width in enumerate(widths):
+            span_end = merged.get((row_idx, col_idx), col_idx)
+            if span_end is not None:
+                cell_width = sum(widths[col_idx:span_end + 1])
+                pdf.rect(x, y, cell_width, ROW_HEIGHT)
+                text = row[col_idx] if col_idx < len(row) else None
+                if text:
+                    pdf.drawString(x + 3, y + 5, str(text))
+            x += width
+    return y - ROW_HEIGHT
+
+def _draw_heading(pdf, text):
+    pdf.drawString(MARGIN, A4[1] - MARGIN, text)
+    return A4[1] - MARGIN - ROW_HEIGHT
+
+def write_synthetic_pdf(path, pages=10, rows=20, seed=0):
+    """합성 PDF를 path에 쓰고, 생성한 테이블 데이터 행 수 {형태: 행 수}를 반환
+    
+    rows는 테이블 한 개(페이지 하나)의 데이터 행 수이며 한 페이지에 들어가는 만큼으로 제한된다.
+    """
+    rows = max(1, min(rows, MAX_ROWS_PER_PAGE))
+    rnd = random.Random(seed)
+    pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+    pdf = canvas.Canvas(path, pagesize=A4, pageCompression=1, invariant=1)
+    counts = {'A': 0, 'B': 0, 'C': 0}
+    c_numbered = 0
+    
+    for page_idx in range(pages):
+        kind = PAGE_SEQUENCE[page_idx % len(PAGE_SEQUENCE)]
+        pdf.setFont(FONT_NAME, FONT_SIZE)
+        
+        if kind == '본문':
+            y = _draw_heading(pdf, f"{page_idx + 1}. 시설 개요")
+            for _ in range(rows):
+                pdf.drawString(MARGIN, y, BODY_TEXT)
+                y -= ROW_HEIGHT
+        elif kind == 'A':
+            top = _draw_heading(pdf, f"{page_idx + 1}. 대기오염물질 배출 현황")
+            _draw_table(pdf, top, [A_HEADER] + a_rows(rnd, rows), [60, 80, 60, 70, 60, 80])
+            counts['A'] += rows
+        elif kind == 'B':
+            top = _draw_heading(pdf, f"{page_idx + 1}. 배출허용기준")
+            _draw_table(pdf, top, B_HEADERS + b_rows(rnd, rows), [60, 80, 70, 70, 70, 90], B_SPANS)
+            counts['B'] += rows
+        elif kind == 'C':
+            top = _draw_heading(pdf, f"{page_idx + 1}. 배출시설별 배출량")
+            c_numbered = 0
+            _draw_table(pdf, top, [C_TITLE, C_HEADER] + c_rows(rnd, rows), [80, 90, 80, 80], C_SPANS)
+            c_numbered += rows
+            counts['C'] += rows
+        else:
+            # 앞 페이지 C형태 테이블의 계속 (헤더 없음)
+            top = _draw_heading(pdf, "(계속)")
+            _draw_table(pdf, top, c_rows(rnd, rows, c_numbered), [80, 90, 80, 80])
+            c_numbered += rows
+            counts['C'] += rows
+        
+        pdf.showPage()
+    
+    pdf.save()
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 배출 테이블 PDF 생성")
+    parser.add_argument('output', help="저장할 PDF 경로")
+    parser.add_argument('--pages', type=int, default=10, help="페이지 수")
+    parser.add_argument('--rows', type=int, default=20, help=f"테이블당 데이터 행 수 (최대 {MAX_ROWS_PER_PAGE})")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드 (같으면 같은 내용)")
+    args = parser.parse_args(argv)
+    
+    counts = write_synthetic_pdf(args.output, args.pages, args.rows, args.seed)
+    print(f"{args.output}: {args.pages}쪽, 테이블 행 {counts}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""대량 내보내기: 통합데이터·원시데이터·검증이슈·페이지통계를 Parquet/CSV/JSONL로 저장
+
+서식이 있는 정리양식.xlsx(excel_export)는 셀마다 스타일을 붙여 쓰므로 대용량에서는 만드는 데도,
+다른 도구에서 읽는 데도 가장 느리다. 여기서는 미리보기와 같은 고정 스키마 DataFrame
+(preview.PreviewTable)을 서식 없이 컬럼 단위로 그대로 쓴다.
+    - parquet: pyarrow(또는 fastparquet)가 설치되어 있을 때만 선택 가능 (Streamlit 설치 시 pyarrow도 설치됨)
+    - csv: UTF-8, 헤더 행 포함
+    - jsonl: 한 줄에 행 하나 (UTF-8, 빈 값은 null)
+표마다 파일 하나(예: 통합데이터.parquet)이며, 웹은 zip 하나로 받고 CLI는 디렉터리에 쓴다.
+통합데이터·원시데이터·페이지통계는 '구분'(계획서/검토서) 컬럼으로 문서를 구분한다.
+"""
+import importlib.util
+import os
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+
+from preview import PreviewTable
+
+EXPORT_PARQUET = 'parquet'
+EXPORT_CSV = 'csv'
+EXPORT_JSONL = 'jsonl'
+EXPORT_FORMATS = (EXPORT_PARQUET, EXPORT_CSV, EXPORT_JSONL)
+
+SOURCE_COLUMN = '구분'
+TABLE_INTEGRATED = '통합데이터'
+TABLE_RAW = '원시데이터'
+TABLE_VALIDATION = '검증이슈'
+TABLE_PAGES = '페이지통계'
+
+def available_formats():
+    """이 환경에서 쓸 수 있는 내보내기 형식 (parquet은 엔진이 있을 때만)"""
+    has_parquet_engine = any(importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet'))
+    return tuple(fmt for fmt in EXPORT_FORMATS if fmt != EXPORT_PARQUET or has_parquet_engine)
+
+def _check_format(fmt):
+    if fmt not in available_formats():
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt} (사용 가능: {', '.join(available_formats())})")
+
+def _with_source(frames):
+    """문서별 DataFrame 앞에 '구분' 컬럼을 붙여 하나로 합침 (범주형 컬럼은 합친 뒤에도 범주형 유지)"""
+    frames = [(label, frame) for label, frame in frames if len(frame.columns)]
+    if not frames:
+        return pd.DataFrame({SOURCE_COLUMN: pd.Categorical([])})
+    categorical = {
+        column for _, frame in frames for column in frame.columns if isinstance(frame[column].dtype, pd.CategoricalDtype)
+    }
+    combined = pd.concat(
+        [frame.assign(**{SOURCE_COLUMN: label}) for label, frame in frames], ignore_index=True
+    )
+    for column in categorical | {SOURCE_COLUMN}:
+        combined[column] = combined[column].astype('category')
+    return combined[[SOURCE_COLUMN] + [column for column in combined.columns if column != SOURCE_COLUMN]]
+
+def build_export_tables(documents, validation_issues, previews=None):
+    """내보낼 표 {표 이름: DataFrame}
+    
+    documents는 {문서 이름: (추출 행 RowStore, 원시 행 RowStore, page_info)}이다.
+    previews(preview.build_previews 결과)가 있으면 이미 만든 고정 스키마 DataFrame을 그대로 쓴다.
+    """
+    previews = previews or {}
+    
+    def frame(key, data):
+        table = previews.get(key)
+        return (table if table is not None else PreviewTable.from_store(data)).frame
+    
+    return {
+        TABLE_INTEGRATED: _with_source([(label, frame(label, data)) for label, (data, _, _) in documents.items()]),
+        TABLE_RAW: _with_source([
+            (label, frame(f"{label} 원시", raw_data)) for label, (_, raw_data, _) in documents.items()
+        ]),
+        TABLE_VALIDATION: PreviewTable.from_records(validation_issues).frame,
+        TABLE_PAGES: _with_source([
+            (label, PreviewTable.from_records(page_info).frame) for label, (_, _, page_info) in documents.items()
+        ]),
+    }
+
+def write_table(frame, fmt, target):
+    """DataFrame 하나를 fmt 형식으로 target(파일 경로 또는 바이너리 버퍼)에 씀"""
+    if fmt == EXPORT_PARQUET:
+        frame.to_parquet(target, index=False)
+    elif fmt == EXPORT_CSV:
+        frame.to_csv(target, index=False, encoding='utf-8')
+    elif fmt == EXPORT_JSONL:
+        text = frame.to_json(orient='records', lines=True, force_ascii=False)
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            target.write(text.encode('utf-8'))
+    else:
+        _check_format(fmt)
+
+def write_directory(tables, output_dir, fmt):
+    """표마다 output_dir/표이름.fmt 파일로 쓰고 경로 목록 반환"""
+    _check_format(fmt)
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name, frame in tables.items():
+        path = os.path.join(output_dir, f"{name}.{fmt}")
+        # 중단 시 불완전한 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.tmp"
+        write_table(frame, fmt, tmp_path)
+        os.replace(tmp_path, path)
+        paths.append(path)
+    return paths
+
+def bundle_zip(tables, fmt):
+    """표마다 파일 하나씩 담은 zip 바이트 (parquet은 이미 압축되어 있으므로 그대로 저장)"""
+    _check_format(fmt)
+    compression = zipfile.ZIP_STORED if fmt == EXPORT_PARQUET else zipfile.ZIP_DEFLATED
+    output = BytesIO()
+    with zipfile.ZipFile(output, 'w', compression=compression) as bundle:
+        for name, frame in tables.items():
+            buffer = BytesIO()
+            write_table(frame, fmt, buffer)
+            bundle.writestr(f"{name}.{fmt}", buffer.getvalue())
+    return output.getvalue()
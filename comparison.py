@@ -0,0 +1,128 @@
+from collections import defaultdict
+from functools import lru_cache
+
+from numeric_values import (
+    NUMERIC_FIELDS, STATUS_EMPTY, STATUS_NOT_DETECTED, VALUE_STATUSES, status_key, typed_value, unit_key, value_key
+)
+from row_store import iter_records
+
+# 계획서/검토서 간에 비교하는 값 필드
+COMPARE_FIELDS = ['농도', '배출량', '최대배출기준', '허가배출기준']
+# 비교 결과를 만드는 데 필요한 필드
+KEY_FIELDS = ['배출구번호', '물질명', '페이지']
+
+DIFF_LABEL = '값 차이'
+PLAN_ONLY_LABEL = '계획서에만 있음'
+REVIEW_ONLY_LABEL = '검토서에만 있음'
+
+# 배출구번호·물질명은 문서 안에서 반복되므로 정규화 결과를 캐시
+NORMALIZE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_outlet(outlet_number):
+    """배출구번호 정규화 ('a 1' → '#A1')"""
+    outlet = ''.join(str(outlet_number or '').split()).upper()
+    if outlet and not outlet.startswith('#'):
+        outlet = '#' + outlet
+    return outlet
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_substance(substance):
+    """물질명 정규화 (공백 제거, 소문자)"""
+    return ''.join(str(substance or '').split()).lower()
+
+def normalize_value(value):
+    """비교용 값 정규화 (공백·쉼표 제거, '-'는 빈 값)"""
+    text = ''.join(str(value or '').split()).replace(',', '')
+    return '' if text == '-' else text
+
+def comparison_key(row):
+    """(배출구번호, 물질명) 정규화 키"""
+    return normalize_outlet(row.get('배출구번호')), normalize_substance(row.get('물질명'))
+
+def _record_fields(fields):
+    """비교에 필요한 필드 (수치 필드는 수집 시 파싱된 수치·단위·상태 컬럼 포함)"""
+    record_fields = KEY_FIELDS + list(fields)
+    for field in fields:
+        if field in NUMERIC_FIELDS:
+            record_fields += [value_key(field), unit_key(field), status_key(field)]
+    return record_fields
+
+def values_differ(plan_row, review_row, field):
+    """두 행의 field 값이 다른지 판정
+    
+    수치 필드는 파싱된 수치로 비교하므로 '1,000'과 '1000', '50이하'와 '50 이하'는 같은 값이다.
+    수치·조건(이하/미만/범위 등)·단위(양쪽에 있을 때) 중 하나라도 다르면 차이로 본다.
+    수치로 읽히지 않는 값은 공백·쉼표를 무시한 문자열로 비교한다.
+    """
+    plan_text = plan_row.get(field, '')
+    review_text = review_row.get(field, '')
+    if plan_text == review_text:
+        return False
+    
+    if field in NUMERIC_FIELDS:
+        plan_value, plan_unit, plan_status = typed_value(plan_row, field)
+        review_value, review_unit, review_status = typed_value(review_row, field)
+        if plan_status in VALUE_STATUSES and review_status in VALUE_STATUSES:
+            return (
+                plan_status != review_status
+                or plan_value != review_value
+                or bool(plan_unit and review_unit and plan_unit != review_unit)
+            )
+        if plan_status == review_status and plan_status in (STATUS_EMPTY, STATUS_NOT_DETECTED):
+            return False
+    
+    return normalize_value(plan_text) != normalize_value(review_text)
+
+def build_index(data, fields=COMPARE_FIELDS):
+    """정규화 키 → 행 목록 해시 인덱스 (같은 키는 등장 순서 유지)"""
+    index = defaultdict(list)
+    for row in iter_records(data, _record_fields(fields)):
+        index[comparison_key(row)].append(row)
+    return index
+
+def _item(label, plan_row, review_row, field='', plan_value='', review_value=''):
+    row = plan_row or review_row
+    return {
+        '구분': label,
+        '배출구번호': row.get('배출구번호', ''),
+        '물질명': row.get('물질명', ''),
+        '필드': field,
+        '계획서값': plan_value,
+        '검토서값': review_value,
+        '계획서페이지': plan_row.get('페이지', '') if plan_row else '',
+        '검토서페이지': review_row.get('페이지', '') if review_row else ''
+    }
+
+def compare_plan_review(plan_data, review_data, fields=COMPARE_FIELDS):
+    """계획서와 검토서를 (배출구번호, 물질명) 키로 매칭하여 비교
+    
+    두 데이터를 해시 인덱스로 만든 뒤 키 단위로 한 번씩만 보므로 행 수에 선형으로 동작한다.
+    같은 키가 여러 번 나오면 등장 순서대로 짝짓고 남는 행은 한쪽에만 있는 항목으로 본다.
+    반환값은 (comparison_results, unmatched_items)이며 둘 다 같은 컬럼 구성을 가진다.
+    """
+    plan_index = build_index(plan_data, fields)
+    review_index = build_index(review_data, fields)
+    
+    comparison_results = []
+    unmatched_items = []
+    
+    for key, plan_rows in plan_index.items():
+        review_rows = review_index.get(key, [])
+        
+        for plan_row, review_row in zip(plan_rows, review_rows):
+            for field in fields:
+                if values_differ(plan_row, review_row, field):
+                    comparison_results.append(
+                        _item(DIFF_LABEL, plan_row, review_row, field, plan_row.get(field, ''), review_row.get(field, ''))
+                    )
+        
+        for plan_row in plan_rows[len(review_rows):]:
+            unmatched_items.append(_item(PLAN_ONLY_LABEL, plan_row, None))
+    
+    for key, review_rows in review_index.items():
+        matched_count = len(plan_index.get(key, []))
+        for review_row in review_rows[matched_count:]:
+            unmatched_items.append(_item(REVIEW_ONLY_LABEL, None, review_row))
+    
+    return comparison_results, unmatched_items
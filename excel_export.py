@@ -0,0 +1,229 @@
+from io import BytesIO
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+
+from numeric_values import NUMERIC_FIELDS, STATUS_NUMBER, numeric_columns
+from row_store import iter_field_values
+from standards import JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED, LIMIT_COLUMN
+
+# 통합데이터 시트 컬럼 (시트 컬럼명, 행 데이터 키)
+INTEGRATED_COLUMNS = [
+    ('구분', None), ('페이지', '페이지'), ('테이블', '테이블'), ('테이블타입', '테이블타입'),
+    ('배출구번호', '배출구번호'), ('원본배출구', '원본배출구'), ('물질명', '물질명'),
+    ('농도', '농도'), ('배출량', '배출량'), ('단위', '단위'),
+    ('최대배출기준', '최대배출기준'), ('허가배출기준', '허가배출기준'),
+    ('최대배출기준근거', '최대배출기준근거'), ('허가배출기준근거', '허가배출기준근거'), ('비고', '비고'),
+    ('적용기준', LIMIT_COLUMN), ('기준판정', JUDGEMENT_COLUMN)
+]
+INTEGRATED_WIDTHS = [8, 6, 6, 12, 12, 15, 20, 10, 10, 8, 15, 15, 20, 20, 25, 10, 10]
+
+RAW_HEADERS = ['페이지', '테이블', '테이블타입', '원본행데이터', '헤더정보']
+VALIDATION_HEADERS = ['행번호', '배출구', '물질명', '페이지', '테이블타입', '문제점']
+
+# 테이블 타입별 강조 스타일 (통합데이터 시트의 테이블타입 컬럼)
+TABLE_TYPE_STYLES = {
+    'emission_standards': 'type_standards',
+    'emission_data': 'type_data',
+}
+DEFAULT_TYPE_STYLE = 'type_other'
+
+def _build_named_styles():
+    """워크북 전체에서 공유하는 명명 스타일 (셀마다 스타일 객체를 만들지 않도록)"""
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    header_font = Font(bold=True, color="FFFFFF")
+    
+    def style(name, fill_color=None, header=False):
+        named_style = NamedStyle(name=name)
+        named_style.border = border
+        if fill_color:
+            named_style.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+        if header:
+            named_style.font = header_font
+            named_style.alignment = Alignment(horizontal='center')
+        return named_style
+    
+    return [
+        style('header', "366092", header=True),
+        style('header_raw', "FF9800", header=True),
+        style('data'),
+        style('type_standards', "E8F5E8"),
+        style('type_data', "E8F0FF"),
+        style('type_other', "FFF8E1"),
+    ]
+
+class StreamingExcelWriter:
+    """쓰기 전용(write-only) 모드로 행을 스트리밍하는 엑셀 내보내기 엔진
+    
+    행은 추가되는 즉시 직렬화되므로 메모리에 시트 전체를 유지하지 않으며,
+    같은 스타일의 셀은 컬럼별로 하나의 셀 객체를 재사용한다.
+    """
+    
+    def __init__(self):
+        self.wb = openpyxl.Workbook(write_only=True)
+        for named_style in _build_named_styles():
+            self.wb.add_named_style(named_style)
+    
+    def _cell(self, ws, style_name):
+        cell = WriteOnlyCell(ws)
+        cell.style = style_name
+        return cell
+    
+    def add_sheet(self, title, headers, rows, column_widths=None, header_style='header', column_styles=None):
+        """시트를 추가하고 행(값 목록)을 순서대로 기록
+        
+        column_styles는 {컬럼 번호(0부터): 행 값 목록 → 스타일명} 형태로, 행마다 스타일이
+        달라지는 컬럼에만 지정한다. 나머지 데이터 셀은 'data' 스타일을 사용한다.
+        """
+        ws = self.wb.create_sheet(title)
+        
+        # 쓰기 전용 시트는 행보다 먼저 열 너비를 지정해야 함
+        for col, width in enumerate(column_widths or [], 1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+        
+        header_cells = []
+        for header in headers:
+            cell = self._cell(ws, header_style)
+            cell.value = header
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        column_styles = column_styles or {}
+        data_cells = [self._cell(ws, 'data') for _ in headers]
+        style_cells = {}
+        
+        count = 0
+        for values in rows:
+            row_cells = data_cells
+            if column_styles:
+                row_cells = list(data_cells)
+                for col, style_for in column_styles.items():
+                    style_name = style_for(values)
+                    key = (col, style_name)
+                    if key not in style_cells:
+                        style_cells[key] = self._cell(ws, style_name)
+                    row_cells[col] = style_cells[key]
+            
+            for cell, value in zip(row_cells, values):
+                cell.value = value
+            ws.append(row_cells[:len(values)])
+            count += 1
+        
+        return count
+    
+    def save(self):
+        """메모리 버퍼로 저장하여 반환"""
+        output = BytesIO()
+        self.wb.save(output)
+        output.seek(0)
+        return output
+
+def _dict_rows_columns(rows):
+    """딕셔너리 행 목록의 컬럼 목록 (처음 등장한 순서)"""
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    return list(columns)
+
+def _integrated_rows(source, data):
+    """통합데이터 행 (단일 수치로 파싱된 농도/배출량/배출기준은 숫자 셀, 나머지는 원문)"""
+    keys = [key for _, key in INTEGRATED_COLUMNS[1:]]
+    limit_position = keys.index(LIMIT_COLUMN)
+    numeric_positions = [
+        (keys.index(field), *numeric_columns(data, field)) for field in NUMERIC_FIELDS if field in keys
+    ]
+    for index, values in enumerate(iter_field_values(data, keys)):
+        for position, numbers, _, statuses in numeric_positions:
+            if statuses[index] == STATUS_NUMBER:
+                values[position] = numbers[index]
+        if values[limit_position] != values[limit_position]:  # 적용 기준 없음 (NaN)
+            values[limit_position] = ''
+        yield [source] + values
+
+def _summary_rows(plan_data, review_data, validation_issues, comparison_results, unmatched_items, raw_data):
+    yield ['계획서 추출 건수', len(plan_data)]
+    yield ['검토서 추출 건수', len(review_data)]
+    yield ['원시 데이터 수', len(raw_data or [])]
+    yield ['검증 이슈 수', len(validation_issues)]
+    yield ['비교 결과 수', len(comparison_results)]
+    yield ['미매칭 항목 수', len(unmatched_items)]
+    yield ['배출기준 초과 수', sum(
+        judgement == JUDGEMENT_EXCEEDED
+        for data in (plan_data, review_data)
+        for (judgement,) in iter_field_values(data, [JUDGEMENT_COLUMN])
+    )]
+    
+    # 테이블 타입별 건수
+    type_stats = {}
+    for source, data in (('계획서', plan_data), ('검토서', review_data)):
+        for (table_type,) in iter_field_values(data, ['테이블타입'], 'unknown'):
+            key = (source, table_type)
+            type_stats[key] = type_stats.get(key, 0) + 1
+    for (source, table_type), count in type_stats.items():
+        yield [f'{source} {table_type}', count]
+
+def create_standardized_excel(plan_data, review_data, validation_issues, comparison_results, unmatched_items, raw_data=None):
+    """표준화된 엑셀 파일 생성 (쓰기 전용 스트리밍 엔진 사용)"""
+    writer = StreamingExcelWriter()
+    type_col = 3  # 테이블타입 컬럼
+    
+    # 1. 통합 데이터 시트 (계획서 → 검토서 순)
+    def integrated_rows():
+        yield from _integrated_rows("계획서", plan_data)
+        yield from _integrated_rows("검토서", review_data)
+    
+    writer.add_sheet(
+        "통합데이터",
+        [header for header, _ in INTEGRATED_COLUMNS],
+        integrated_rows(),
+        column_widths=INTEGRATED_WIDTHS,
+        column_styles={type_col: lambda values: TABLE_TYPE_STYLES.get(values[type_col], DEFAULT_TYPE_STYLE)}
+    )
+    
+    # 2. 원시 데이터 시트
+    if raw_data:
+        writer.add_sheet(
+            "원시데이터",
+            RAW_HEADERS,
+            (
+                [page, table, table_type, str(original_row), str(header)]
+                for page, table, table_type, original_row, header in iter_field_values(
+                    raw_data, ['페이지', '테이블', '테이블타입', '원본행', '헤더']
+                )
+            ),
+            header_style='header_raw'
+        )
+    
+    # 3. 데이터 검증 시트
+    writer.add_sheet(
+        "데이터검증",
+        VALIDATION_HEADERS,
+        ([issue.get(header, '') for header in VALIDATION_HEADERS] for issue in validation_issues),
+        column_widths=[8, 12, 20, 6, 18, 60]
+    )
+    
+    # 4. 비교 결과 시트 (비교 결과 뒤에 한쪽에만 있는 항목)
+    comparison_rows = list(comparison_results) + list(unmatched_items)
+    comparison_headers = _dict_rows_columns(comparison_rows)
+    writer.add_sheet(
+        "비교결과",
+        comparison_headers,
+        ([row.get(header, '') for header in comparison_headers] for row in comparison_rows)
+    )
+    
+    # 5. 요약 통계 시트
+    writer.add_sheet(
+        "요약통계",
+        ['항목', '값'],
+        _summary_rows(plan_data, review_data, validation_issues, comparison_results, unmatched_items, raw_data),
+        column_widths=[30, 12]
+    )
+    
+    return writer.save()
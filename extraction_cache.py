@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+from extraction_profiles import PROFILE_DEFAULT
+from page_supervisor import parse_pdf_tables_supervised, unfinished_pages
+from pdf_extractor import EXTRACT_TIME_KEY, PARSER_VERSION, build_rows_from_tables, parse_pdf_tables
+from pdf_io import file_sha256
+
+# 캐시 설정
+DEFAULT_CACHE_DIR = os.environ.get(
+    "EMISSION_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "emission-extractor")
+)
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024   # 메모리 계층 최대 크기 (바이트)
+DEFAULT_DISK_LIMIT = 2 * 1024 * 1024 * 1024  # 디스크 계층 최대 크기 (바이트)
+
+class ExtractionCache:
+    """PDF 파싱 결과 캐시 (메모리 + 디스크 2계층, 크기 제한 LRU)
+    
+    키는 PDF 내용 해시, 파싱 옵션, 파서 버전(PARSER_VERSION)으로 구성되므로
+    파싱 로직이 바뀌면 이전 항목은 더 이상 조회되지 않고 LRU로 정리된다.
+    값은 pickle 바이트로 저장하여 호출자마다 독립된 사본을 돌려준다.
+    """
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_memory_bytes=DEFAULT_MEMORY_LIMIT, max_disk_bytes=DEFAULT_DISK_LIMIT):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def make_key(self, pdf_file, **options):
+        """PDF 해시 + 파싱 옵션 + 파서 버전으로 캐시 키 생성"""
+        key_source = json.dumps({
+            "version": PARSER_VERSION,
+            "pdf": file_sha256(pdf_file),
+            "options": options,
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+    
+    def get(self, key):
+        """캐시된 결과 반환 (없으면 None)"""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+            else:
+                payload = self._read_disk(key)
+                if payload is not None:
+                    self._store_memory(key, payload)
+            
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        
+        return pickle.loads(payload)
+    
+    def put(self, key, result):
+        """결과를 메모리와 디스크 계층에 저장"""
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store_memory(key, payload)
+            self._write_disk(key, payload)
+    
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for path, _, _ in self._disk_entries():
+                os.remove(path)
+    
+    def _store_memory(self, key, payload):
+        if len(payload) > self.max_memory_bytes:
+            return
+        
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = payload
+        self._memory_bytes += len(payload)
+        
+        # 가장 오래 사용되지 않은 항목부터 제거
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+    
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+    
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+        except OSError:
+            return None
+        
+        # 접근 시각 갱신 (디스크 LRU 기준)
+        os.utime(path)
+        return payload
+    
+    def _write_disk(self, key, payload):
+        if not self.cache_dir or len(payload) > self.max_disk_bytes:
+            return
+        
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        
+        self._evict_disk()
+    
+    def _disk_entries(self):
+        """(경로, 크기, 최근 사용 시각) 목록"""
+        entries = []
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return entries
+        
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def _evict_disk(self):
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        
+        for path, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+def parse_pdf_tables_cached(pdf_file, cache, progress_callback=None, strict=False, profile=PROFILE_DEFAULT,
+                            supervision=None, **kwargs):
+    """캐시를 먼저 조회하고, 없을 때만 parse_pdf_tables(1단계)를 실행
+    
+    반환값은 (페이지별 테이블 표현, 캐시 적중 여부)이다. 캐시 적중이면 이번 실행에서 추출하지 않았으므로
+    페이지의 추출 시간(EXTRACT_TIME_KEY)을 0으로 돌려준다 (저장할 때의 시간을 이번 실행 시간으로 보고하지 않도록).
+    supervision(page_supervisor.PageSupervision)이 있으면 페이지 감시로 파싱하며, 건너뜀·실패 페이지가
+    있는 결과는 다음 실행에서 다시 시도할 수 있도록 캐시에 넣지 않는다.
+    """
+    key = cache.make_key(pdf_file, strict=strict, profile=profile)
+    parsed_pages = cache.get(key)
+    if parsed_pages is not None:
+        for page_entry in parsed_pages:
+            page_entry[EXTRACT_TIME_KEY] = 0.0
+        total_pages = len(parsed_pages)
+        if progress_callback and total_pages:
+            progress_callback(total_pages, total_pages)
+        return parsed_pages, True
+    
+    if supervision is not None:
+        parsed_pages = parse_pdf_tables_supervised(pdf_file, progress_callback, strict, profile, supervision)
+        if unfinished_pages(parsed_pages):
+            return parsed_pages, False
+    else:
+        parsed_pages = parse_pdf_tables(pdf_file, progress_callback=progress_callback, strict=strict, profile=profile, **kwargs)
+    cache.put(key, parsed_pages)
+    return parsed_pages, False
+
+def extract_table_from_pdf_cached(pdf_file, selected_outlets, cache, progress_callback=None, **kwargs):
+    """캐시된 1단계 결과에 배출구 필터링(2단계)만 다시 적용하여 추출
+    
+    반환값은 (all_data, page_info, raw_table_data, 캐시 적중 여부)이다.
+    """
+    parsed_pages, cache_hit = parse_pdf_tables_cached(pdf_file, cache, progress_callback=progress_callback, **kwargs)
+    return (*build_rows_from_tables(parsed_pages, selected_outlets), cache_hit)
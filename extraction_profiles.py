@@ -0,0 +1,100 @@
+"""문서 형태(A/B/C)별 테이블 추출 프로파일
+
+프로파일은 page.extract_tables()에 넘길 pdfplumber table_settings와 헤더 키워드 묶음이다.
+    - 헤더 키워드(header_keywords): 페이지 사전 필터가 찾는 키워드. 기본 키워드(page_filter.PAGE_KEYWORDS)를
+      항상 포함하므로 프로파일을 바꿔도 걸러지는 페이지가 늘지 않는다.
+    - 형태 키워드(form_keywords): 앞쪽 페이지에서 문서 형태를 감지할 때 쓰는 키워드.
+세 형태 모두 괘선 테이블이므로 선(lines) 전략만 쓰고, 형태마다 선 병합·교차 허용 오차를 조정한다.
+설정은 benchmarks/bench_profiles.py로 합성 코퍼스에서 기본 설정과 같은 행이 나오는지 확인한 값이다.
+설정을 바꾸면 추출 결과 캐시가 프로파일 이름으로만 구분되므로 pdf_extractor.PARSER_VERSION을 올린다.
+"""
+from page_filter import PAGE_KEYWORDS
+
+PROFILE_AUTO = '자동'
+PROFILE_DEFAULT = '기본'
+
+DETECT_PAGES = 3        # 형태 감지에 쓰는 텍스트가 있는 페이지 수
+DETECT_SCAN_PAGES = 10  # 형태 감지를 위해 살펴보는 최대 페이지 수 (스캔 문서처럼 텍스트가 없는 경우 대비)
+
+class ExtractionProfile:
+    """형태 하나의 테이블 추출 설정"""
+    
+    def __init__(self, name, description, table_settings=None, form_keywords=(), header_keywords=()):
+        self.name = name
+        self.description = description
+        self.table_settings = dict(table_settings or {})
+        self.form_keywords = tuple(form_keywords)
+        self.header_keywords = tuple(PAGE_KEYWORDS) + tuple(
+            keyword for keyword in header_keywords if keyword not in PAGE_KEYWORDS
+        )
+    
+    def __repr__(self):
+        return f"ExtractionProfile({self.name!r})"
+
+# 선 전략 공통 설정: 짧은 선(글자 밑줄, 장식)은 테이블 선 후보에서 제외
+LINES_SETTINGS = {
+    'vertical_strategy': 'lines',
+    'horizontal_strategy': 'lines',
+    'edge_min_length': 10,
+}
+
+PROFILES = {
+    PROFILE_DEFAULT: ExtractionProfile(
+        PROFILE_DEFAULT, "pdfplumber 기본 설정 (형태를 알 수 없을 때)",
+    ),
+    'A': ExtractionProfile(
+        'A', "A형태: 기본 배출구 데이터 (단일 헤더 괘선 테이블)",
+        table_settings=LINES_SETTINGS,
+        form_keywords=('배출구', '물질명', '농도', '배출량'),
+        header_keywords=('단위', '비고'),
+    ),
+    'B': ExtractionProfile(
+        'B', "B형태: 배출기준 포함 (2행 복합 헤더, 선이 정확히 맞닿는 완전 괘선)",
+        table_settings={**LINES_SETTINGS, 'snap_tolerance': 1, 'join_tolerance': 1, 'intersection_tolerance': 1},
+        form_keywords=('최대배출기준', '허가배출기준'),
+        header_keywords=('최대배출기준', '허가배출기준', '근거'),
+    ),
+    'C': ExtractionProfile(
+        'C', "C형태: 복합 테이블 (제목 행 병합, 다음 페이지로 이어지는 테이블)",
+        table_settings=LINES_SETTINGS,
+        form_keywords=('오염물질', '배출농도', '연간배출량'),
+        header_keywords=('오염물질', '배출농도', '연간배출량'),
+    ),
+}
+
+# 형태 감지 우선순위: 더 특징적인 키워드를 가진 형태부터
+DETECT_ORDER = ('B', 'C', 'A')
+
+PROFILE_CHOICES = (PROFILE_AUTO,) + tuple(PROFILES)
+
+def get_profile(name=None):
+    """프로파일 이름(없으면 기본)에 해당하는 ExtractionProfile"""
+    if name is None:
+        return PROFILES[PROFILE_DEFAULT]
+    if name not in PROFILES:
+        raise ValueError(f"알 수 없는 추출 프로파일: {name} (선택: {', '.join(PROFILE_CHOICES)})")
+    return PROFILES[name]
+
+def detect_form(texts):
+    """페이지 텍스트 목록에서 문서 형태 이름을 감지 (알 수 없으면 기본)"""
+    text = ''.join(texts)
+    for name in DETECT_ORDER:
+        if any(keyword in text for keyword in PROFILES[name].form_keywords):
+            return name
+    return PROFILE_DEFAULT
+
+def detect_profile(pdf, max_pages=DETECT_PAGES, scan_pages=DETECT_SCAN_PAGES):
+    """열린 PDF의 앞쪽 scan_pages쪽 중 텍스트가 있는 max_pages쪽을 보고 형태 이름을 반환
+    
+    읽은 페이지의 캐시는 남겨 두어 이어지는 추출에서 같은 페이지를 다시 파싱하지 않는다
+    (추출 루프가 페이지마다 해제함).
+    """
+    texts = []
+    for page in pdf.pages[:scan_pages]:
+        page_text = ''.join(char['text'] for char in page.chars)
+        if not page_text:
+            continue
+        texts.append(page_text)
+        if len(texts) >= max_pages:
+            break
+    return detect_form(texts)
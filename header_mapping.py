@@ -0,0 +1,52 @@
+import re
+from functools import lru_cache
+
+# 헤더 키워드 → 표준 필드 규칙 (위에서부터 처음 일치하는 규칙 적용)
+FIELD_RULES = [
+    (('물질명', '오염물질', '항목'), '물질명'),
+    (('농도', '배출농도'), '농도'),
+    (('배출량', '연간배출량'), '배출량'),
+    (('단위',), '단위'),
+    (('최대배출기준',), '최대배출기준'),
+    (('허가배출기준',), '허가배출기준'),
+]
+
+# 값을 process_emission_basis로 변환해야 하는 필드
+BASIS_FIELDS = ('최대배출기준근거', '허가배출기준근거')
+
+# 배출구 번호 추출 패턴: '#A1', '#A' 형태를 먼저, 그다음 'A1' 형태 (문자열 맨 앞에서 일치)
+OUTLET_NUMBER_PATTERN = re.compile(r'#[A-Z]+\d*|[A-Z]+\d*')
+
+HEADER_MAP_CACHE_SIZE = 1024
+
+def classify_header(header_str):
+    """소문자로 정리된 헤더명을 표준 필드명으로 분류 (해당 없으면 None)"""
+    for keywords, field in FIELD_RULES:
+        if any(keyword in header_str for keyword in keywords):
+            return field
+    
+    if '근거' in header_str:
+        if '최대' in header_str:
+            return '최대배출기준근거'
+        elif '허가' in header_str:
+            return '허가배출기준근거'
+        return '최대배출기준근거'
+    if '비고' in header_str:
+        return '비고'
+    return None
+
+@lru_cache(maxsize=HEADER_MAP_CACHE_SIZE)
+def compile_header_map(header_signature):
+    """헤더 행(튜플)을 [(열 번호, 표준 필드 또는 None, 원본 헤더명)] 매핑으로 변환
+    
+    헤더 시그니처별로 캐시되므로 같은 헤더가 반복되는 연속 페이지에서는 분류를 다시 하지 않는다.
+    """
+    return tuple(
+        (j, classify_header(str(header).strip().lower()), str(header))
+        for j, header in enumerate(header_signature) if header
+    )
+
+def match_outlet_number(first_cell):
+    """첫 번째 셀에서 배출구 번호 추출 (패턴이 없으면 셀 값 그대로)"""
+    match = OUTLET_NUMBER_PATTERN.match(first_cell)
+    return match.group(0) if match else first_cell
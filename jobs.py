@@ -0,0 +1,184 @@
+"""백그라운드 작업 실행기
+
+Streamlit은 위젯이 바뀔 때마다 스크립트를 처음부터 다시 실행하므로, 버튼 분기 안에서 처리한
+결과는 다음 실행에서 사라진다. JobManager는 처리 함수를 서버 프로세스의 작업 스레드에서 실행하고
+작업 ID로 상태·진행률·결과를 보관한다. 화면은 세션에 작업 ID만 기억해 두었다가 다시 실행될 때
+보관된 결과를 그대로 보여 준다.
+
+동시에 실행되는 작업 수는 max_workers로 제한되어, 여러 사용자가 한 서버에서 동시에 큰 PDF를
+올려도 나머지 작업은 대기열에서 기다린다. 끝난 작업의 결과는 개수(max_results)와 보관 시간(result_ttl)
+한도를 넘으면 오래된 것부터 정리한다. 프로세스 메모리가 상한(pdf_io.MEMORY_LIMIT)을 넘은 상태이면
+차례가 된 작업도 실행 중인 작업이 메모리를 돌려줄 때까지 대기 상태로 기다린다.
+
+HTTP API처럼 외부 요청을 받는 경우 max_queued로 대기열 길이를 제한하고(넘으면 QueueFullError),
+dedupe_key가 같은 작업이 아직 끝나지 않았으면 새로 만들지 않고 그 작업을 돌려준다.
+"""
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf_io import wait_for_memory
+
+# 작업 상태
+JOB_QUEUED = '대기'
+JOB_RUNNING = '실행중'
+JOB_DONE = '완료'
+JOB_FAILED = '실패'
+FINISHED_STATUSES = (JOB_DONE, JOB_FAILED)
+
+DEFAULT_MAX_JOBS = int(os.environ.get("EMISSION_MAX_JOBS", "2"))  # 서버 전체 동시 실행 작업 수
+DEFAULT_MAX_RESULTS = 20                                         # 보관하는 끝난 작업 수
+DEFAULT_RESULT_TTL = 60 * 60                                     # 끝난 작업 보관 시간 (초)
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음 (잠시 후 다시 요청)"""
+
+class Job:
+    """작업 하나의 상태 (작업 스레드가 갱신하고 화면 스레드가 읽음)"""
+    
+    def __init__(self, label='', dedupe_key=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.label = label
+        self.dedupe_key = dedupe_key
+        self.status = JOB_QUEUED
+        self.progress = 0.0
+        self.message = '대기 중...'
+        self.parts = {}  # 부분 작업(문서 등)별 (진행률, 메시지)
+        self.result = None
+        self.error = ''
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+    
+    @property
+    def done(self):
+        return self.status in FINISHED_STATUSES
+    
+    def update(self, progress=None, message=None, part=None):
+        """진행률(0~1)과 메시지 갱신 (처리 함수의 progress 콜백으로 전달됨)
+        
+        part를 주면 전체 진행률 대신 그 부분 작업의 진행률을 갱신한다 (동시에 처리하는 문서별 진행 표시용).
+        """
+        if progress is not None:
+            progress = min(max(float(progress), 0.0), 1.0)
+        if part is not None:
+            previous_progress, previous_message = self.parts.get(part, (0.0, ''))
+            self.parts[part] = (
+                previous_progress if progress is None else progress,
+                previous_message if message is None else message,
+            )
+            return
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+    
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+class JobManager:
+    """작업 스레드 풀과 작업 보관소
+    
+    submit(func, *args, **kwargs)은 func(*args, progress=job.update, **kwargs)를 작업 스레드에서 실행하고
+    반환값을 job.result에 보관한다. 보관 한도를 넘어 정리되는 작업은 on_discard(job)로 알린다
+    (작업 결과 파일 삭제 등).
+    """
+    
+    def __init__(self, max_workers=DEFAULT_MAX_JOBS, max_results=DEFAULT_MAX_RESULTS, result_ttl=DEFAULT_RESULT_TTL,
+                 max_queued=None, on_discard=None):
+        self.max_workers = max(1, max_workers)
+        self.max_results = max_results
+        self.result_ttl = result_ttl
+        self.max_queued = max_queued
+        self.on_discard = on_discard
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='emission-job')
+        self._jobs = OrderedDict()
+        self._inflight = {}  # dedupe_key → 끝나지 않은 Job
+        self._lock = threading.Lock()
+    
+    def submit(self, func, *args, label='', dedupe_key=None, **kwargs):
+        """작업을 대기열에 넣고 Job 반환
+        
+        dedupe_key가 같은 작업이 대기·실행 중이면 그 Job을 그대로 반환한다.
+        대기 중인 작업이 max_queued개 이상이면 QueueFullError를 낸다.
+        """
+        with self._lock:
+            if dedupe_key is not None and dedupe_key in self._inflight:
+                return self._inflight[dedupe_key]
+            if self.max_queued is not None:
+                queued = sum(job.status == JOB_QUEUED for job in self._jobs.values())
+                if queued >= self.max_queued:
+                    raise QueueFullError(f"대기 중인 작업이 {queued}개로 한도({self.max_queued})에 도달했습니다.")
+            discarded = self._prune()
+            job = Job(label, dedupe_key)
+            self._jobs[job.id] = job
+            if dedupe_key is not None:
+                self._inflight[dedupe_key] = job
+        self._discard(discarded)
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+    
+    def get(self, job_id):
+        """작업 ID에 해당하는 Job (없거나 정리되었으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def counts(self):
+        """상태별 작업 수"""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {status: statuses.count(status) for status in (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED)}
+    
+    def queue_position(self, job):
+        """대기 중인 작업 앞에 기다리는 작업 수"""
+        with self._lock:
+            queued = [other.id for other in self._jobs.values() if other.status == JOB_QUEUED]
+        return queued.index(job.id) if job.id in queued else 0
+    
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+    
+    def _run(self, job, func, args, kwargs):
+        wait_for_memory(on_wait=lambda usage, limit: job.update(
+            message=f"메모리 사용량({usage / 1e6:,.0f}MB)이 상한({limit / 1e6:,.0f}MB)을 넘어 대기 중..."
+        ))
+        job.status = JOB_RUNNING
+        job.started = time.time()
+        job.update(message='처리 시작...')
+        # 완료 상태는 결과·완료 시각을 모두 채운 뒤 마지막에 바꾼다 (done을 본 다른 스레드가 finished를 쓰므로)
+        status = JOB_FAILED
+        try:
+            job.result = func(*args, progress=job.update, **kwargs)
+            status = JOB_DONE
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.message = traceback.format_exc()
+        finally:
+            job.finished = time.time()
+            with self._lock:
+                if self._inflight.get(job.dedupe_key) is job:
+                    del self._inflight[job.dedupe_key]
+            job.status = status
+    
+    def _prune(self):
+        """보관 한도를 넘은 끝난 작업을 오래된 것부터 제거하고 제거한 작업 목록 반환 (실행·대기 중인 작업은 유지)"""
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.done]
+        expired = [job for job in finished if now - job.finished > self.result_ttl]
+        overflow = finished[:max(0, len(finished) - self.max_results)]
+        discarded = []
+        for job in expired + overflow:
+            if self._jobs.pop(job.id, None) is not None:
+                discarded.append(job)
+        return discarded
+    
+    def _discard(self, jobs):
+        if self.on_discard:
+            for job in jobs:
+                self.on_discard(job)
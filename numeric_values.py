@@ -0,0 +1,187 @@
+"""농도/배출량/배출기준 수치 파싱
+
+PDF 셀 문자열('1,234.5', '-5', '10~20', '50 ppm 이하', '-', 'N.D' 등)을 (수치, 정규화 단위, 파싱 상태)로
+한 번만 변환한다. 같은 문자열은 다시 파싱하지 않도록 캐시하며, RowStore는 수집 시점에 이
+결과를 실수 컬럼으로 보관하여 비교·검증·엑셀 내보내기가 문자열을 다시 해석하지 않게 한다.
+"""
+import math
+import re
+from array import array
+from functools import lru_cache
+
+# 수치로 파싱하는 필드
+NUMERIC_FIELDS = ['농도', '배출량', '최대배출기준', '허가배출기준']
+# 값에 단위가 없으면 행의 '단위' 컬럼을 적용하는 필드 (농도 단위를 공유)
+ROW_UNIT_FIELDS = ('농도', '최대배출기준', '허가배출기준')
+
+# 파싱 상태
+STATUS_NUMBER = '숫자'
+STATUS_RANGE = '범위'          # 'a~b': 수치는 상한(b), 하한은 range_bounds로
+STATUS_MULTIPLE = '복수값'     # 'a/b': 수치 없음
+STATUS_NOT_DETECTED = '불검출'
+STATUS_EMPTY = '빈값'          # 빈 칸, '-' 자리표시
+STATUS_FAILED = '실패'
+QUALIFIER_STATUSES = {'이하': '이하', '미만': '미만', '이상': '이상', '초과': '초과',
+                      '<=': '이하', '≤': '이하', '<': '미만', '>=': '이상', '≥': '이상', '>': '초과'}
+# 수치가 있는 상태
+VALUE_STATUSES = frozenset([STATUS_NUMBER, STATUS_RANGE, *QUALIFIER_STATUSES.values()])
+# 수치가 실제 값의 상한일 뿐인 상태 (실제 값은 그 이하)
+UPPER_BOUND_STATUSES = frozenset(['이하', '미만', STATUS_RANGE])
+
+# 단위 표기 → 정규화 단위 (키는 _unit_lookup_key로 정리한 형태)
+UNIT_ALIASES = {
+    'mg/sm3': 'mg/Sm³',
+    'mg/nm3': 'mg/Nm³',
+    'mg/m3': 'mg/m³',
+    'μg/sm3': 'μg/Sm³',
+    'ng-teq/sm3': 'ng-TEQ/Sm³',
+    'ppm': 'ppm',
+    'ppb': 'ppb',
+    '%': '%',
+    '배': '배',
+    'kg/yr': 'kg/년', 'kg/year': 'kg/년', 'kg/년': 'kg/년',
+    'ton/yr': '톤/년', 't/yr': '톤/년', 'ton/년': '톤/년', '톤/년': '톤/년',
+    'kg/hr': 'kg/시간', 'kg/h': 'kg/시간', 'kg/시간': 'kg/시간',
+    'g/hr': 'g/시간', 'g/h': 'g/시간', 'g/시간': 'g/시간',
+}
+# 합자·위첨자·수학 기호(− → -) 표기 정리
+UNIT_CHAR_MAP = str.maketrans({'㎎': 'mg', '㎍': 'μg', '㎥': 'm3', '³': '3', 'µ': 'μ', '㎏': 'kg', '−': '-'})
+
+EMPTY_VALUES = frozenset(['', '-', '–', '—', '~', '해당없음', '없음'])
+NOT_DETECTED_VALUES = frozenset(['n.d', 'n.d.', 'nd', '불검출', '검출안됨'])
+
+_NUMBER = r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?'  # 부호 허용 ('-5', '−3')
+NUMBER_PATTERN = re.compile(rf'^{_NUMBER}$')
+RANGE_PATTERN = re.compile(rf'^({_NUMBER})\s*[~∼〜\-–]\s*({_NUMBER})$')
+MULTIPLE_PATTERN = re.compile(rf'^{_NUMBER}(?:\s*/\s*{_NUMBER})+$')
+# '50(12)': 괄호 안은 표준산소농도(%)
+OXYGEN_REFERENCE_PATTERN = re.compile(rf'^({_NUMBER})\s*\(\s*{_NUMBER}\s*%?\s*\)$')
+UNIT_PATTERN = re.compile(
+    r'\(?\s*(' + '|'.join(re.escape(alias) for alias in sorted(UNIT_ALIASES, key=len, reverse=True)) + r')\s*\)?\s*$',
+    re.IGNORECASE
+)
+SUFFIX_QUALIFIER_PATTERN = re.compile(r'\s*(이하|미만|이상|초과)\s*$')
+PREFIX_QUALIFIER_PATTERN = re.compile(r'^\s*(<=|>=|≤|≥|<|>)\s*')
+
+PARSE_CACHE_SIZE = 4096
+
+def _unit_lookup_key(text):
+    return text.translate(UNIT_CHAR_MAP).replace(' ', '').lower()
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def normalize_unit(unit_text):
+    """단위 문자열 정규화 (알 수 없는 단위는 공백만 정리하여 그대로)"""
+    if not unit_text:
+        return ''
+    key = _unit_lookup_key(str(unit_text))
+    return UNIT_ALIASES.get(key, str(unit_text).strip())
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_numeric(text):
+    """셀 문자열을 (수치, 단위, 상태)로 변환 (수치가 없으면 NaN)"""
+    text = str(text).translate(UNIT_CHAR_MAP).strip() if text is not None else ''
+    
+    if text in EMPTY_VALUES:
+        return math.nan, '', STATUS_EMPTY
+    
+    # 대부분의 셀은 단순 숫자이므로 단위·조건 탐색 전에 먼저 확인
+    body = text.replace(',', '')
+    if NUMBER_PATTERN.match(body):
+        return float(body), '', STATUS_NUMBER
+    
+    if text.lower() in NOT_DETECTED_VALUES:
+        return math.nan, '', STATUS_NOT_DETECTED
+    
+    body, unit, qualifier = _split_value(text)
+    if NUMBER_PATTERN.match(body):
+        return float(body), unit, QUALIFIER_STATUSES.get(qualifier, STATUS_NUMBER)
+    
+    match = OXYGEN_REFERENCE_PATTERN.match(body)
+    if match:
+        return float(match.group(1)), unit, QUALIFIER_STATUSES.get(qualifier, STATUS_NUMBER)
+    
+    match = RANGE_PATTERN.match(body)
+    if match:
+        return max(float(match.group(1)), float(match.group(2))), unit, STATUS_RANGE
+    
+    if MULTIPLE_PATTERN.match(body):
+        return math.nan, unit, STATUS_MULTIPLE
+    
+    return math.nan, unit, STATUS_FAILED
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def range_bounds(text):
+    """범위 값('10~20 ppm')의 (하한, 상한), 범위가 아니면 None"""
+    text = str(text).translate(UNIT_CHAR_MAP).strip() if text is not None else ''
+    match = RANGE_PATTERN.match(_split_value(text)[0])
+    if not match:
+        return None
+    low, high = float(match.group(1)), float(match.group(2))
+    return min(low, high), max(low, high)
+
+def _split_value(text):
+    """셀 문자열을 (수치 부분, 정규화 단위, 조건 표기)로 분리
+    
+    '50 ppm 이하', '50이하 ppm', '(50) mg/Sm3' 순서 모두 허용한다.
+    """
+    qualifier = None
+    match = SUFFIX_QUALIFIER_PATTERN.search(text)
+    if match:
+        qualifier, text = match.group(1), text[:match.start()]
+    
+    unit = ''
+    match = UNIT_PATTERN.search(text)
+    if match and match.start() > 0:
+        unit, text = UNIT_ALIASES[_unit_lookup_key(match.group(1))], text[:match.start()]
+    
+    if qualifier is None:
+        match = SUFFIX_QUALIFIER_PATTERN.search(text)
+        if match:
+            qualifier, text = match.group(1), text[:match.start()]
+    match = PREFIX_QUALIFIER_PATTERN.match(text)
+    if match and qualifier is None:
+        qualifier, text = match.group(1), text[match.end():]
+    
+    body = text.replace(',', '').strip()
+    if body.startswith('(') and body.endswith(')'):
+        body = body[1:-1].strip()
+    return body, unit, qualifier
+
+def parse_numeric_column(texts, row_units=None):
+    """문자열 컬럼을 한꺼번에 파싱하여 (실수 배열, 단위 목록, 상태 목록) 반환
+    
+    row_units를 주면 값에 단위가 없는 행은 해당 행의 단위(정규화)를 사용한다.
+    """
+    parsed = [parse_numeric(text) for text in texts]
+    values = array('d', [value for value, _, _ in parsed])
+    statuses = [status for _, _, status in parsed]
+    if row_units is None:
+        units = [unit for _, unit, _ in parsed]
+    else:
+        units = [unit or normalize_unit(row_unit) for (_, unit, _), row_unit in zip(parsed, row_units)]
+    return values, units, statuses
+
+def numeric_columns(data, field):
+    """RowStore는 보관된 파싱 컬럼을, 행 딕셔너리 목록은 즉석 파싱 결과를 (수치, 단위, 상태)로 반환"""
+    if hasattr(data, 'numeric_columns'):
+        return data.numeric_columns(field)
+    row_units = [row.get('단위', '') for row in data] if field in ROW_UNIT_FIELDS else None
+    return parse_numeric_column([row.get(field, '') for row in data], row_units)
+
+def value_key(field):
+    return f'{field}값'
+
+def unit_key(field):
+    return f'{field}단위'
+
+def status_key(field):
+    return f'{field}상태'
+
+def typed_value(row, field):
+    """행 딕셔너리(파싱 컬럼이 있으면 그 값, 없으면 즉석 파싱)에서 (수치, 단위, 상태)"""
+    if status_key(field) in row:
+        return row[value_key(field)], row[unit_key(field)], row[status_key(field)]
+    value, unit, status = parse_numeric(row.get(field, ''))
+    if not unit and field in ROW_UNIT_FIELDS:
+        unit = normalize_unit(row.get('단위', ''))
+    return value, unit, status
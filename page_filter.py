@@ -0,0 +1,35 @@
+"""테이블 추출 전 페이지 사전 필터
+
+page.extract_tables()는 선 병합·교차점 계산·셀 텍스트 추출까지 수행하므로 비싸다.
+배출 테이블은 detect_table_structure가 보는 헤더 키워드 중 하나를 반드시 포함하므로,
+페이지 문자에 키워드가 전혀 없으면 그 페이지에서는 행이 추출될 수 없다.
+page.chars는 extract_tables도 사용하는 캐시된 객체라 통과한 페이지에는 추가 비용이 거의 없다.
+"""
+
+# detect_table_structure / 헤더 탐색이 사용하는 키워드
+PAGE_KEYWORDS = ('배출구', '물질명', '농도', '배출량')
+
+# page_info에 기록되는 사전 필터 결과
+FILTER_KEPT = '통과'
+FILTER_SKIPPED = '건너뜀'
+FILTER_DISABLED = '미적용'
+
+def _has_ruled_grid(page):
+    """선/사각형 객체가 있어 괘선 테이블일 가능성이 있는지"""
+    return bool(page.rects or page.lines)
+
+def check_page(page, keywords=PAGE_KEYWORDS):
+    """페이지가 배출 테이블 후보인지 판별하여 (통과 여부, 사유) 반환 (keywords는 추출 프로파일의 헤더 키워드)"""
+    page_text = ''.join(char['text'] for char in page.chars)
+    if not page_text:
+        return False, '텍스트 없음'
+    
+    if any(keyword in page_text for keyword in keywords):
+        return True, '키워드'
+    
+    # 문자 그리기 순서가 뒤섞인 PDF 대비: 키워드 글자가 모두 있고 괘선이 있으면 보수적으로 통과
+    page_chars = set(page_text)
+    if _has_ruled_grid(page) and any(set(keyword) <= page_chars for keyword in keywords):
+        return True, '괘선+키워드 글자'
+    
+    return False, '키워드 없음'
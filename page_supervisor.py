@@ -0,0 +1,311 @@
+"""페이지 감시 추출: 페이지마다 시간·메모리 예산을 두고, 끝난 페이지는 체크포인트에 남겨 이어서 처리
+
+깨진 스캔 페이지나 선이 수만 개인 도면 페이지에서는 page.extract_tables()가 몇 시간씩 돌거나 메모리를
+끝없이 쓰기도 한다. 같은 프로세스 안에서는 이를 끊을 방법이 없어 문서 전체가 멈추고, 중간에 작업이
+죽으면 앞서 끝낸 페이지까지 처음부터 다시 파싱해야 한다. 여기서는
+    - 페이지 파싱을 워커 프로세스 하나에서 차례로 실행하고, 호출한 쪽(감시자)이 페이지마다 경과 시간과
+      워커 메모리를 확인한다. 예산을 넘으면 워커를 종료하고 그 페이지를 '건너뜀'으로 기록한 뒤
+      다음 페이지부터 새 워커로 이어 간다. 페이지에서 예외가 나거나 워커가 비정상 종료하면 '실패'로 기록한다.
+    - 끝난 페이지 항목은 그때마다 체크포인트 파일에 덧붙여 쓴다. 체크포인트는 PDF 내용 해시·옵션·
+      파서 버전으로 구분하므로, 중단된 뒤 같은 파일을 같은 옵션으로 다시 처리하면 남은 페이지만 처리한다.
+    - 페이지 항목의 '처리상태'(완료/건너뜀/실패)와 '처리사유'는 page_info(페이지별 처리 현황)에 그대로 남는다.
+      모든 페이지가 완료되면 체크포인트를 지우고, 건너뜀·실패 페이지가 있으면 남겨 둔다
+      (다시 실행해도 그 페이지는 다시 시도하지 않는다. retry_failed=True이면 다시 시도).
+
+환경변수
+    EMISSION_PAGE_TIMEOUT      페이지 하나의 시간 예산 (초, 0이면 끔, 기본 120)
+    EMISSION_PAGE_MEMORY_MB    워커 프로세스 메모리 예산 (파일 매핑 제외, 0이면 끔, 기본 2048)
+    EMISSION_CHECKPOINT_DIR    체크포인트 위치 (기본 ~/.cache/emission-extractor/checkpoints)
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import time
+
+from extraction_profiles import PROFILE_AUTO, PROFILE_DEFAULT, detect_profile, get_profile
+from pdf_extractor import (
+    EXTRACT_TIME_KEY, PAGE_REASON_KEY, PAGE_STATUS_KEY, PARSER_VERSION, _spool_to_path, build_rows_from_tables,
+    parse_page_tables, release_page
+)
+from pdf_io import MB, current_memory_bytes, file_sha256, open_pdf
+
+DEFAULT_PAGE_TIMEOUT = float(os.environ.get("EMISSION_PAGE_TIMEOUT", "120"))
+DEFAULT_PAGE_MEMORY_BYTES = int(os.environ.get("EMISSION_PAGE_MEMORY_MB", "2048")) * MB or None
+DEFAULT_CHECKPOINT_DIR = os.environ.get(
+    "EMISSION_CHECKPOINT_DIR", os.path.join(os.path.expanduser("~"), ".cache", "emission-extractor", "checkpoints")
+)
+CHECKPOINT_SUFFIX = '.ckpt'
+CHECKPOINT_MAX_AGE = 7 * 24 * 3600  # 이보다 오래 갱신되지 않은 체크포인트는 정리 (초)
+WORKER_START_TIMEOUT = 120          # 워커가 PDF를 열고 첫 페이지를 시작할 때까지 기다리는 시간 (초)
+POLL_INTERVAL = 0.2
+
+PAGE_DONE = '완료'
+PAGE_SKIPPED = '건너뜀'
+PAGE_FAILED = '실패'
+
+# 워커 → 감시자 메시지 종류
+MSG_START = 'start'
+MSG_PAGE = 'page'
+MSG_ERROR = 'error'
+MSG_DONE = 'done'
+
+class SupervisedExtractionError(RuntimeError):
+    """PDF를 열지 못하는 등 페이지 단위로 처리할 수 없는 문서"""
+
+class PageSupervision:
+    """페이지 감시 설정 (page_timeout/page_memory_bytes/checkpoint_dir이 None이나 0이면 해당 기능을 끔)"""
+    
+    def __init__(self, page_timeout=DEFAULT_PAGE_TIMEOUT, page_memory_bytes=DEFAULT_PAGE_MEMORY_BYTES,
+                 checkpoint_dir=DEFAULT_CHECKPOINT_DIR, retry_failed=False):
+        self.page_timeout = page_timeout
+        self.page_memory_bytes = page_memory_bytes
+        self.checkpoint_dir = checkpoint_dir
+        self.retry_failed = retry_failed
+    
+    def __repr__(self):
+        return (
+            f"PageSupervision(page_timeout={self.page_timeout!r}, page_memory_bytes={self.page_memory_bytes!r}, "
+            f"checkpoint_dir={self.checkpoint_dir!r}, retry_failed={self.retry_failed!r})"
+        )
+
+def unfinished_page_entry(page_num, status, reason, profile, elapsed):
+    """건너뜀/실패 페이지의 항목 (테이블 없음)"""
+    return {
+        '페이지': page_num, '테이블목록': [], '사전필터': '', '필터사유': '', '프로파일': profile,
+        EXTRACT_TIME_KEY: round(elapsed, 4), PAGE_STATUS_KEY: status, PAGE_REASON_KEY: reason
+    }
+
+def unfinished_pages(pages):
+    """페이지 항목 또는 page_info 목록 중 완료되지 않은(건너뜀/실패) 것 (감시 없이 처리한 결과는 모두 완료)"""
+    return [page for page in pages if page.get(PAGE_STATUS_KEY, PAGE_DONE) != PAGE_DONE]
+
+def has_unfinished_checkpoint(pdf_file, strict=False, profile=PROFILE_DEFAULT, checkpoint_dir=DEFAULT_CHECKPOINT_DIR):
+    """같은 PDF·옵션의 체크포인트에 건너뜀·실패 페이지가 남아 있는지 (다시 시도할 페이지가 있는 문서인지)"""
+    if not checkpoint_dir:
+        return False
+    if profile == PROFILE_AUTO:
+        with open_pdf(pdf_file) as pdf:
+            profile = detect_profile(pdf)
+    checkpoint = PageCheckpoint.for_document(checkpoint_dir, pdf_file, strict, profile)
+    return bool(unfinished_pages(checkpoint.load().values()))
+
+def _remove_stale_checkpoints(checkpoint_dir, max_age=CHECKPOINT_MAX_AGE):
+    now = time.time()
+    for name in os.listdir(checkpoint_dir):
+        if not name.endswith(CHECKPOINT_SUFFIX):
+            continue
+        path = os.path.join(checkpoint_dir, name)
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                os.remove(path)
+        except OSError:
+            pass
+
+class PageCheckpoint:
+    """끝난 페이지 항목을 하나씩 덧붙여 쓰는 체크포인트 파일 (pickle 스트림)
+    
+    페이지마다 파일을 열어 항목 하나를 쓰고 닫으므로 작업이 도중에 죽어도 앞 페이지는 남는다.
+    마지막 항목을 쓰다 말았으면 읽을 때 그 앞까지만 쓰고 파일도 거기까지 잘라 낸다.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+    
+    @classmethod
+    def for_document(cls, checkpoint_dir, pdf_file, strict, profile):
+        """PDF 내용 해시 + 옵션 + 파서 버전으로 구분한 체크포인트 (오래된 체크포인트는 정리)"""
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        _remove_stale_checkpoints(checkpoint_dir)
+        key_source = json.dumps({
+            "version": PARSER_VERSION,
+            "pdf": file_sha256(pdf_file),
+            "options": {"strict": strict, "profile": profile},
+        }, sort_keys=True, ensure_ascii=False)
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return cls(os.path.join(checkpoint_dir, f"{key}{CHECKPOINT_SUFFIX}"))
+    
+    def load(self, retry_unfinished=False):
+        """저장된 페이지 항목 {페이지 번호: 항목} (retry_unfinished이면 건너뜀/실패 페이지는 빼고 반환)"""
+        pages = {}
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return pages
+        
+        with f:
+            valid_size = 0
+            while True:
+                try:
+                    page_entry = pickle.load(f)
+                except Exception:  # 파일 끝 또는 쓰다 만 마지막 항목
+                    break
+                pages[page_entry['페이지']] = page_entry
+                valid_size = f.tell()
+            truncated = valid_size < os.fstat(f.fileno()).st_size
+        if truncated:
+            os.truncate(self.path, valid_size)
+        
+        if retry_unfinished:
+            unfinished = {page_entry['페이지'] for page_entry in unfinished_pages(pages.values())}
+            pages = {page_num: page_entry for page_num, page_entry in pages.items() if page_num not in unfinished}
+        return pages
+    
+    def append(self, page_entry):
+        with open(self.path, "ab") as f:
+            pickle.dump(page_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def _page_worker(pdf_path, page_numbers, strict, profile, connection):
+    """워커 프로세스: page_numbers의 페이지를 차례로 파싱하며 시작과 결과를 감시자에게 보냄"""
+    try:
+        try:
+            with open_pdf(pdf_path) as pdf:
+                for page_num in page_numbers:
+                    connection.send((MSG_START, page_num))
+                    started = time.perf_counter()
+                    page = pdf.pages[page_num - 1]
+                    try:
+                        page_entry = parse_page_tables(page, page_num, strict=strict, profile=profile)
+                        page_entry[PAGE_STATUS_KEY], page_entry[PAGE_REASON_KEY] = PAGE_DONE, ''
+                    except Exception as e:
+                        page_entry = unfinished_page_entry(
+                            page_num, PAGE_FAILED, f"{type(e).__name__}: {e}", profile, time.perf_counter() - started
+                        )
+                    release_page(page)
+                    connection.send((MSG_PAGE, page_entry))
+        except Exception as e:
+            connection.send((MSG_ERROR, f"{type(e).__name__}: {e}"))
+        else:
+            connection.send((MSG_DONE,))
+    except (BrokenPipeError, ConnectionResetError):  # 감시자가 먼저 종료됨
+        pass
+    finally:
+        connection.close()
+
+def _watch_worker(process, receiver, page_numbers, supervision):
+    """워커 하나를 감시하며 끝난 페이지 항목을 yield
+    
+    워커가 모든 페이지를 끝내면 None을, 도중에 멈췄으면 (페이지 번호, 상태, 사유, 경과 시간)을 반환한다.
+    첫 페이지를 시작하기도 전에 멈췄으면 페이지 번호는 None이다.
+    """
+    current, done, started = None, 0, time.monotonic()
+    while True:
+        if receiver.poll(POLL_INTERVAL):
+            try:
+                message = receiver.recv()
+            except EOFError:  # 메시지 없이 종료 (세그폴트, 운영체제의 강제 종료 등)
+                process.join()
+                reason = f"워커 프로세스 비정상 종료 (종료 코드 {process.exitcode})"
+                return current, PAGE_FAILED, reason, time.monotonic() - started
+            
+            kind = message[0]
+            if kind == MSG_START:
+                current, started = message[1], time.monotonic()
+            elif kind == MSG_PAGE:
+                done += 1
+                yield message[1]
+                # 다음 페이지 시작 전에 멈추면 그 페이지 탓으로 본다
+                current = page_numbers[done] if done < len(page_numbers) else None
+                started = time.monotonic()
+            elif kind == MSG_ERROR:
+                return current, PAGE_FAILED, message[1], time.monotonic() - started
+            else:
+                return None
+            continue
+        
+        elapsed = time.monotonic() - started
+        timeout = supervision.page_timeout if current is not None else WORKER_START_TIMEOUT
+        if timeout and elapsed > timeout:
+            return current, PAGE_SKIPPED, f"시간 초과 ({timeout:g}초)", elapsed
+        
+        limit = supervision.page_memory_bytes
+        usage = current_memory_bytes(process.pid) if limit and current is not None else None
+        if usage is not None and usage > limit:
+            return current, PAGE_SKIPPED, f"메모리 초과 ({usage / MB:,.0f}MB > {limit / MB:,.0f}MB)", elapsed
+
+def _supervise_pages(pdf_path, page_numbers, strict, profile, supervision):
+    """page_numbers를 워커 프로세스에서 파싱하여 페이지 항목을 페이지 순서대로 yield
+    
+    워커가 페이지 하나에서 멈추면 워커를 종료하고 그 페이지의 건너뜀/실패 항목을 yield한 뒤
+    다음 페이지부터 새 워커로 이어 간다.
+    """
+    context = multiprocessing.get_context('spawn')
+    remaining = list(page_numbers)
+    while remaining:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_page_worker, args=(pdf_path, remaining, strict, profile, sender), daemon=True
+        )
+        process.start()
+        sender.close()
+        try:
+            stopped = yield from _watch_worker(process, receiver, remaining, supervision)
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            receiver.close()
+        
+        if stopped is None:
+            return
+        page_num, status, reason, elapsed = stopped
+        if page_num is None:
+            raise SupervisedExtractionError(f"PDF를 처리할 수 없습니다: {reason}")
+        yield unfinished_page_entry(page_num, status, reason, profile, elapsed)
+        remaining = remaining[remaining.index(page_num) + 1:]
+
+def parse_pdf_tables_supervised(pdf_file, progress_callback=None, strict=False, profile=PROFILE_DEFAULT,
+                                supervision=None):
+    """1단계(페이지 감시): pdf_extractor.parse_pdf_tables와 같은 페이지 항목 목록을 반환
+    
+    항목마다 PAGE_STATUS_KEY(완료/건너뜀/실패)와 PAGE_REASON_KEY가 붙는다. 건너뜀·실패 페이지는
+    테이블 없이 기록되므로 나머지 페이지의 결과는 그대로 쓸 수 있다.
+    supervision.checkpoint_dir이 있으면 같은 PDF·옵션의 체크포인트에 남은 페이지부터 이어서 처리하며,
+    progress_callback(처리된 페이지 수, 전체 페이지 수)의 처리된 페이지 수에는 체크포인트의 페이지도 포함된다.
+    """
+    supervision = supervision or PageSupervision()
+    get_profile(None if profile == PROFILE_AUTO else profile)  # 알 수 없는 이름이면 워커 시작 전에 오류
+    
+    checkpoint = None
+    pages = {}
+    pdf_path, tmp_path = _spool_to_path(pdf_file)
+    try:
+        with open_pdf(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            if profile == PROFILE_AUTO:
+                profile = detect_profile(pdf)
+        
+        if supervision.checkpoint_dir:
+            checkpoint = PageCheckpoint.for_document(supervision.checkpoint_dir, pdf_path, strict, profile)
+            pages = checkpoint.load(retry_unfinished=supervision.retry_failed)
+            if progress_callback and pages:
+                progress_callback(len(pages), total_pages)
+        
+        pending = [page_num for page_num in range(1, total_pages + 1) if page_num not in pages]
+        for page_entry in _supervise_pages(pdf_path, pending, strict, profile, supervision):
+            pages[page_entry['페이지']] = page_entry
+            if checkpoint:
+                checkpoint.append(page_entry)
+            if progress_callback:
+                progress_callback(len(pages), total_pages)
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+    
+    parsed_pages = [pages[page_num] for page_num in sorted(pages)]
+    if checkpoint and not unfinished_pages(parsed_pages):
+        checkpoint.remove()
+    return parsed_pages
+
+def extract_table_from_pdf_supervised(pdf_file, selected_outlets=['#A', '#B', '#C'], progress_callback=None,
+                                      strict=False, profile=PROFILE_DEFAULT, supervision=None):
+    """페이지 감시로 1단계를 실행하고 2단계(배출구 필터링)를 적용 (반환값은 extract_table_from_pdf와 같음)"""
+    parsed_pages = parse_pdf_tables_supervised(pdf_file, progress_callback, strict, profile, supervision)
+    return build_rows_from_tables(parsed_pages, selected_outlets)
@@ -0,0 +1,542 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+
+from extraction_profiles import PROFILE_AUTO, PROFILE_DEFAULT, detect_profile, get_profile
+from header_mapping import BASIS_FIELDS, compile_header_map, match_outlet_number
+from pdf_io import MEMORY_WAIT_TIMEOUT, available_cpus, flush_document_cache, open_pdf, wait_for_memory
+from page_filter import FILTER_DISABLED, FILTER_KEPT, FILTER_SKIPPED, check_page
+from row_store import RowStore
+from standards import basis_filename
+
+# 파싱 로직 버전 (추출 결과가 달라지는 변경 시 올려서 결과 캐시를 무효화)
+PARSER_VERSION = 3
+
+# 병렬 추출 설정
+DEFAULT_WORKERS = available_cpus()
+# 이보다 페이지가 적은 문서는 워커 기동(spawn, 모듈 import, PDF 다시 열기) 비용이 병렬 이득보다 커서 순차 처리
+# benchmarks/bench_workers.py 측정(페이지당 0.1초, 기동 비용 3~6초)의 예상 분기점은 CPU 4개 63~76쪽,
+# CPU 2개 95~114쪽이다. CPU 4개에서는 확실히 이득이고 CPU 2개에서는 손익이 비슷한 값 (baselines.json의 '병렬분기점')
+MIN_PARALLEL_PAGES = 96
+MIN_PAGES_PER_WORKER = 16  # 워커 하나가 맡는 최소 페이지 수 (워커 수 상한)
+MIN_PAGE_CHUNKS = 10      # 워커가 적어도 진행률이 이 정도 단계로 갱신되도록 나누는 최소 구간 수
+
+# 페이지별 처리 시간 키 (1단계: 사전필터 + page.extract_tables(), 2단계: 테이블 파싱)
+EXTRACT_TIME_KEY = '추출시간(초)'
+PARSE_TIME_KEY = '파싱시간(초)'
+PAGE_TIMING_KEYS = (EXTRACT_TIME_KEY, PARSE_TIME_KEY)
+
+# 페이지 감시(page_supervisor)로 처리했을 때만 기록되는 페이지 처리 상태와 사유
+PAGE_STATUS_KEY = '처리상태'
+PAGE_REASON_KEY = '처리사유'
+
+def detect_table_structure(table):
+    """테이블 구조를 분석하여 타입을 결정"""
+    if not table or len(table) < 2:
+        return "unknown"
+    
+    # 첫 번째 행에서 구조 분석
+    first_row = table[0] if table[0] else []
+    second_row = table[1] if len(table) > 1 and table[1] else []
+    
+    # 헤더 키워드 확인
+    header_text = ' '.join([str(cell) for cell in first_row + second_row if cell])
+    
+    if any(keyword in header_text for keyword in ['배출구', '물질명', '농도', '배출량']):
+        if '최대배출기준' in header_text or '허가배출기준' in header_text:
+            return "emission_standards"  # 배출기준 테이블
+        else:
+            return "emission_data"  # 기본 배출 데이터 테이블
+    elif '허가조건' in header_text or '조건' in header_text:
+        return "permit_conditions"  # 허가조건 테이블
+    else:
+        return "general"  # 일반 테이블
+
+def extract_complex_table_data(table, table_type, page_num, table_idx):
+    """복잡한 테이블 구조에서 데이터 추출"""
+    extracted_data = []
+    
+    if table_type == "emission_standards":
+        # 배출기준 테이블 처리
+        header_row_idx = None
+        
+        # 헤더 찾기 (복합 헤더 고려)
+        for i, row in enumerate(table):
+            if row and any(cell and ('배출구' in str(cell) or '물질명' in str(cell)) for cell in row):
+                header_row_idx = i
+                break
+        
+        if header_row_idx is not None:
+            # 복합 헤더 처리
+            headers = []
+            if header_row_idx + 1 < len(table):
+                # 두 행으로 구성된 헤더인지 확인
+                main_headers = table[header_row_idx]
+                sub_headers = table[header_row_idx + 1] if header_row_idx + 1 < len(table) else []
+                
+                for i, main_header in enumerate(main_headers):
+                    if main_header:
+                        headers.append(str(main_header))
+                    elif i < len(sub_headers) and sub_headers[i]:
+                        headers.append(str(sub_headers[i]))
+                    else:
+                        headers.append(f"컬럼{i+1}")
+                
+                # 데이터 행 처리
+                data_start_idx = header_row_idx + 2 if sub_headers else header_row_idx + 1
+                
+                for row_idx in range(data_start_idx, len(table)):
+                    row = table[row_idx]
+                    if row and any(cell for cell in row):
+                        # 배출구 번호 확인
+                        first_cell = str(row[0]) if row[0] else ""
+                        if first_cell.startswith('#') or any(char.isalpha() for char in first_cell):
+                            row_data = {
+                                '페이지': page_num,
+                                '테이블': table_idx + 1,
+                                '테이블타입': table_type,
+                                '원본행': row,
+                                '헤더': headers
+                            }
+                            
+                            # 각 컬럼 데이터 매핑
+                            for col_idx, header in enumerate(headers):
+                                if col_idx < len(row):
+                                    value = str(row[col_idx]) if row[col_idx] is not None else ""
+                                    row_data[header] = value
+                            
+                            extracted_data.append(row_data)
+    
+    elif table_type == "emission_data":
+        # 기본 배출 데이터 테이블 처리
+        for i, row in enumerate(table):
+            if row and any(cell and ('배출구' in str(cell) or '#' in str(cell)) for cell in row):
+                # 데이터 행 처리
+                for data_row in table[i:]:
+                    if data_row and len(data_row) > 0:
+                        first_cell = str(data_row[0]) if data_row[0] else ""
+                        if first_cell.startswith('#'):
+                            row_data = {
+                                '페이지': page_num,
+                                '테이블': table_idx + 1,
+                                '테이블타입': table_type,
+                                '원본행': data_row
+                            }
+                            extracted_data.append(row_data)
+                break
+    
+    return extracted_data
+
+def parse_page_tables(page, page_num, strict=False, profile=PROFILE_DEFAULT):
+    """1단계: 페이지의 테이블을 추출하여 저장용 표현으로 변환 (배출구 선택과 무관)
+    
+    strict가 아니면 page_filter.check_page로 배출 테이블이 있을 수 없는 페이지를 먼저 걸러
+    page.extract_tables()를 생략한다. strict=True(감사용)는 모든 페이지를 추출한다.
+    profile(추출 프로파일 이름)의 헤더 키워드로 사전 필터를 하고 table_settings로 테이블을 찾는다.
+    페이지 처리에 걸린 시간을 EXTRACT_TIME_KEY로 함께 기록한다.
+    """
+    started = time.perf_counter()
+    settings = get_profile(profile)
+    page_tables = []
+    
+    if strict:
+        filter_result, filter_reason = FILTER_DISABLED, ''
+    else:
+        keep, filter_reason = check_page(page, settings.header_keywords)
+        if not keep:
+            return {
+                '페이지': page_num, '테이블목록': page_tables, '사전필터': FILTER_SKIPPED, '필터사유': filter_reason,
+                '프로파일': profile, EXTRACT_TIME_KEY: round(time.perf_counter() - started, 4)
+            }
+        filter_result = FILTER_KEPT
+    
+    # 테이블 추출
+    tables = page.extract_tables(settings.table_settings)
+    
+    if tables:
+        for table_idx, table in enumerate(tables):
+            if table and len(table) > 0:
+                page_tables.append({
+                    '테이블': table_idx + 1,
+                    '테이블타입': detect_table_structure(table),
+                    '셀': table
+                })
+    
+    return {
+        '페이지': page_num, '테이블목록': page_tables, '사전필터': filter_result, '필터사유': filter_reason,
+        '프로파일': profile, EXTRACT_TIME_KEY: round(time.perf_counter() - started, 4)
+    }
+
+def _resolve_composite_headers(main_headers, sub_headers):
+    """두 행으로 구성된 복합 헤더를 열별 헤더명 목록으로 변환 (빈 주 헤더는 서브헤더로 보완)"""
+    headers = []
+    for i, main_header in enumerate(main_headers):
+        if main_header:
+            headers.append(str(main_header))
+        elif i < len(sub_headers) and sub_headers[i]:
+            headers.append(str(sub_headers[i]))
+        else:
+            headers.append(f"컬럼{i+1}")
+    return headers
+
+def _map_row_fields(row_data, texts, header_map):
+    """compile_header_map 결과에 따라 행 값을 표준 필드에 매핑
+    
+    원본 헤더명 키는 RowStore가 원본 행에서 재구성하므로, 고정 키와 이름이 같은 경우
+    (원본 헤더명 값이 고정 필드 값을 덮어쓰는 경우)에만 기록한다.
+    """
+    for j, field, header_name in header_map:
+        if j < len(texts):
+            value = texts[j]
+            
+            if field in BASIS_FIELDS:
+                row_data[field] = process_emission_basis(value)
+            elif field == '비고':
+                # 비고에서 최대배출기준 관련 내용 제외
+                if value and '최대배출기준' not in value:
+                    row_data[field] = value
+            elif field:
+                row_data[field] = value
+            
+            # 원본 헤더명이 고정 키와 같으면 그 값으로 덮어씀
+            if header_name in row_data:
+                row_data[header_name] = value
+
+def parse_table(table, table_type, page_num, table_idx, selected_outlets):
+    """단일 패스 테이블 파서: 구조화 행(all_data)과 원시 행(raw_table_data)을 함께 생성
+    
+    extract_complex_table_data와 별도의 헤더 탐색·행 루프로 나뉘어 있던 두 번의 스캔을
+    하나로 합친 것으로, 행마다 셀 문자열 변환과 키워드 검사를 한 번만 수행한다.
+    table_type이 None이면 detect_table_structure로 판별한다.
+    두 결과 모두 RowStore로 반환된다.
+    결과는 regression/check_parser.py의 코퍼스로 기존 두 스캔과 같음을 확인한다.
+    """
+    if table_type is None:
+        table_type = detect_table_structure(table)
+    
+    rows = RowStore()
+    raw_rows = RowStore.raw()
+    
+    headers = None           # 구조화 행용 헤더 (배출구/물질명/농도가 처음 나오는 행)
+    header_map = ()          # [(열 번호, 표준 필드, 원본 헤더명)]
+    outlet_prefixes = tuple(selected_outlets)
+    standards_header_idx = None
+    standards_headers = None
+    data_section = False     # emission_data 원시 행 시작 여부
+    
+    # 원시 행 헤더 탐색이 필요한 테이블 타입인지
+    find_standards_header = table_type == "emission_standards"
+    find_data_section = table_type == "emission_data"
+    
+    for i, row in enumerate(table):
+        if not row:
+            if standards_header_idx is not None and i == standards_header_idx + 1:
+                standards_headers = _resolve_composite_headers(table[standards_header_idx], [])
+            continue
+        
+        # 셀 문자열 변환은 행당 한 번만 (헤더 탐색 중이거나 출력할 행일 때만)
+        first_cell = str(row[0]) if row[0] else ""
+        texts = None
+        row_text = None
+        if headers is None or find_standards_header or find_data_section:
+            texts = [str(cell) if cell is not None else "" for cell in row]
+            row_text = "\x00".join(texts)
+        
+        # 구조화 행: 헤더 행 탐색 후 선택된 배출구 타입으로 필터링
+        if headers is None:
+            if '배출구' in row_text or '물질명' in row_text or '농도' in row_text:
+                headers = row
+                header_map = compile_header_map(tuple(headers))
+        elif first_cell.startswith(outlet_prefixes):
+            for outlet_type in outlet_prefixes:
+                if first_cell.startswith(outlet_type):
+                    # 기본 데이터 구조
+                    row_data = {
+                        '페이지': page_num,
+                        '테이블': table_idx + 1,
+                        '테이블타입': table_type,
+                        '배출구타입': outlet_type,
+                        '배출구번호': match_outlet_number(first_cell),
+                        '원본배출구': first_cell,
+                        '물질명': '',
+                        '농도': '',
+                        '배출량': '',
+                        '최대배출기준': '',
+                        '허가배출기준': '',
+                        '최대배출기준근거': '',
+                        '허가배출기준근거': '',
+                        '비고': '',
+                        '단위': '',
+                        '원본행': row,
+                        '헤더': headers
+                    }
+                    if texts is None:
+                        texts = [str(cell) if cell is not None else "" for cell in row]
+                    _map_row_fields(row_data, texts, header_map)
+                    rows.append(row_data)
+                    break
+        
+        # 원시 행: 배출기준 테이블 (복합 헤더 고려)
+        if table_type == "emission_standards":
+            if standards_header_idx is None:
+                if '배출구' in row_text or '물질명' in row_text:
+                    standards_header_idx = i
+                    find_standards_header = False
+            elif i == standards_header_idx + 1:
+                standards_headers = _resolve_composite_headers(table[standards_header_idx], row)
+            elif any(cell for cell in row):
+                # 배출구 번호 확인
+                if first_cell.startswith('#') or any(char.isalpha() for char in first_cell):
+                    raw_data = {
+                        '페이지': page_num,
+                        '테이블': table_idx + 1,
+                        '테이블타입': table_type,
+                        '원본행': row,
+                        '헤더': standards_headers
+                    }
+                    if texts is None:
+                        texts = [str(cell) if cell is not None else "" for cell in row]
+                    # 원본 헤더명 키는 RowStore가 재구성 (고정 키와 같은 이름만 덮어씀)
+                    for col_idx, header in enumerate(standards_headers):
+                        if col_idx < len(texts) and header in raw_data:
+                            raw_data[header] = texts[col_idx]
+                    raw_rows.append(raw_data)
+        
+        # 원시 행: 기본 배출 데이터 테이블
+        elif table_type == "emission_data":
+            if not data_section and ('배출구' in row_text or '#' in row_text):
+                data_section = True
+                find_data_section = False
+            if data_section and first_cell.startswith('#'):
+                raw_rows.append({
+                    '페이지': page_num,
+                    '테이블': table_idx + 1,
+                    '테이블타입': table_type,
+                    '원본행': row
+                })
+    
+    return rows, raw_rows
+
+def extract_page_rows(page_entry, selected_outlets):
+    """2단계: 저장된 페이지 테이블에 배출구 필터링과 컬럼 매핑을 적용
+    
+    page_data와 page_raw_data는 RowStore로 반환된다. page_info에는 1단계에서 기록한 추출 시간과
+    이 단계의 파싱 시간이 들어간다 (시간은 실행마다 달라지므로 결과 비교에서는 PAGE_TIMING_KEYS를 제외).
+    """
+    started = time.perf_counter()
+    page_num = page_entry['페이지']
+    page_data = RowStore()
+    page_raw_data = RowStore.raw()
+    
+    for table_entry in page_entry['테이블목록']:
+        rows, raw_rows = parse_table(
+            table_entry['셀'], table_entry['테이블타입'], page_num, table_entry['테이블'] - 1, selected_outlets
+        )
+        page_data.extend(rows)
+        page_raw_data.extend(raw_rows)
+    
+    page_info = {
+        '페이지': page_num,
+        '테이블수': len(page_entry['테이블목록']),
+        '추출행수': len(page_data),
+        '원시데이터수': len(page_raw_data),
+        '사전필터': page_entry.get('사전필터', FILTER_DISABLED),
+        '필터사유': page_entry.get('필터사유', ''),
+        EXTRACT_TIME_KEY: page_entry.get(EXTRACT_TIME_KEY),
+        PARSE_TIME_KEY: round(time.perf_counter() - started, 4)
+    }
+    for key in ('프로파일', PAGE_STATUS_KEY, PAGE_REASON_KEY):
+        if key in page_entry:
+            page_info[key] = page_entry[key]
+    
+    return page_data, page_info, page_raw_data
+
+def build_rows_from_tables(parsed_pages, selected_outlets):
+    """2단계: parse_pdf_tables 결과로부터 (all_data, page_info, raw_table_data) 생성
+    
+    PDF를 다시 읽지 않으므로 배출구 선택이나 키워드 규칙만 바뀐 경우 이 단계만 재실행하면 된다.
+    all_data와 raw_table_data는 RowStore로 반환된다.
+    """
+    all_data = RowStore()
+    page_info = []
+    raw_table_data = RowStore.raw()
+    
+    for page_entry in parsed_pages:
+        page_data, info, page_raw_data = extract_page_rows(page_entry, selected_outlets)
+        all_data.extend(page_data)
+        page_info.append(info)
+        raw_table_data.extend(page_raw_data)
+    
+    return all_data, page_info, raw_table_data
+
+def release_page(page):
+    """처리가 끝난 페이지의 pdfplumber 캐시(문자/선/레이아웃 객체, 텍스트맵)와 pdfminer 객체 캐시 해제"""
+    if hasattr(page, 'close'):
+        page.close()
+    else:
+        page.flush_cache()
+    flush_document_cache(page.pdf)
+
+def iter_pdf_pages(pdf_file, progress_callback=None, start_page=1, end_page=None, strict=False, profile=PROFILE_DEFAULT):
+    """1단계 스트리밍: 페이지를 파싱하는 즉시 테이블 표현을 yield하고 페이지 캐시를 해제
+    
+    페이지 수와 관계없이 메모리 사용량이 일정하게 유지된다. 메모리 상한(pdf_io.MEMORY_LIMIT)을
+    넘은 상태이면 다음 페이지를 시작하기 전에 사용량이 내려갈 때까지 기다린다. 한 번 기다려도
+    내려가지 않으면(이 문서 자신이 메모리를 쥐고 있는 경우) 이후 페이지는 기다리지 않는다.
+    profile이 PROFILE_AUTO이면 앞쪽 페이지로 문서 형태를 감지하여 그 프로파일을 쓴다.
+    """
+    memory_wait = MEMORY_WAIT_TIMEOUT
+    with open_pdf(pdf_file) as pdf:
+        total_pages = len(pdf.pages)
+        end_page = total_pages if end_page is None else min(end_page, total_pages)
+        if profile == PROFILE_AUTO:
+            profile = detect_profile(pdf)
+        
+        for page_num in range(start_page, end_page + 1):
+            if memory_wait and wait_for_memory(timeout=memory_wait) >= memory_wait:
+                memory_wait = 0
+            page = pdf.pages[page_num - 1]
+            page_entry = parse_page_tables(page, page_num, strict=strict, profile=profile)
+            release_page(page)
+            
+            # 진행률 표시
+            if progress_callback:
+                progress_callback(page_num, total_pages)
+            
+            yield page_entry
+
+def iter_extracted_pages(pdf_file, selected_outlets=['#A', '#B', '#C'], progress_callback=None, strict=False,
+                         profile=PROFILE_DEFAULT):
+    """스트리밍 추출: 페이지가 끝날 때마다 (page_data, page_info, page_raw_data)를 yield
+    
+    extract_table_from_pdf와 같은 행을 페이지 순서대로 돌려주므로, 검증·내보내기 등
+    후속 처리를 뒤 페이지의 파싱이 끝나기 전에 시작할 수 있다.
+    """
+    for page_entry in iter_pdf_pages(pdf_file, progress_callback, strict=strict, profile=profile):
+        yield extract_page_rows(page_entry, selected_outlets)
+
+def _parse_page_range(pdf_path, start_page, end_page, strict, profile):
+    """워커 프로세스: 파일을 직접 열어 [start_page, end_page] 범위의 테이블을 추출"""
+    return start_page, list(iter_pdf_pages(
+        pdf_path, start_page=start_page, end_page=end_page, strict=strict, profile=profile
+    ))
+
+def _split_page_ranges(total_pages, workers):
+    """페이지 범위를 워커 수에 맞춰 연속 구간으로 분할 (부하 분산을 위해 워커당 여러 구간)"""
+    chunk_count = min(total_pages, max(workers * 4, MIN_PAGE_CHUNKS))
+    chunk_size, remainder = divmod(total_pages, chunk_count)
+    
+    ranges = []
+    start = 1
+    for i in range(chunk_count):
+        end = start + chunk_size - 1 + (1 if i < remainder else 0)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+def _spool_to_path(pdf_file):
+    """워커가 직접 열 수 있도록 파일 경로를 반환 (업로드 객체는 임시 파일로 저장)"""
+    if isinstance(pdf_file, (str, os.PathLike)):
+        return os.fspath(pdf_file), None
+    
+    tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    with tmp:
+        if hasattr(pdf_file, "seek"):
+            pdf_file.seek(0)
+        shutil.copyfileobj(pdf_file, tmp)
+    if hasattr(pdf_file, "seek"):
+        pdf_file.seek(0)
+    return tmp.name, tmp.name
+
+def _parse_serial(pdf_file, progress_callback, strict, profile):
+    """모든 페이지를 현재 프로세스에서 순서대로 파싱"""
+    return list(iter_pdf_pages(pdf_file, progress_callback, strict=strict, profile=profile))
+
+def _parse_parallel(pdf_path, total_pages, workers, progress_callback, strict, profile):
+    """페이지 구간을 워커 프로세스에 분배하여 파싱한 뒤 페이지 순서대로 병합"""
+    ranges = _split_page_ranges(total_pages, workers)
+    results = {}
+    done_pages = 0
+    
+    # 서버 스레드를 fork하지 않도록 spawn 컨텍스트 사용
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(_parse_page_range, pdf_path, start, end, strict, profile): (start, end)
+            for start, end in ranges
+        }
+        for future in as_completed(futures):
+            start, end = futures[future]
+            results[start] = future.result()[1]
+            
+            done_pages += end - start + 1
+            if progress_callback:
+                progress_callback(done_pages, total_pages)
+    
+    parsed_pages = []
+    for start in sorted(results):
+        parsed_pages.extend(results[start])
+    
+    return parsed_pages
+
+def parse_pdf_tables(pdf_file, workers=1, progress_callback=None, strict=False, isolate=False, profile=PROFILE_DEFAULT):
+    """1단계: PDF의 모든 페이지를 한 번 파싱하여 페이지별 테이블 표현 목록을 반환
+    
+    각 항목은 {'페이지', '테이블목록': [{'테이블', '테이블타입', '셀'}]} 형태이다.
+    workers가 2 이상이면 페이지 범위를 워커 프로세스에 나누어 병렬로 파싱하며,
+    결과는 순차 처리와 동일한 페이지 순서로 병합된다. 워커 수는 실제로 쓸 수 있는 CPU 수(available_cpus)를
+    넘지 않으며, MIN_PARALLEL_PAGES보다 작은 문서는 workers와 상관없이 순차 처리한다.
+    progress_callback(처리된 페이지 수, 전체 페이지 수)로 진행률을 전달한다.
+    strict=True이면 페이지 사전 필터를 끄고 모든 페이지에서 테이블을 추출한다.
+    isolate=True이면 workers가 1이어도 워커 프로세스 하나에서 파싱한다. 여러 문서를 스레드로
+    동시에 처리할 때 GIL 경합 없이 문서별로 CPU를 따로 쓰기 위한 것이다.
+    profile은 추출 프로파일 이름이며, PROFILE_AUTO이면 앞쪽 페이지로 형태를 한 번 감지하여
+    모든 페이지(병렬이면 모든 워커)에 같은 프로파일을 쓴다. 쓰인 프로파일은 페이지 항목의 '프로파일'에 남는다.
+    """
+    if workers is None:
+        workers = DEFAULT_WORKERS
+    workers = min(workers, available_cpus())
+    
+    get_profile(None if profile == PROFILE_AUTO else profile)  # 알 수 없는 이름이면 워커 시작 전에 오류
+    
+    if workers <= 1 and not isolate:
+        return _parse_serial(pdf_file, progress_callback, strict, profile)
+    
+    pdf_path, tmp_path = _spool_to_path(pdf_file)
+    try:
+        with open_pdf(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            if profile == PROFILE_AUTO:
+                profile = detect_profile(pdf)
+        
+        if total_pages < MIN_PARALLEL_PAGES:
+            return _parse_serial(pdf_path, progress_callback, strict, profile)
+        workers = min(max(workers, 1), total_pages // MIN_PAGES_PER_WORKER)
+        if workers < 1 or (workers == 1 and not isolate):
+            return _parse_serial(pdf_path, progress_callback, strict, profile)
+        
+        return _parse_parallel(pdf_path, total_pages, workers, progress_callback, strict, profile)
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+
+def extract_table_from_pdf(pdf_file, selected_outlets=['#A', '#B', '#C'], workers=1, progress_callback=None, strict=False,
+                           isolate=False, profile=PROFILE_DEFAULT):
+    """PDF에서 배출구 데이터를 추출하는 함수 (개선됨)
+    
+    parse_pdf_tables(1단계)와 build_rows_from_tables(2단계)를 차례로 실행한다.
+    """
+    parsed_pages = parse_pdf_tables(
+        pdf_file, workers=workers, progress_callback=progress_callback, strict=strict, isolate=isolate, profile=profile
+    )
+    return build_rows_from_tables(parsed_pages, selected_outlets)
+
+def process_emission_basis(basis_text):
+    """배출기준 근거 처리 함수 (같은 문구는 한 번만 판정하도록 standards.basis_filename에 위임)"""
+    if not basis_text:
+        return ""
+    
+    return basis_filename(str(basis_text))
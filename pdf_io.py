@@ -0,0 +1,253 @@
+"""PDF 입력 계층: 업로드 스풀링, 경로로 열기(mmap), 문서 객체 캐시 해제, 메모리 상한 대기, 내용 해시
+
+수백 MB~1GB 스캔 문서를 처리할 때 메모리 사용량을 일정하게 유지하기 위한 것이다.
+    - 큰 업로드는 메모리에 복사하지 않고 임시 파일로 옮긴 뒤 경로로 처리한다 (SpooledUpload).
+    - 경로로 여는 PDF는 가능하면 mmap으로 읽는다 (open_pdf). 파일 내용은 커널 페이지 캐시에만
+      올라가므로 메모리가 부족하면 커널이 회수할 수 있다.
+    - pdfminer는 한 번 읽은 PDF 객체(스캔 이미지 스트림 포함)를 문서가 닫힐 때까지 보관하므로,
+      페이지 처리가 끝날 때마다 비운다 (flush_document_cache).
+    - 메모리 상한을 넘으면 새 작업·새 페이지를 시작하기 전에 사용량이 내려갈 때까지 기다린다
+      (wait_for_memory). 동시에 처리 중인 다른 문서가 끝나며 메모리를 돌려줄 시간을 준다.
+
+환경변수
+    EMISSION_SPOOL_THRESHOLD_MB  이보다 큰 업로드는 임시 파일로 스풀 (기본 16)
+    EMISSION_SPOOL_DIR           스풀 임시 파일 위치 (기본: 시스템 임시 디렉토리)
+    EMISSION_MEMORY_LIMIT_MB     프로세스 메모리 상한 (파일 매핑 제외, 0이면 끔, 미지정 시 컨테이너 메모리 한도의 80%)
+"""
+import ctypes
+import ctypes.util
+import gc
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from io import BytesIO
+
+import pdfplumber
+
+MB = 1024 * 1024
+COPY_CHUNK_SIZE = 1 * MB
+HASH_CHUNK_SIZE = 1 * MB
+
+SPOOL_THRESHOLD_BYTES = int(os.environ.get("EMISSION_SPOOL_THRESHOLD_MB", "16")) * MB
+SPOOL_DIR = os.environ.get("EMISSION_SPOOL_DIR") or None
+
+CGROUP_LIMIT_SHARE = 0.8   # 메모리 상한 미지정 시 컨테이너 한도 중 사용할 비율
+MEMORY_WAIT_TIMEOUT = 60   # 상한을 넘었을 때 최대 대기 시간 (초, 지나면 그대로 진행)
+MEMORY_POLL_INTERVAL = 0.5
+
+# cgroup v2, v1 순서로 조회하는 컨테이너 메모리 한도 파일
+CGROUP_LIMIT_FILES = ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes')
+CGROUP_UNLIMITED = 1 << 60  # v1은 한도가 없으면 매우 큰 값을 돌려줌
+# cgroup v2, v1 순서로 조회하는 CPU 할당량 파일 ((할당량, 주기) 마이크로초)
+CGROUP_CPU_FILES = (('/sys/fs/cgroup/cpu.max',), ('/sys/fs/cgroup/cpu/cpu.cfs_quota_us', '/sys/fs/cgroup/cpu/cpu.cfs_period_us'))
+
+def current_memory_bytes(pid='self'):
+    """프로세스(기본: 현재 프로세스)의 메모리 사용량 (바이트, /proc이 없거나 프로세스가 끝났으면 None)
+    
+    RSS에서 파일 매핑을 뺀 값이다. mmap으로 읽은 PDF 페이지는 RSS에 잡히지만 커널이 언제든
+    회수할 수 있으므로 상한 판단에서 제외한다.
+    """
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            fields = f.read().split()
+        resident_pages, shared_pages = int(fields[1]), int(fields[2])
+    except (OSError, IndexError, ValueError):
+        return None
+    return (resident_pages - shared_pages) * os.sysconf('SC_PAGE_SIZE')
+
+def cgroup_memory_limit():
+    """컨테이너(cgroup) 메모리 한도 (바이트, 없으면 None)"""
+    for path in CGROUP_LIMIT_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < CGROUP_UNLIMITED:
+            return int(value)
+        return None
+    return None
+
+def cgroup_cpu_limit():
+    """컨테이너(cgroup) CPU 할당량을 CPU 수로 (올림, 없으면 None)"""
+    for paths in CGROUP_CPU_FILES:
+        try:
+            values = []
+            for path in paths:
+                with open(path) as f:
+                    values += f.read().split()
+        except OSError:
+            continue
+        if len(values) == 2 and values[0].isdigit() and values[1].isdigit() and int(values[0]) > 0:
+            return max(1, -(-int(values[0]) // int(values[1])))
+        return None
+    return None
+
+def available_cpus():
+    """이 프로세스가 실제로 쓸 수 있는 CPU 수 (CPU 고정(affinity)과 컨테이너 CPU 할당량 반영)"""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # Windows, macOS
+        count = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return max(1, min(count, limit) if limit else count)
+
+def default_memory_limit():
+    """환경변수 EMISSION_MEMORY_LIMIT_MB, 없으면 컨테이너 한도의 80% (둘 다 없으면 None = 끔)"""
+    configured = os.environ.get("EMISSION_MEMORY_LIMIT_MB")
+    if configured is not None:
+        return int(configured) * MB or None
+    limit = cgroup_memory_limit()
+    return int(limit * CGROUP_LIMIT_SHARE) if limit else None
+
+MEMORY_LIMIT = default_memory_limit()
+
+def _load_malloc_trim():
+    """glibc malloc_trim (해제한 힙 메모리를 운영체제에 반환, 없으면 None)"""
+    name = ctypes.util.find_library('c')
+    if not name:
+        return None
+    try:
+        return ctypes.CDLL(name).malloc_trim
+    except (OSError, AttributeError):
+        return None
+
+_malloc_trim = _load_malloc_trim()
+
+def release_memory():
+    """순환 참조를 정리하고 해제된 힙을 운영체제에 반환 (사용량이 실제로 줄어들도록)"""
+    gc.collect()
+    if _malloc_trim is not None:
+        _malloc_trim(0)
+
+def wait_for_memory(limit=MEMORY_LIMIT, timeout=MEMORY_WAIT_TIMEOUT, on_wait=None):
+    """메모리 사용량이 limit 아래로 내려갈 때까지 대기하고 대기한 시간(초)을 반환
+    
+    먼저 release_memory로 스스로 줄여 보고, 그래도 넘으면 on_wait(사용량, limit)를 호출하며 기다린다.
+    timeout이 지나면 그대로 진행한다 (이 프로세스 자신이 메모리를 쥐고 있는 경우 무한 대기 방지).
+    """
+    if not limit:
+        return 0.0
+    usage = current_memory_bytes()
+    if usage is None or usage < limit:
+        return 0.0
+    
+    release_memory()
+    started = time.monotonic()
+    while True:
+        usage = current_memory_bytes()
+        waited = time.monotonic() - started
+        if usage is None or usage < limit or waited >= timeout:  # 사용량을 읽을 수 없으면 상한 없음으로 봄
+            return waited
+        if on_wait:
+            on_wait(usage, limit)
+        time.sleep(MEMORY_POLL_INTERVAL)
+        release_memory()
+
+def file_sha256(pdf_file):
+    """PDF 파일(경로 또는 파일 객체) 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    
+    if isinstance(pdf_file, (str, os.PathLike)):
+        with open(pdf_file, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    else:
+        pdf_file.seek(0)
+        for chunk in iter(lambda: pdf_file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        pdf_file.seek(0)
+    
+    return digest.hexdigest()
+
+def flush_document_cache(pdf):
+    """pdfminer 문서가 보관하는 파싱된 PDF 객체 캐시를 비움 (필요하면 파일에서 다시 읽음)"""
+    doc = getattr(pdf, 'doc', None)
+    for attr in ('_cached_objs', '_parsed_objs'):
+        cache = getattr(doc, attr, None)
+        if cache:
+            cache.clear()
+
+@contextmanager
+def open_pdf(pdf_file):
+    """pdfplumber로 PDF 열기: 경로는 mmap으로 읽고 (불가능하면 일반 파일), 파일 객체는 그대로 사용"""
+    if not isinstance(pdf_file, (str, os.PathLike)):
+        with pdfplumber.open(pdf_file) as pdf:
+            yield pdf
+        return
+    
+    with open(pdf_file, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # 빈 파일, mmap을 지원하지 않는 파일 시스템
+            mapped = None
+        try:
+            with pdfplumber.open(mapped if mapped is not None else f) as pdf:
+                yield pdf
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+def _upload_size(uploaded_file):
+    size = getattr(uploaded_file, 'size', None)
+    if size is not None:
+        return size
+    position = uploaded_file.tell()
+    size = uploaded_file.seek(0, os.SEEK_END)
+    uploaded_file.seek(position)
+    return size
+
+class SpooledUpload:
+    """작업 스레드에서 읽을 업로드 파일 사본
+    
+    threshold 이하이면 메모리(BytesIO)에, 넘으면 임시 파일에 나누어 복사한다.
+    source()는 처리 함수에 넘길 입력(임시 파일 경로 또는 BytesIO)을 돌려주며,
+    처리가 끝나면 cleanup()으로 임시 파일을 지운다.
+    """
+    
+    def __init__(self, uploaded_file, threshold=SPOOL_THRESHOLD_BYTES, spool_dir=SPOOL_DIR):
+        self.name = getattr(uploaded_file, 'name', 'upload.pdf')
+        self.size = _upload_size(uploaded_file)
+        self.path = None
+        self._content = None
+        
+        uploaded_file.seek(0)
+        if self.size > threshold:
+            tmp = tempfile.NamedTemporaryFile(prefix='emission-upload-', suffix='.pdf', dir=spool_dir, delete=False)
+            with tmp:
+                shutil.copyfileobj(uploaded_file, tmp, COPY_CHUNK_SIZE)
+            self.path = tmp.name
+        else:
+            self._content = uploaded_file.read()
+        uploaded_file.seek(0)
+    
+    @property
+    def spooled(self):
+        return self.path is not None
+    
+    def source(self):
+        """처리 함수에 넘길 입력 (스풀된 경우 경로, 아니면 이름이 붙은 BytesIO)"""
+        if self.path is not None:
+            return self.path
+        buffer = BytesIO(self._content)
+        buffer.name = self.name
+        return buffer
+    
+    def cleanup(self):
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+        self._content = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.cleanup()
@@ -0,0 +1,232 @@
+"""계획서/검토서 처리 파이프라인 (추출 → 배출기준 매칭 → 검증 → 비교 → 엑셀 생성)
+
+Streamlit 화면과 분리되어 있어 백그라운드 작업(jobs.JobManager)에서 그대로 실행할 수 있다.
+화면 갱신 대신 progress(진행률 0~1, 메시지[, part=문서]) 콜백으로 진행 상황을 알린다.
+
+계획서와 검토서는 비교 전까지 서로 독립이므로 문서마다 스레드 하나에서 추출·배출기준 매칭·검증을
+끝까지 진행하고, 두 문서가 모두 끝나면 비교와 엑셀 생성을 한다. 동시에 처리할 때는 PDF 파싱을
+워커 프로세스에서 실행하여(isolate) 두 문서가 GIL을 두고 경합하지 않게 한다. 쓸 수 있는 CPU가 하나뿐이면
+프로세스를 나눠도 이득이 없으므로 스레드에서 그대로 파싱한다 (작은 문서도 pdf_extractor가 순차 처리).
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from bulk_export import build_export_tables, bundle_zip
+from comparison import compare_plan_review
+from excel_export import create_standardized_excel
+from extraction_profiles import PROFILE_DEFAULT
+from extraction_cache import extract_table_from_pdf_cached
+from page_supervisor import extract_table_from_pdf_supervised, unfinished_pages
+from pdf_extractor import extract_table_from_pdf
+from pdf_io import available_cpus
+from preview import build_previews
+from profiling import NULL_PROFILER
+from row_store import RowStore
+from standards import attach_standards
+from validation import validate_data_accuracy
+
+PLAN_LABEL = '계획서'
+REVIEW_LABEL = '검토서'
+
+# 전체 진행률 중 PDF 추출이 차지하는 비율 (나머지는 검증·비교·엑셀 생성)
+EXTRACTION_PROGRESS_SHARE = 0.9
+
+# 문서별 진행률 중 추출이 차지하는 비율 (나머지는 배출기준 매칭·검증)
+DOCUMENT_EXTRACTION_SHARE = 0.9
+
+def _no_progress(fraction, message, part=None):
+    pass
+
+def extract_document(pdf_file, outlet_types, workers=1, cache=None, strict=False, progress_callback=None, isolate=False,
+                     profile=PROFILE_DEFAULT, supervision=None):
+    """PDF 한 개 추출: cache가 있으면 저장된 1단계 결과를 재사용
+    
+    반환값은 (all_data, page_info, raw_table_data, 캐시 적중 여부)이다.
+    supervision(page_supervisor.PageSupervision)이 있으면 페이지마다 시간·메모리 예산을 두고 워커 프로세스
+    하나에서 파싱하며(workers, isolate는 쓰지 않음) 끝난 페이지는 체크포인트에 남긴다.
+    """
+    if cache is None:
+        if supervision is not None:
+            return (*extract_table_from_pdf_supervised(
+                pdf_file, outlet_types, progress_callback, strict, profile, supervision
+            ), False)
+        return (*extract_table_from_pdf(
+            pdf_file, outlet_types, workers=workers, progress_callback=progress_callback, strict=strict,
+            isolate=isolate, profile=profile
+        ), False)
+    return extract_table_from_pdf_cached(
+        pdf_file, outlet_types, cache, workers=workers, progress_callback=progress_callback, strict=strict,
+        isolate=isolate, profile=profile, supervision=supervision
+    )
+
+def process_document(label, pdf_file, outlet_types, standards_index=None, workers=1, cache=None, strict=False,
+                     isolate=False, profile=PROFILE_DEFAULT, profiler=NULL_PROFILER, progress=None, supervision=None):
+    """문서 한 개를 추출하고 배출기준 매칭·검증까지 실행
+    
+    반환값은 {'data', 'page_info', 'raw_data', 'cache_hit', 'profile', 'exceeded_count', 'validation_issues'}이다.
+    profile은 실제로 쓰인 추출 프로파일 이름이다 (자동 감지 결과 포함).
+    progress(진행률 0~1, 메시지)는 이 문서 기준 진행률이다.
+    """
+    progress = progress or _no_progress
+    progress(0.0, "처리 준비 중...")
+    
+    def update(done_pages, total_pages):
+        progress(DOCUMENT_EXTRACTION_SHARE * done_pages / total_pages, f"페이지 {done_pages}/{total_pages} 처리 중...")
+    
+    with profiler.stage(f"{label} 추출") as details:
+        data, page_info, raw_data, cache_hit = extract_document(
+            pdf_file, outlet_types, workers, cache, strict, update, isolate, profile, supervision
+        )
+        if page_info:
+            profile = page_info[0].get('프로파일', profile)
+        details.update(페이지수=len(page_info), 행수=len(data), 프로파일=profile)
+        if supervision is not None:
+            details.update(미완료페이지=len(unfinished_pages(page_info)))
+    profiler.add_pages(label, page_info)
+    
+    # 배출기준 매칭 (기준 초과 행은 검증 이슈로도 보고됨)
+    exceeded_count = 0
+    if standards_index:
+        progress(DOCUMENT_EXTRACTION_SHARE, "배출기준 매칭 중...")
+        with profiler.stage(f"{label} 배출기준 매칭", 행수=len(data)):
+            exceeded_count = attach_standards(data, standards_index)
+    
+    progress(DOCUMENT_EXTRACTION_SHARE, "데이터 정확성 검증 중...")
+    with profiler.stage(f"{label} 검증", 행수=len(data)):
+        validation_issues = validate_data_accuracy(data)
+    
+    progress(1.0, f"완료 ({len(data)}행)")
+    return {
+        'data': data,
+        'page_info': page_info,
+        'raw_data': raw_data,
+        'cache_hit': cache_hit,
+        'profile': profile,
+        'exceeded_count': exceeded_count,
+        'validation_issues': validation_issues,
+    }
+
+def process_documents(plan_file, review_file, outlet_types, standards_index=None, workers=1, cache=None,
+                      strict=False, profile=PROFILE_DEFAULT, profiler=NULL_PROFILER, progress=None, preview=False,
+                      excel=True, export_format=None, supervision=None, isolate=None):
+    """계획서(필수)와 검토서(선택)를 처리하여 결과 딕셔너리 반환
+    
+    두 문서는 process_document로 동시에 처리하며, 문서별 진행률은 progress(..., part=문서 이름)로 전달한다.
+    각 문서는 workers만큼의 파싱 워커를 쓰므로 먼저 끝난 문서의 CPU는 남은 문서가 이어서 쓴다.
+    preview이면 화면 표시용 미리보기(preview.build_previews)를 작업 안에서 한 번 만들어 'previews'에 담는다.
+    excel이 False이면 정리양식.xlsx를 만들지 않고(excel_bytes는 None), export_format(parquet/csv/jsonl)을 주면
+    대량 내보내기 zip(bulk_export.bundle_zip)을 'export_bytes'에 담는다.
+    supervision(page_supervisor.PageSupervision)을 주면 두 문서 모두 페이지 감시로 추출한다
+    (예산을 넘은 페이지는 page_info의 '처리상태'에 건너뜀/실패로 남음).
+    isolate가 None이면 두 문서를 동시에 처리하고 CPU가 2개 이상일 때만 문서별 워커 프로세스에서 파싱한다.
+    이미 프로세스 풀 워커 안에서 호출하는 경우(api_server)처럼 프로세스를 더 늘리면 안 되면 False를 준다.
+    이때 페이지 감시는 문서마다 워커 프로세스가 필요하므로 두 문서를 차례로 처리한다 (감시 워커는 한 번에 하나).
+    
+    결과 키: plan_data, plan_page_info, plan_raw_data, review_data, review_page_info, review_raw_data,
+    validation_issues, comparison_results, unmatched_items, standards_applied, exceeded_count, cache_hits,
+    extraction_profiles, excel_bytes, profiler[, previews][, export_bytes, export_format]
+    """
+    progress = progress or _no_progress
+    documents = [(PLAN_LABEL, plan_file)] + ([(REVIEW_LABEL, review_file)] if review_file else [])
+    if isolate is None:
+        isolate = len(documents) > 1 and available_cpus() > 1
+    document_threads = 1 if supervision is not None and not isolate else len(documents)
+    document_progress = {label: 0.0 for label, _ in documents}
+    
+    def make_progress(label):
+        def update(fraction, message):
+            document_progress[label] = fraction
+            progress(fraction, message, part=label)
+            overall = EXTRACTION_PROGRESS_SHARE * sum(document_progress.values()) / len(documents)
+            progress(overall, f"{', '.join(documents_in_progress())} 처리 중...")
+        return update
+    
+    def documents_in_progress():
+        return [label for label, fraction in document_progress.items() if fraction < 1.0] or ['문서']
+    
+    with ThreadPoolExecutor(max_workers=document_threads, thread_name_prefix='emission-document') as executor:
+        futures = {
+            label: executor.submit(
+                process_document, label, pdf_file, outlet_types, standards_index, workers, cache, strict,
+                isolate, profile, profiler, make_progress(label), supervision
+            )
+            for label, pdf_file in documents
+        }
+        # 한 문서가 실패해도 다른 문서의 처리가 끝난 뒤 예외를 전달 (작업 스레드가 남지 않도록)
+        processed = {label: future.result() for label, future in futures.items()}
+    
+    result = {
+        'review_data': RowStore(),
+        'review_page_info': [],
+        'review_raw_data': RowStore.raw(),
+        'cache_hits': {},
+        'extraction_profiles': {},
+        'profiler': profiler,
+        'standards_applied': bool(standards_index),
+        'exceeded_count': 0,
+        'validation_issues': [],
+    }
+    prefixes = {PLAN_LABEL: 'plan', REVIEW_LABEL: 'review'}
+    for label, document in processed.items():
+        prefix = prefixes[label]
+        result[f'{prefix}_data'] = document['data']
+        result[f'{prefix}_page_info'] = document['page_info']
+        result[f'{prefix}_raw_data'] = document['raw_data']
+        result['cache_hits'][label] = document['cache_hit']
+        result['extraction_profiles'][label] = document['profile']
+        result['exceeded_count'] += document['exceeded_count']
+        result['validation_issues'] += document['validation_issues']
+    
+    plan_data, review_data = result['plan_data'], result['review_data']
+    
+    comparison_results, unmatched_items = [], []
+    if review_data:
+        progress(EXTRACTION_PROGRESS_SHARE, "계획서-검토서 비교 중...")
+        with profiler.stage("비교"):
+            comparison_results, unmatched_items = compare_plan_review(plan_data, review_data)
+    result['comparison_results'] = comparison_results
+    result['unmatched_items'] = unmatched_items
+    
+    result['excel_bytes'] = None
+    if excel:
+        progress(EXTRACTION_PROGRESS_SHARE, "정리양식.xlsx 생성 중...")
+        with profiler.stage("엑셀 생성") as details:
+            excel_file = create_standardized_excel(
+                plan_data, review_data, result['validation_issues'],
+                comparison_results, unmatched_items, result['plan_raw_data'] + result['review_raw_data']
+            )
+            result['excel_bytes'] = excel_file.getvalue()
+            details.update(파일크기MB=round(len(result['excel_bytes']) / 1e6, 2))
+    
+    if preview:
+        progress(EXTRACTION_PROGRESS_SHARE, "미리보기 준비 중...")
+        with profiler.stage("미리보기 준비"):
+            result['previews'] = build_previews(
+                {PLAN_LABEL: (plan_data, result['plan_raw_data']), REVIEW_LABEL: (review_data, result['review_raw_data'])},
+                result['validation_issues'], comparison_results, unmatched_items
+            )
+    
+    if export_format:
+        progress(EXTRACTION_PROGRESS_SHARE, f"대량 내보내기({export_format}) 생성 중...")
+        with profiler.stage("대량 내보내기", 형식=export_format) as details:
+            documents = {
+                PLAN_LABEL: (plan_data, result['plan_raw_data'], result['plan_page_info']),
+                REVIEW_LABEL: (review_data, result['review_raw_data'], result['review_page_info']),
+            }
+            tables = build_export_tables(documents, result['validation_issues'], result.get('previews'))
+            result['export_bytes'] = bundle_zip(tables, export_format)
+            result['export_format'] = export_format
+            details.update(파일크기MB=round(len(result['export_bytes']) / 1e6, 2))
+    
+    progress(1.0, "처리 완료")
+    return result
+
+def process_uploads(plan_upload, review_upload, *args, **kwargs):
+    """pdf_io.SpooledUpload로 받은 업로드를 process_documents로 처리하고 스풀 임시 파일을 정리"""
+    try:
+        return process_documents(
+            plan_upload.source(), review_upload.source() if review_upload else None, *args, **kwargs
+        )
+    finally:
+        for upload in (plan_upload, review_upload):
+            if upload:
+                upload.cleanup()
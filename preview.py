@@ -0,0 +1,141 @@
+"""결과 미리보기: 고정 스키마 DataFrame을 한 번 만들어 두고 필터링·페이지 단위로 잘라서 보여 줌
+
+행 딕셔너리 목록이나 RowStore.to_dataframe() 결과를 st.dataframe에 그대로 넘기면 리스트 값인
+원본행/헤더 컬럼과 원본 헤더명마다 생기는 컬럼 때문에 object 타입의 들쭉날쭉한 DataFrame이 되고,
+이를 Arrow로 변환해 브라우저에 모두 보내느라 큰 문서에서는 화면이 멈춘다.
+
+PreviewTable은 작업 스레드에서 한 번만 만든다 (pipeline.process_documents(preview=True)).
+    - 고정 필드만 담는다: 정수(페이지/테이블), 범주형(테이블타입 등), 문자열, 수치(농도값 등) 컬럼.
+    - 원본행과 헤더는 '|'로 이은 문자열 하나로 줄이고, 원본 헤더명 컬럼은 만들지 않는다.
+    - 화면은 page()로 필터(배출구번호·물질명 포함 검색, 테이블타입 선택)를 적용한 한 페이지만 받아 표시한다.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from numeric_values import status_key, unit_key, value_key
+from row_store import CATEGORY_FIELDS, HEADER_KEY, INT_FIELDS, NO_HEADER, ORIGINAL_ROW_KEY
+
+PAGE_SIZES = (50, 100, 500)
+DEFAULT_PAGE_SIZE = 100
+CELL_SEPARATOR = ' | '
+
+# 필터 이름 → 필터를 적용할 컬럼 후보 (검증 이슈는 배출구번호 대신 원본 표기를 '배출구'로 보고)
+FILTER_OUTLET = '배출구번호'
+FILTER_SUBSTANCE = '물질명'
+FILTER_TABLE_TYPE = '테이블타입'
+FILTER_COLUMNS = {
+    FILTER_OUTLET: ('배출구번호', '배출구'),
+    FILTER_SUBSTANCE: ('물질명',),
+    FILTER_TABLE_TYPE: ('테이블타입',),
+}
+
+PreviewPage = namedtuple('PreviewPage', 'frame total number page_count start')
+
+def compact_cells(cells):
+    """리스트 값(원본행, 헤더)을 표시용 문자열 하나로"""
+    if cells is None:
+        return ''
+    return CELL_SEPARATOR.join('' if cell is None else str(cell) for cell in cells)
+
+def _typed_column(values):
+    """값 목록을 숫자면 그대로, 섞여 있으면 문자열(string) 컬럼으로 (Arrow 변환이 한 가지 타입이 되도록)"""
+    series = pd.Series(values)
+    if series.dtype != object:
+        return series
+    return series.map(lambda value: compact_cells(value) if isinstance(value, (list, tuple)) else value).astype('string')
+
+class PreviewTable:
+    """미리보기용 고정 스키마 DataFrame과 필터·페이지 조회"""
+    
+    def __init__(self, frame):
+        self.frame = frame.reset_index(drop=True)
+        self.filter_columns = {
+            name: next((column for column in candidates if column in self.frame.columns), None)
+            for name, candidates in FILTER_COLUMNS.items()
+        }
+    
+    @classmethod
+    def from_store(cls, data):
+        """RowStore에서 고정 필드·파싱 컬럼·추가 컬럼과 압축한 원본행/헤더로 구성"""
+        columns = {}
+        for field in data.fields:
+            values = data.column(field)
+            if field in INT_FIELDS:
+                columns[field] = np.asarray(values, dtype=np.int32)
+            elif field in CATEGORY_FIELDS:
+                columns[field] = pd.Categorical(values)
+            else:
+                columns[field] = pd.array(values, dtype='string')
+        for field in data.numeric_fields:
+            values, units, statuses = data.numeric_columns(field)
+            columns[value_key(field)] = np.asarray(values, dtype=np.float64)
+            columns[unit_key(field)] = pd.Categorical(units)
+            columns[status_key(field)] = pd.Categorical(statuses)
+        for name, values in data.extra.items():
+            columns[name] = _typed_column(values)
+        
+        # 헤더는 종류마다 한 번만 문자열로 만들고 행에는 헤더 번호로 펼침
+        header_texts = np.array([compact_cells(header) for header in data.headers] + [''], dtype=object)
+        header_ids = np.asarray(data.header_ids, dtype=np.int64)
+        columns[HEADER_KEY] = pd.array(header_texts[np.where(header_ids == NO_HEADER, -1, header_ids)], dtype='string')
+        columns[ORIGINAL_ROW_KEY] = pd.array([compact_cells(row) for row in data.original_rows], dtype='string')
+        return cls(pd.DataFrame(columns))
+    
+    @classmethod
+    def from_records(cls, records):
+        """행 딕셔너리 목록(검증 이슈, 비교 결과 등)에서 구성"""
+        frame = pd.DataFrame(list(records))
+        return cls(pd.DataFrame({name: _typed_column(frame[name].tolist()) for name in frame.columns}))
+    
+    def __len__(self):
+        return len(self.frame)
+    
+    def has_filter(self, name):
+        return self.filter_columns.get(name) is not None
+    
+    def choices(self, name):
+        """선택형 필터(테이블타입)의 값 목록"""
+        column = self.filter_columns.get(name)
+        if column is None:
+            return []
+        return sorted(str(value) for value in self.frame[column].dropna().unique())
+    
+    def select(self, outlet='', substance='', table_types=()):
+        """필터를 적용한 DataFrame (배출구번호·물질명은 대소문자 무시 포함 검색, 테이블타입은 선택한 값 중 하나)"""
+        mask = np.ones(len(self.frame), dtype=bool)
+        for name, text in ((FILTER_OUTLET, outlet), (FILTER_SUBSTANCE, substance)):
+            column = self.filter_columns.get(name)
+            text = (text or '').strip()
+            if column and text:
+                mask &= self.frame[column].astype('string').str.contains(text, case=False, regex=False, na=False).to_numpy()
+        column = self.filter_columns.get(FILTER_TABLE_TYPE)
+        if column and table_types:
+            mask &= self.frame[column].astype('string').isin(list(table_types)).to_numpy()
+        return self.frame if mask.all() else self.frame[mask]
+    
+    def page(self, number=1, page_size=DEFAULT_PAGE_SIZE, **filters):
+        """필터를 적용한 뒤 number쪽(1부터, 범위를 넘으면 마지막 쪽)의 행만 잘라 PreviewPage로 반환"""
+        selected = self.select(**filters)
+        total = len(selected)
+        page_count = max(1, math.ceil(total / page_size))
+        number = min(max(1, int(number)), page_count)
+        start = (number - 1) * page_size
+        return PreviewPage(selected.iloc[start:start + page_size], total, number, page_count, start)
+
+def build_previews(documents, validation_issues, comparison_results, unmatched_items):
+    """결과 미리보기 모음
+    
+    documents는 {문서 이름: (추출 행 RowStore, 원시 행 RowStore)}이며, 반환값의 키는
+    '{문서 이름}', '{문서 이름} 원시', '검증이슈', '비교결과', '미매칭'이다.
+    """
+    previews = {}
+    for label, (data, raw_data) in documents.items():
+        previews[label] = PreviewTable.from_store(data)
+        previews[f"{label} 원시"] = PreviewTable.from_store(raw_data)
+    previews['검증이슈'] = PreviewTable.from_records(validation_issues)
+    previews['비교결과'] = PreviewTable.from_records(comparison_results)
+    previews['미매칭'] = PreviewTable.from_records(unmatched_items)
+    return previews
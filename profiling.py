@@ -0,0 +1,134 @@
+"""처리 단계별 계측 (시간·최대 메모리)
+
+웹 화면과 일괄 처리 CLI에서 추출·검증·비교·엑셀 생성 단계마다 걸린 시간과
+(선택 시) 단계 중 늘어난 최대 메모리를 기록하고, 페이지별 처리 현황(page_info)과 함께
+JSON 프로파일로 내보낸다.
+
+메모리 계측은 tracemalloc을 쓰므로 켜 두면 처리가 눈에 띄게 느려진다. 꺼 두면 단계마다
+perf_counter 두 번만 호출한다. 계획서·검토서나 동시에 실행되는 작업(JobManager, API)처럼 여러 스레드에서
+단계가 동시에 실행될 수 있으며, 이때 겹치는 단계의 최대 메모리는 서로의 사용량을 합친 값이다
+(tracemalloc은 프로세스 전체를 계측). tracemalloc 시작·종료는 모든 계측기가 모듈 단위 참조 수로 함께
+관리하므로, 한 작업이 끝나며 다른 작업이 계측 중인 tracemalloc을 끄지 않는다.
+"""
+import json
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from pdf_extractor import PARSER_VERSION
+
+PROFILE_VERSION = 1
+
+STAGE_KEY = '단계'
+START_KEY = '시작(초)'  # 계측 시작 시점부터의 경과 시간
+TIME_KEY = '시간(초)'
+PEAK_MEMORY_KEY = '최대메모리(MB)'
+
+# 프로세스 전체의 tracemalloc 사용 현황 (모든 StageProfiler가 공유)
+_tracing_lock = threading.Lock()
+_tracing_stages = 0        # 메모리를 계측 중인 진행 중 단계 수
+_started_tracing = False   # 이 모듈이 tracemalloc을 켰는지 (다른 곳에서 켠 계측은 끄지 않음)
+
+def _begin_memory_stage():
+    """메모리 계측 단계 시작: 필요하면 tracemalloc을 켜고 현재 사용량(기준값)을 반환"""
+    global _tracing_stages, _started_tracing
+    with _tracing_lock:
+        if _tracing_stages == 0:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+            tracemalloc.reset_peak()  # 진행 중인 다른 단계가 없을 때만 (있으면 그 단계의 최대값이 지워짐)
+        _tracing_stages += 1
+        return tracemalloc.get_traced_memory()[0]
+
+def _end_memory_stage(baseline):
+    """메모리 계측 단계 종료: 기준값 대비 최대 증가량(바이트)을 반환하고, 마지막 단계면 tracemalloc을 끔"""
+    global _tracing_stages, _started_tracing
+    with _tracing_lock:
+        peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+        _tracing_stages -= 1
+        if _tracing_stages == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+        return peak
+
+class StageProfiler:
+    """단계별 시간·메모리 기록기
+    
+    with profiler.stage('검증', 행수=len(data)):
+        ...
+    처럼 감싸면 단계가 끝날 때 {'단계', '시작(초)', '시간(초)', ['최대메모리(MB)'], 추가 항목} 기록이 쌓인다.
+    """
+    
+    def __init__(self, track_memory=False, **metadata):
+        self.track_memory = track_memory
+        self.metadata = dict(metadata)
+        self.stages = []
+        self.pages = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name, **details):
+        if self.track_memory:
+            baseline = _begin_memory_stage()
+        started = time.perf_counter()
+        
+        try:
+            yield details
+        finally:
+            finished = time.perf_counter()
+            record = {STAGE_KEY: name, START_KEY: round(started - self._origin, 4), TIME_KEY: round(finished - started, 4)}
+            if self.track_memory:
+                record[PEAK_MEMORY_KEY] = round(_end_memory_stage(baseline) / 1e6, 2)
+            record.update(details)
+            with self._lock:
+                self.stages.append(record)
+    
+    def add_pages(self, label, page_info):
+        """문서(계획서/검토서)의 페이지별 처리 현황 등록"""
+        self.pages[label] = list(page_info)
+    
+    def total_time(self):
+        """첫 단계 시작부터 마지막 단계 종료까지의 경과 시간 (동시에 실행된 단계는 한 번만 셈)"""
+        if not self.stages:
+            return 0.0
+        start = min(record[START_KEY] for record in self.stages)
+        end = max(record[START_KEY] + record[TIME_KEY] for record in self.stages)
+        return round(end - start, 4)
+    
+    def to_dict(self):
+        return {
+            '버전': PROFILE_VERSION,
+            '생성시각': datetime.now().isoformat(timespec='seconds'),
+            '환경': {
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                '파서버전': PARSER_VERSION,
+                '메모리계측': self.track_memory,
+            },
+            '정보': self.metadata,
+            '전체시간(초)': self.total_time(),
+            '단계': self.stages,
+            '페이지': self.pages,
+        }
+    
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=1, default=str)
+
+class NullProfiler:
+    """계측을 끈 경우의 대체 객체 (같은 인터페이스, 기록 없음)"""
+    
+    track_memory = False
+    
+    def stage(self, name, **details):
+        return nullcontext(details)
+    
+    def add_pages(self, label, page_info):
+        pass
+
+NULL_PROFILER = NullProfiler()
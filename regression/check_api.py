@@ -0,0 +1,127 @@
+"""API 서버의 프로세스 상한·요청 검증 회귀 검사
+
+사용 예:
+    python regression/check_api.py
+    
+    1. 페이지 감시 작업(page_timeout)의 프로세스 수: 풀 워커가 실행하는 process_request를 계획서·검토서 한 쌍으로
+       직접 실행하며 자식 프로세스를 세어, 감시 워커가 한 번에 하나만 떠 있는지 확인한다.
+    2. 정수가 아닌 Content-Length는 400으로 거절한다.
+    3. UTF-8이 아닌 폼 필드는 400으로 거절한다.
+check_resume.py의 PDF(도면 페이지 포함)를 쓰므로 reportlab이 필요하다 (pip install reportlab).
+"""
+import http.client
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from api_server import PLAN_FILENAME, REVIEW_FILENAME, ApiServer, ExtractionService, process_request
+from check_resume import write_document
+
+SAMPLE_INTERVAL = 0.05
+PAGE_TIMEOUT = 120
+
+def spawned_children():
+    """현재 프로세스가 spawn으로 띄운 자식 프로세스 수 (resource tracker 제외)"""
+    count = 0
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                parent = int(f.read().rsplit(')', 1)[1].split()[1])
+            with open(f'/proc/{name}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except (OSError, IndexError, ValueError):
+            continue
+        if parent == os.getpid() and b'spawn_main' in cmdline:
+            count += 1
+    return count
+
+def max_supervisor_processes(work_dir):
+    """process_request(page_timeout)를 실행하는 동안 동시에 떠 있던 자식 프로세스 수의 최댓값"""
+    job_dir = os.path.join(work_dir, 'job')
+    os.makedirs(job_dir)
+    for filename in (PLAN_FILENAME, REVIEW_FILENAME):
+        write_document(os.path.join(job_dir, filename))
+    
+    samples = []
+    finished = threading.Event()
+    
+    def sample():
+        while not finished.wait(SAMPLE_INTERVAL):
+            samples.append(spawned_children())
+    
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        summary = process_request(
+            job_dir, True, ['#A', '#B', '#C'], strict=True, standards_dir=None, use_cache=False,
+            page_timeout=PAGE_TIMEOUT
+        )
+    finally:
+        finished.set()
+        sampler.join()
+    return max(samples, default=0), summary
+
+def post(port, body, headers):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    try:
+        connection.request('POST', '/jobs', body=body, headers=headers)
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+def multipart(fields):
+    boundary = uuid.uuid4().hex
+    body = b''.join(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode('ascii') + content + b'\r\n'
+        for name, content in fields.items()
+    ) + f'--{boundary}--\r\n'.encode('ascii')
+    return body, f'multipart/form-data; boundary={boundary}'
+
+def main():
+    failures = []
+    
+    def check(step, condition, detail):
+        print(f"{'✅' if condition else '❌'} {step}: {detail}")
+        if not condition:
+            failures.append(step)
+    
+    work_dir = tempfile.mkdtemp(prefix='emission-api-check-')
+    try:
+        peak, summary = max_supervisor_processes(work_dir)
+        check(
+            "1. 페이지 감시 프로세스 수", peak == 1 and summary['미완료페이지'] == 0,
+            f"동시 자식 프로세스 최대 {peak}개, 미완료페이지 {summary['미완료페이지']}"
+        )
+        
+        service = ExtractionService(work_dir=os.path.join(work_dir, 'api'), workers=1, standards_dir=None, use_cache=False)
+        server = ApiServer(('127.0.0.1', 0), service)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            port = server.server_port
+            body, content_type = multipart({'plan': b'%PDF-1.4'})
+            status = post(port, body, {'Content-Type': content_type, 'Content-Length': 'abc'})
+            check("2. 잘못된 Content-Length", status == 400, f"HTTP {status}")
+            
+            body, content_type = multipart({'plan': b'%PDF-1.4', 'form': b'\xff\xfe'})
+            status = post(port, body, {'Content-Type': content_type, 'Content-Length': str(len(body))})
+            check("3. UTF-8이 아닌 폼 필드", status == 400, f"HTTP {status}")
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    print(f"{'✅' if not failures else '❌'} {3 - len(failures)}/3 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
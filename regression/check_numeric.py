@@ -0,0 +1,83 @@
+"""수치 파싱 회귀 검사
+
+사용 예:
+    python regression/check_numeric.py
+
+셀 표기마다 numeric_values.parse_numeric의 (수치, 단위, 상태)를 확인하고,
+검증(validation)이 파싱 실패 표기에만 '숫자 형식 오류'를 붙이는지 확인한다.
+"""
+import math
+import os
+import sys
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from numeric_values import (
+    STATUS_EMPTY, STATUS_FAILED, STATUS_MULTIPLE, STATUS_NOT_DETECTED, STATUS_NUMBER, STATUS_RANGE, parse_numeric
+)
+from row_store import ROW_FIELDS, RowStore
+from validation import validate_data_accuracy
+
+NAN = math.nan
+
+# (셀 표기, 기대 (수치, 단위, 상태))
+CASES = [
+    ('12.5', (12.5, '', STATUS_NUMBER)),
+    ('1,234.5', (1234.5, '', STATUS_NUMBER)),
+    ('-5', (-5.0, '', STATUS_NUMBER)),
+    ('−3', (-3.0, '', STATUS_NUMBER)),
+    ('+2', (2.0, '', STATUS_NUMBER)),
+    ('-1.5 ppm', (-1.5, 'ppm', STATUS_NUMBER)),
+    ('-5 이하', (-5.0, '', '이하')),
+    ('50 ppm 이하', (50.0, 'ppm', '이하')),
+    ('< 5', (5.0, '', '미만')),
+    ('50(12)', (50.0, '', STATUS_NUMBER)),
+    ('(50) mg/Sm3', (50.0, 'mg/Sm³', STATUS_NUMBER)),
+    ('10~20', (20.0, '', STATUS_RANGE)),
+    ('10-20', (20.0, '', STATUS_RANGE)),
+    ('-5~-3', (-3.0, '', STATUS_RANGE)),
+    ('10/20', (NAN, '', STATUS_MULTIPLE)),
+    ('N.D', (NAN, '', STATUS_NOT_DETECTED)),
+    ('-', (NAN, '', STATUS_EMPTY)),
+    ('−', (NAN, '', STATUS_EMPTY)),
+    ('abc', (NAN, '', STATUS_FAILED)),
+]
+
+def same(actual, expected):
+    value, unit, status = actual
+    expected_value, expected_unit, expected_status = expected
+    same_value = value == expected_value or (math.isnan(value) and math.isnan(expected_value))
+    return same_value and unit == expected_unit and status == expected_status
+
+def main():
+    failures = []
+    for text, expected in CASES:
+        actual = parse_numeric(text)
+        if not same(actual, expected):
+            failures.append(text)
+            print(f"❌ {text!r}: {actual} (기대 {expected})")
+    
+    # 검증: 파싱 실패 표기만 숫자 형식 오류
+    data = RowStore()
+    for position, (text, _) in enumerate(CASES):
+        row = {field: '' for field in ROW_FIELDS}
+        row.update({
+            '페이지': 1, '테이블': 1, '테이블타입': 'emission_data', '배출구번호': '#A1', '원본배출구': '#A1',
+            '물질명': '먼지', '농도': text, '원본행': [str(position)],
+        })
+        data.append(row)
+    flagged = {
+        CASES[issue['행번호'] - 1][0] for issue in validate_data_accuracy(data) if '숫자 형식 오류' in issue['문제점']
+    }
+    expected_flagged = {text for text, (_, _, status) in CASES if status == STATUS_FAILED}
+    if flagged != expected_flagged:
+        failures.append('검증')
+        print(f"❌ 숫자 형식 오류 대상: {sorted(flagged)} (기대 {sorted(expected_flagged)})")
+    
+    total = len(CASES) + 1
+    print(f"{'✅' if not failures else '❌'} {total - len(failures)}/{total} 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""일괄 처리 파일 짝짓기 회귀 검사
+
+사용 예:
+    python regression/check_pairing.py
+
+batch_cli.pair_documents가 파일명으로 계획서·검토서를 짝짓는지, 시설 키가 겹치는 문서를 조용히 덮어쓰지 않고
+경고와 함께 제외하는지 확인한다 (PDF를 열지 않으므로 경로만 있으면 된다).
+"""
+import os
+import sys
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from batch_cli import pair_documents
+
+# (단계, 입력 경로, 기대 짝 [(시설 키, 계획서, 검토서)], 경고에 들어가야 하는 경로)
+CASES = [
+    (
+        "짝짓기",
+        ['a/가공장_계획서.pdf', 'a/가공장_검토서.pdf', 'a/나공장_계획서.pdf'],
+        [('가공장', 'a/가공장_계획서.pdf', 'a/가공장_검토서.pdf'), ('나공장', 'a/나공장_계획서.pdf', None)],
+        [],
+    ),
+    (
+        "계획서 중복",
+        ['a/가공장_계획서.pdf', 'b/가공장_계획서.pdf', 'a/가공장_검토서.pdf', 'a/나공장_계획서.pdf'],
+        [('나공장', 'a/나공장_계획서.pdf', None)],
+        ['a/가공장_계획서.pdf', 'b/가공장_계획서.pdf', 'a/가공장_검토서.pdf'],
+    ),
+    (
+        "검토서 중복",
+        ['a/가공장_계획서.pdf', 'a/가공장_검토서.pdf', 'b/가공장 검토서.pdf'],
+        [('가공장', 'a/가공장_계획서.pdf', None)],
+        ['a/가공장_검토서.pdf', 'b/가공장 검토서.pdf'],
+    ),
+]
+
+def main():
+    failures = []
+    for step, paths, expected_pairs, expected_warned in CASES:
+        pairs, warnings = pair_documents(paths)
+        warned = [path for path in paths if any(os.path.basename(path) in warning for warning in warnings)]
+        passed = pairs == expected_pairs and warned == expected_warned
+        print(f"{'✅' if passed else '❌'} {step}: 짝 {len(pairs)}개, 경고 {len(warnings)}개")
+        if not passed:
+            failures.append(step)
+            print(f"    짝: {pairs}\n    경고: {warnings}")
+    
+    print(f"{'✅' if not failures else '❌'} {len(CASES) - len(failures)}/{len(CASES)} 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""테이블 파서 회귀 검사
+
+사용 예:
+    python regression/check_parser.py           # 기대값과 비교
+    python regression/check_parser.py --update  # 현재 결과로 기대값 갱신 (의도한 변경일 때만)
+
+parser_corpus.json의 각 테이블을 2단계(extract_page_rows)로 처리한 결과를
+parser_expected.json에 저장된 결과와 행 단위로 비교한다.
+"""
+import argparse
+import json
+import os
+import sys
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from pdf_extractor import PAGE_TIMING_KEYS, detect_table_structure, extract_page_rows
+
+CORPUS_PATH = os.path.join(REGRESSION_DIR, 'parser_corpus.json')
+EXPECTED_PATH = os.path.join(REGRESSION_DIR, 'parser_expected.json')
+
+def run_case(case):
+    """코퍼스 항목 하나를 파싱하여 JSON 비교용 결과 반환"""
+    table = case['셀']
+    page_entry = {
+        '페이지': 1,
+        '테이블목록': [{'테이블': 1, '테이블타입': detect_table_structure(table), '셀': table}]
+    }
+    page_data, page_info, page_raw_data = extract_page_rows(page_entry, case['배출구타입'])
+    # 처리 시간은 실행마다 다르므로 비교하지 않음
+    page_info = {key: value for key, value in page_info.items() if key not in PAGE_TIMING_KEYS}
+    
+    # RowStore는 행 딕셔너리로 재구성하고, 튜플/리스트 차이 등을 없애기 위해 JSON 왕복
+    return json.loads(json.dumps({
+        '추출행': list(page_data),
+        '원시행': list(page_raw_data),
+        '페이지정보': page_info
+    }, ensure_ascii=False))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="테이블 파서 회귀 검사")
+    parser.add_argument('--update', action='store_true', help="현재 결과로 기대값 파일을 갱신")
+    args = parser.parse_args(argv)
+    
+    with open(CORPUS_PATH, encoding='utf-8') as f:
+        corpus = json.load(f)
+    
+    results = {case['이름']: run_case(case) for case in corpus}
+    
+    if args.update:
+        with open(EXPECTED_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+        print(f"기대값 갱신: {len(results)}건 → {EXPECTED_PATH}")
+        return 0
+    
+    with open(EXPECTED_PATH, encoding='utf-8') as f:
+        expected = json.load(f)
+    
+    failures = []
+    for name, result in results.items():
+        if name not in expected:
+            failures.append(f"{name}: 기대값 없음 (--update 필요)")
+            continue
+        for key in ('추출행', '원시행', '페이지정보'):
+            if result[key] != expected[name][key]:
+                failures.append(f"{name}: {key} 불일치\n  기대: {expected[name][key]}\n  실제: {result[key]}")
+    
+    for failure in failures:
+        print(f"❌ {failure}")
+    print(f"{'✅' if not failures else '❌'} {len(results) - len(failures)}/{len(results)} 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
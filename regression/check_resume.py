@@ -0,0 +1,95 @@
+"""페이지 감시 일괄 처리의 이어서 처리 회귀 검사
+
+사용 예:
+    python regression/check_resume.py
+
+시간이 오래 걸리는 도면 페이지(선 1만 개)가 섞인 계획서 한 쌍을 임시 디렉터리에 만들고
+batch_cli.run_batch를 페이지 감시로 세 번 실행한다.
+    1. 짧은 제한 시간: 도면 페이지만 건너뛰고 '일부완료'로 끝나며 체크포인트가 남는다.
+    2. 같은 옵션으로 다시 실행: 출력 파일이 최신이므로 건너뛴다.
+    3. --retry-failed-pages에 해당하는 retry_failed=True: 출력 파일이 최신이어도 다시 처리하여
+       도면 페이지까지 '완료'하고 체크포인트를 지운다.
+reportlab이 필요하다 (pip install reportlab).
+"""
+import os
+import random
+import sys
+import tempfile
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from reportlab.pdfgen import canvas
+
+from batch_cli import run_batch
+from page_supervisor import PageSupervision
+
+PAGE_SIZE = (2000, 2000)
+TABLE_PAGES = 3
+HEAVY_PAGE = 2         # 도면 페이지 번호 (1부터)
+HEAVY_LINES = 5000     # 방향마다 그리는 선 수 (테이블 탐색에 약 2초)
+SHORT_TIMEOUT = 0.5    # 도면 페이지만 넘기는 제한 시간 (초)
+LONG_TIMEOUT = 120
+
+def write_document(path):
+    """괘선 테이블 페이지 사이에 선이 많은 도면 페이지를 끼운 PDF"""
+    rnd = random.Random(0)
+    pdf = canvas.Canvas(path, pagesize=PAGE_SIZE)
+    for page_num in range(1, TABLE_PAGES + 2):
+        if page_num == HEAVY_PAGE:
+            for _ in range(HEAVY_LINES):
+                x, y = rnd.uniform(0, PAGE_SIZE[0]), rnd.uniform(0, PAGE_SIZE[1])
+                pdf.line(x, 0, x + rnd.uniform(-5, 5), PAGE_SIZE[1])
+                pdf.line(0, y, PAGE_SIZE[0], y + rnd.uniform(-5, 5))
+        else:
+            for row in range(6):
+                pdf.line(100, 100 + row * 40, 900, 100 + row * 40)
+            for column in range(5):
+                pdf.line(100 + column * 200, 100, 100 + column * 200, 300)
+            for row in range(5):
+                for column in range(4):
+                    pdf.drawString(110 + column * 200, 110 + row * 40, f"r{row}c{column}p{page_num}")
+        pdf.showPage()
+    pdf.save()
+
+def run(input_dir, output_dir, checkpoint_dir, page_timeout, retry_failed=False):
+    supervision = PageSupervision(page_timeout=page_timeout, checkpoint_dir=checkpoint_dir, retry_failed=retry_failed)
+    summaries, _ = run_batch(
+        [input_dir], output_dir, ['#A', '#B', '#C'], strict=True, log=lambda message: None,
+        standards_dir=None, supervision=supervision
+    )
+    return summaries[0]
+
+def main():
+    failures = []
+    
+    def check(step, condition, detail):
+        print(f"{'✅' if condition else '❌'} {step}: {detail}")
+        if not condition:
+            failures.append(step)
+    
+    with tempfile.TemporaryDirectory(prefix='emission-resume-') as work_dir:
+        input_dir, output_dir, checkpoint_dir = (os.path.join(work_dir, name) for name in ('입력', '출력', '체크포인트'))
+        os.makedirs(input_dir)
+        write_document(os.path.join(input_dir, '도면공장_계획서.pdf'))
+        
+        summary = run(input_dir, output_dir, checkpoint_dir, SHORT_TIMEOUT)
+        check(
+            "1. 제한 시간 초과", summary['상태'] == '일부완료' and summary['미완료페이지'] == 1
+            and len(os.listdir(checkpoint_dir)) == 1, f"{summary['상태']}, 미완료페이지 {summary['미완료페이지']}"
+        )
+        
+        summary = run(input_dir, output_dir, checkpoint_dir, SHORT_TIMEOUT)
+        check("2. 다시 실행", summary['상태'] == '건너뜀(최신)', summary['상태'])
+        
+        summary = run(input_dir, output_dir, checkpoint_dir, LONG_TIMEOUT, retry_failed=True)
+        check(
+            "3. 실패 페이지 재시도", summary['상태'] == '완료' and summary.get('미완료페이지') == 0
+            and not os.listdir(checkpoint_dir), f"{summary['상태']}, 미완료페이지 {summary.get('미완료페이지')}"
+        )
+    
+    print(f"{'✅' if not failures else '❌'} {3 - len(failures)}/3 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""배출기준 판정 회귀 검사
+
+사용 예:
+    python regression/check_standards.py
+
+기준값 3인 기준표 하나로 농도 표기마다 standards.match_standards의 기준판정을 확인하고,
+검증(validation)에서 '배출기준 초과' 이슈가 초과 판정 행에만 붙는지 확인한다.
+미만/이하/범위처럼 수치가 상한뿐인 값은 상한이 기준을 넘어도 초과가 아니라 판정불가여야 한다.
+"""
+import os
+import sys
+
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REGRESSION_DIR))
+
+from row_store import ROW_FIELDS, RowStore
+from standards import (
+    JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED, JUDGEMENT_NO_VALUE, JUDGEMENT_OK, JUDGEMENT_UNCERTAIN, StandardsIndex,
+    attach_standards
+)
+from validation import validate_data_accuracy
+
+LIMIT = '3'
+
+# (농도 표기, 기대 판정)
+CASES = [
+    ('5', JUDGEMENT_EXCEEDED),
+    ('2.5', JUDGEMENT_OK),
+    ('3', JUDGEMENT_OK),
+    ('< 5', JUDGEMENT_UNCERTAIN),
+    ('5 미만', JUDGEMENT_UNCERTAIN),
+    ('5 이하', JUDGEMENT_UNCERTAIN),
+    ('≤ 2', JUDGEMENT_OK),
+    ('3 미만', JUDGEMENT_OK),
+    ('> 5', JUDGEMENT_EXCEEDED),
+    ('3~5', JUDGEMENT_UNCERTAIN),
+    ('1~2', JUDGEMENT_OK),
+    ('4~6', JUDGEMENT_EXCEEDED),
+    ('N.D', JUDGEMENT_NO_VALUE),
+]
+
+def build_rows():
+    rows = []
+    for position, (concentration, _) in enumerate(CASES):
+        row = {field: '' for field in ROW_FIELDS}
+        row.update({
+            '페이지': 1, '테이블': 1, '테이블타입': 'emission_standards', '배출구타입': '#A',
+            '배출구번호': '#A1', '원본배출구': '#A1', '물질명': '먼지', '농도': concentration,
+            '최대배출기준': LIMIT, '최대배출기준근거': '별표8', '원본행': [str(position)],
+        })
+        rows.append(row)
+    return rows
+
+def main():
+    index = StandardsIndex()
+    index.add('별표8', '먼지', LIMIT)
+    
+    failures = []
+    for label, data in (('RowStore', RowStore()), ('행 딕셔너리', [])):
+        data.extend(build_rows())
+        attach_standards(data, index)
+        judgements = [row[JUDGEMENT_COLUMN] for row in data]
+        issue_rows = {
+            issue['행번호'] - 1 for issue in validate_data_accuracy(data) if '배출기준 초과' in issue['문제점']
+        }
+        for position, ((concentration, expected), judgement) in enumerate(zip(CASES, judgements)):
+            reported = position in issue_rows
+            passed = judgement == expected and reported == (expected == JUDGEMENT_EXCEEDED)
+            if not passed:
+                failures.append((label, concentration))
+                print(f"❌ {label} 농도 {concentration!r}: 판정 {judgement} (기대 {expected}), 초과 이슈 {reported}")
+    
+    total = 2 * len(CASES)
+    print(f"{'✅' if not failures else '❌'} {total - len(failures)}/{total} 통과")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""추출 행 컬럼 저장소
+
+행마다 17개 안팎의 고정 키, 테이블 헤더 목록 참조, 원본 헤더명으로 한 번 더 복사한 값을 담은
+딕셔너리를 만드는 대신, 고정 필드는 컬럼 배열로, 헤더는 테이블마다 한 번만 보관한다.
+원본 헤더명 키의 값은 원본 행(원본행)과 헤더에서 그대로 다시 만들 수 있으므로 저장하지 않고,
+행 딕셔너리나 DataFrame이 필요할 때 재구성한다.
+농도/배출량/배출기준은 수집 시 한 번 파싱하여 수치·단위·파싱상태 컬럼(예: 농도값/농도단위/농도상태)으로 함께 보관한다.
+배출기준 매칭 결과처럼 수집 뒤 계산한 컬럼은 attach_columns로 붙인다.
+"""
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from header_mapping import compile_header_map
+from numeric_values import NUMERIC_FIELDS, ROW_UNIT_FIELDS, parse_numeric_column, status_key, unit_key, value_key
+
+# 구조화 행(all_data)의 고정 필드
+ROW_FIELDS = [
+    '페이지', '테이블', '테이블타입', '배출구타입', '배출구번호', '원본배출구', '물질명',
+    '농도', '배출량', '최대배출기준', '허가배출기준', '최대배출기준근거', '허가배출기준근거', '비고', '단위'
+]
+# 원시 행(raw_table_data)의 고정 필드
+RAW_FIELDS = ['페이지', '테이블', '테이블타입']
+
+INT_FIELDS = ('페이지', '테이블')
+# 값 종류가 적어 같은 문자열 객체를 공유하는 필드
+CATEGORY_FIELDS = ('테이블타입', '배출구타입', '단위', '최대배출기준근거', '허가배출기준근거')
+
+ORIGINAL_ROW_KEY = '원본행'
+HEADER_KEY = '헤더'
+
+# 원본 헤더명 키 재구성 방식
+HEADER_COPIES_MAPPED = 'mapped'  # compile_header_map에 잡힌 (빈 칸이 아닌) 헤더만 (구조화 행)
+HEADER_COPIES_ALL = 'all'        # 모든 헤더 (원시 행)
+
+NO_HEADER = -1
+
+def _cell_texts(row):
+    return [str(cell) if cell is not None else "" for cell in row]
+
+class RowStore:
+    """추출 행을 컬럼 단위로 보관하는 저장소
+    
+    - 고정 필드: 필드별 컬럼 (페이지/테이블은 정수 배열, 범주형 필드는 문자열 공유)
+    - 헤더: 같은 헤더는 한 번만 보관하고 행에는 헤더 번호만 기록
+    - 원본 행: 행 번호로 참조하는 보조 테이블 (파싱한 테이블의 행 객체를 복사하지 않고 참조)
+    - 수치 필드: 파싱 결과 컬럼 (parse_numeric으로 아직 파싱하지 않은 뒤쪽 행만 한꺼번에 파싱)
+    - 추가 컬럼: 수집 뒤 attach_columns로 붙인 컬럼 (행 딕셔너리에도 포함)
+    
+    len(), 반복, 인덱싱, + 연산은 기존 행 딕셔너리 목록과 같은 결과(파싱 컬럼 제외)를 돌려주므로
+    행 딕셔너리를 기대하는 코드도 그대로 동작한다. 대량 처리는 column/iter_values/to_dataframe을 쓴다.
+    """
+    
+    def __init__(self, fields=ROW_FIELDS, header_copies=HEADER_COPIES_MAPPED):
+        self.fields = list(fields)
+        self.header_copies = header_copies
+        self.columns = {field: array('i') if field in INT_FIELDS else [] for field in self.fields}
+        self.original_rows = []
+        self.header_ids = array('i')
+        self.headers = []
+        self._header_index = {}
+        self._categories = {}
+        self._fixed_keys = frozenset(self.fields) | {ORIGINAL_ROW_KEY, HEADER_KEY}
+        self.extra = {}
+        
+        # 수치 필드 파싱 컬럼 (필드 → (수치 배열, 단위 목록, 상태 목록))과 파싱된 행 수
+        self.numeric_fields = [field for field in NUMERIC_FIELDS if field in self.fields]
+        self.numeric = {field: (array('d'), [], []) for field in self.numeric_fields}
+        self._numeric_count = 0
+        self._typed_keys = {}
+        for field in self.numeric_fields:
+            self._typed_keys[value_key(field)] = (field, 0)
+            self._typed_keys[unit_key(field)] = (field, 1)
+            self._typed_keys[status_key(field)] = (field, 2)
+    
+    @classmethod
+    def raw(cls):
+        """원시 행(raw_table_data)용 저장소"""
+        return cls(RAW_FIELDS, HEADER_COPIES_ALL)
+    
+    def _intern_header(self, header):
+        if header is None:
+            return NO_HEADER
+        key = tuple(header)
+        header_id = self._header_index.get(key)
+        if header_id is None:
+            header_id = len(self.headers)
+            self._header_index[key] = header_id
+            self.headers.append(header)
+        return header_id
+    
+    def append(self, row):
+        """파서가 만든 행 딕셔너리를 추가 (원본 헤더명 키는 원본 행에서 재구성되므로 버림)"""
+        categories = self._categories
+        for field in self.fields:
+            value = row[field]
+            if field in CATEGORY_FIELDS:
+                value = categories.setdefault(value, value)
+            self.columns[field].append(value)
+        self.original_rows.append(row[ORIGINAL_ROW_KEY])
+        self.header_ids.append(self._intern_header(row.get(HEADER_KEY)))
+        for name, column in self.extra.items():
+            column.append(row.get(name, ''))
+    
+    def parse_numeric(self):
+        """아직 파싱하지 않은 행의 수치 필드를 한꺼번에 파싱하여 파싱 컬럼에 추가"""
+        start = self._numeric_count
+        if start == len(self):
+            return
+        row_units = self.columns['단위'][start:] if '단위' in self.columns else None
+        categories = self._categories
+        for field in self.numeric_fields:
+            values, units, statuses = parse_numeric_column(
+                self.columns[field][start:], row_units if field in ROW_UNIT_FIELDS else None
+            )
+            column_values, column_units, column_statuses = self.numeric[field]
+            column_values.extend(values)
+            column_units.extend(categories.setdefault(unit, unit) for unit in units)
+            column_statuses.extend(statuses)
+        self._numeric_count = len(self)
+    
+    def numeric_columns(self, field):
+        """수치 필드의 (수치 배열, 단위 목록, 상태 목록)"""
+        self.parse_numeric()
+        return self.numeric[field]
+    
+    def attach_columns(self, columns):
+        """행 수와 길이가 같은 컬럼들({컬럼명: 값 목록})을 추가 컬럼으로 붙임 (같은 이름은 교체)"""
+        for name, values in columns.items():
+            values = list(values)
+            if len(values) != len(self):
+                raise ValueError(f"컬럼 길이 불일치: {name} ({len(values)}행, 저장소 {len(self)}행)")
+            if name in self._fixed_keys or name in self._typed_keys:
+                raise ValueError(f"고정 컬럼은 교체할 수 없습니다: {name}")
+            self.extra[name] = values
+    
+    def extend(self, rows):
+        """다른 RowStore 또는 행 딕셔너리들을 이어 붙임"""
+        if not isinstance(rows, RowStore):
+            for row in rows:
+                self.append(row)
+            return
+        
+        # 양쪽 모두 파싱을 끝낸 뒤 파싱 컬럼도 그대로 이어 붙임 (다시 파싱하지 않음)
+        self.parse_numeric()
+        rows.parse_numeric()
+        for field in self.numeric_fields:
+            for column, other_column in zip(self.numeric[field], rows.numeric[field]):
+                column.extend(other_column)
+        self._numeric_count += len(rows)
+        
+        # 한쪽에만 있는 추가 컬럼은 빈 문자열로 채움
+        for name in rows.extra:
+            if name not in self.extra:
+                self.extra[name] = [''] * len(self)
+        for name, column in self.extra.items():
+            column.extend(rows.extra.get(name, [''] * len(rows)))
+        
+        for field in self.fields:
+            self.columns[field].extend(rows.columns[field])
+        self.original_rows.extend(rows.original_rows)
+        remap = [self._intern_header(header) for header in rows.headers]
+        self.header_ids.extend(
+            remap[header_id] if header_id != NO_HEADER else NO_HEADER for header_id in rows.header_ids
+        )
+    
+    def __add__(self, other):
+        combined = RowStore(self.fields, self.header_copies)
+        combined.extend(self)
+        combined.extend(other)
+        return combined
+    
+    def __len__(self):
+        return len(self.original_rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.row(index)
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+    
+    def _header_copy_columns(self, header, reserved=()):
+        """헤더에서 원본 헤더명 키로 복사되는 (열 번호, 헤더명) 목록 (고정 키·reserved와 겹치는 이름 제외)"""
+        if self.header_copies == HEADER_COPIES_MAPPED:
+            pairs = [(j, header_name) for j, _, header_name in compile_header_map(tuple(header))]
+        else:
+            pairs = list(enumerate(header))
+        return [
+            (j, header_name) for j, header_name in pairs
+            if header_name not in self._fixed_keys and header_name not in reserved
+        ]
+    
+    def row(self, index):
+        """index번째 행을 기존 형식의 행 딕셔너리로 재구성"""
+        row_data = {field: self.columns[field][index] for field in self.fields}
+        for name, column in self.extra.items():
+            row_data[name] = column[index]
+        original_row = self.original_rows[index]
+        row_data[ORIGINAL_ROW_KEY] = original_row
+        
+        header_id = self.header_ids[index]
+        if header_id != NO_HEADER:
+            header = self.headers[header_id]
+            row_data[HEADER_KEY] = header
+            texts = _cell_texts(original_row)
+            for j, header_name in self._header_copy_columns(header, self.extra):
+                if j < len(texts):
+                    row_data[header_name] = texts[j]
+        
+        return row_data
+    
+    def column(self, name):
+        """필드 컬럼 (원본행/헤더/파싱 컬럼/추가 컬럼 포함, 원본 헤더명 키는 지원하지 않음)"""
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.extra:
+            return self.extra[name]
+        if name in self._typed_keys:
+            field, part = self._typed_keys[name]
+            return self.numeric_columns(field)[part]
+        if name == ORIGINAL_ROW_KEY:
+            return self.original_rows
+        if name == HEADER_KEY:
+            return [self.headers[header_id] if header_id != NO_HEADER else None for header_id in self.header_ids]
+        raise KeyError(name)
+    
+    def header_values(self, keyword, default=''):
+        """행마다 헤더명에 keyword가 들어간 첫 열의 셀 값 (해당 열이 없으면 default)
+        
+        원본 헤더명 키 중 '시설구분'·'시설명'처럼 고정 필드로 매핑되지 않은 열을 읽을 때 쓴다.
+        """
+        positions = [
+            next((j for j, header_name in enumerate(header) if keyword in ''.join(str(header_name or '').split())), None)
+            for header in self.headers
+        ]
+        values = []
+        for header_id, original_row in zip(self.header_ids, self.original_rows):
+            j = positions[header_id] if header_id != NO_HEADER else None
+            if j is None or j >= len(original_row) or original_row[j] is None:
+                values.append(default)
+            else:
+                values.append(str(original_row[j]))
+        return values
+    
+    def iter_values(self, fields, default=''):
+        """행마다 fields 순서의 값 목록을 yield (행 딕셔너리를 만들지 않음)"""
+        columns = []
+        for field in fields:
+            try:
+                column = self.column(field)
+            except KeyError:
+                column = [default] * len(self)
+            if field == HEADER_KEY:
+                column = [default if header is None else header for header in column]
+            columns.append(column)
+        return (list(values) for values in zip(*columns))
+    
+    def to_dataframe(self):
+        """pandas DataFrame으로 변환 (행 딕셔너리 목록을 DataFrame으로 만든 컬럼 구성 + 고정 필드 뒤 파싱·추가 컬럼)"""
+        length = len(self)
+        frame_columns = {
+            field: np.asarray(self.columns[field], dtype=np.int64) if field in INT_FIELDS else self.columns[field]
+            for field in self.fields
+        }
+        for typed_key, (_, part) in self._typed_keys.items():
+            column = self.column(typed_key)
+            frame_columns[typed_key] = np.asarray(column, dtype=np.float64) if part == 0 else column
+        frame_columns.update(self.extra)
+        frame_columns[ORIGINAL_ROW_KEY] = self.original_rows
+        if not self.headers:
+            return pd.DataFrame(frame_columns, columns=list(frame_columns))
+        
+        header_ids = np.frombuffer(self.header_ids, dtype=np.int32) if length else np.zeros(0, dtype=np.int32)
+        header_objects = np.empty(len(self.headers) + 1, dtype=object)
+        for header_id, header in enumerate(self.headers):
+            header_objects[header_id] = header
+        header_objects[NO_HEADER] = np.nan
+        frame_columns[HEADER_KEY] = header_objects[header_ids]
+        
+        # 원본 헤더명 컬럼: 헤더별로 해당 행만 모아 원본 행에서 값을 채움
+        # (파싱·추가 컬럼과 이름이 같은 헤더는 건너뜀, 덮어쓰면 수치 컬럼이 문자열로 바뀌므로)
+        reserved = self._typed_keys.keys() | self.extra.keys()
+        for header_id, header in enumerate(self.headers):
+            positions = np.flatnonzero(header_ids == header_id).tolist()
+            for j, header_name in self._header_copy_columns(header, reserved):
+                column = frame_columns.get(header_name)
+                if column is None:
+                    column = frame_columns[header_name] = np.full(length, np.nan, dtype=object)
+                for position in positions:
+                    original_row = self.original_rows[position]
+                    if j < len(original_row):
+                        cell = original_row[j]
+                        column[position] = str(cell) if cell is not None else ""
+        
+        return pd.DataFrame(frame_columns, columns=list(frame_columns))
+
+def iter_field_values(data, fields, default=''):
+    """RowStore 또는 행 딕셔너리 목록에서 행마다 fields 순서의 값 목록을 yield"""
+    if isinstance(data, RowStore):
+        return data.iter_values(fields, default)
+    return ([row.get(field, default) for field in fields] for row in data)
+
+def iter_records(data, fields):
+    """RowStore는 fields만 담은 가벼운 딕셔너리로, 행 딕셔너리 목록은 그대로 yield"""
+    if isinstance(data, RowStore):
+        return (dict(zip(fields, values)) for values in data.iter_values(fields))
+    return iter(data)
@@ -0,0 +1,282 @@
+"""별표8/별표15 배출기준 매칭
+
+추출 행의 배출기준 근거(최대배출기준근거/허가배출기준근거)가 가리키는 별표 기준표에서
+(별표, 물질명, 시설구분)으로 적용 기준값을 찾아 붙이고, 농도가 기준을 넘는 행을 표시한다.
+
+기준표는 별표별 CSV/엑셀 파일(예: '별표8.xlsx', '별표15.csv')로 두며 다음 컬럼을 읽는다.
+    물질명 (필수), 기준값 (필수, '50(12) 이하' 같은 표기 허용), 시설구분 (선택), 단위 (선택), 별표 (선택, 없으면 파일명)
+시설구분이 빈 행은 해당 물질의 공통 기준으로 쓰인다.
+"""
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from numeric_values import (
+    STATUS_RANGE, UPPER_BOUND_STATUSES, VALUE_STATUSES, normalize_unit, numeric_columns, parse_numeric, range_bounds
+)
+from row_store import HEADER_KEY, ORIGINAL_ROW_KEY, RowStore, iter_field_values
+
+# 기준표 위치 (디렉터리 안의 별표*.csv / 별표*.xlsx를 읽음)
+DEFAULT_STANDARDS_DIR = os.environ.get(
+    "EMISSION_STANDARDS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "standards")
+)
+STANDARDS_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+
+ANNEX_8 = '별표8'
+ANNEX_15 = '별표15'
+
+# 배출기준 근거 문구 → 기준표 파일명 (위에서부터 처음 일치하는 규칙 적용)
+BASIS_PATTERNS = [
+    (re.compile(r'별표\s*8.*?15'), "별표8과15.xlsx"),
+    (re.compile(r'별표\s*15.*?8'), "별표8과15.xlsx"),
+    (re.compile(r'별표.*?8'), "별표8.xlsx"),
+    (re.compile(r'별표.*?15'), "별표15.xlsx"),
+]
+# 기준표 파일명 → 적용 별표
+BASIS_ANNEXES = {
+    "별표8과15.xlsx": (ANNEX_8, ANNEX_15),
+    "별표8.xlsx": (ANNEX_8,),
+    "별표15.xlsx": (ANNEX_15,),
+}
+# 행의 어느 근거 컬럼을 먼저 볼지
+BASIS_COLUMNS = ['최대배출기준근거', '허가배출기준근거']
+
+# 시설구분이 이 값들이면 공통 기준으로 취급
+COMMON_FACILITY_CLASSES = frozenset(['', '공통', '전체', '모든시설', '일반'])
+# 행에서 시설구분을 읽을 원본 헤더 키워드
+FACILITY_HEADER_KEYWORD = '시설'
+
+# 매칭 결과 컬럼
+LIMIT_COLUMN = '적용기준값'          # 기준이 없으면 NaN
+LIMIT_UNIT_COLUMN = '적용기준단위'
+LIMIT_SOURCE_COLUMN = '적용기준출처'
+JUDGEMENT_COLUMN = '기준판정'
+STANDARDS_COLUMNS = [LIMIT_COLUMN, LIMIT_UNIT_COLUMN, LIMIT_SOURCE_COLUMN, JUDGEMENT_COLUMN]
+
+JUDGEMENT_EXCEEDED = '초과'
+JUDGEMENT_OK = '적합'
+JUDGEMENT_UNIT_MISMATCH = '단위확인'
+JUDGEMENT_NO_VALUE = '측정값없음'
+JUDGEMENT_UNCERTAIN = '판정불가'  # '5 미만'·'3~5'처럼 실제 값이 기준 위아래에 모두 걸칠 수 있음
+
+BASIS_CACHE_SIZE = 1024
+
+_PARENTHESES = re.compile(r'\([^)]*\)')
+
+@lru_cache(maxsize=BASIS_CACHE_SIZE)
+def basis_filename(basis_text):
+    """배출기준 근거 문구를 기준표 파일명으로 변환 (해당 없으면 원문을 다듬어 그대로)"""
+    basis_text = str(basis_text).strip()
+    for pattern, filename in BASIS_PATTERNS:
+        if pattern.search(basis_text):
+            return filename
+    return basis_text
+
+@lru_cache(maxsize=BASIS_CACHE_SIZE)
+def basis_annexes(basis_text):
+    """배출기준 근거(원문 또는 기준표 파일명)가 가리키는 별표 목록"""
+    if not basis_text:
+        return ()
+    return BASIS_ANNEXES.get(basis_filename(basis_text), ())
+
+def normalize_substance_name(substance):
+    """물질명 정규화 (공백 제거, 소문자)"""
+    return ''.join(str(substance or '').split()).lower()
+
+def _substance_aliases(substance):
+    """기준표 조회에 쓰는 물질명 키들 ('황산화물(SOx)' → '황산화물(sox)', '황산화물')"""
+    name = normalize_substance_name(substance)
+    bare = _PARENTHESES.sub('', name)
+    return (name, bare) if bare and bare != name else (name,)
+
+def normalize_facility_class(facility):
+    return ''.join(str(facility or '').split())
+
+class StandardsIndex:
+    """별표 기준표 인덱스: (별표, 정규화 물질명) → {시설구분: (기준값, 단위, 출처)}
+    
+    기준표는 한 번만 읽어 인덱스로 만들고, 행 매칭은 attach_standards에서
+    (별표 목록, 물질명, 시설구분) 고유 조합마다 한 번씩만 조회한다.
+    """
+    
+    def __init__(self):
+        self._entries = {}
+        self.annexes = set()
+    
+    def __len__(self):
+        return sum(len(classes) for classes in self._entries.values())
+    
+    def add(self, annex, substance, limit_text, facility_class='', unit=''):
+        """기준 한 건 추가 (기준값이 수치로 읽히지 않으면 무시하고 False 반환)"""
+        limit, limit_unit, status = parse_numeric(limit_text)
+        if status not in VALUE_STATUSES:
+            return False
+        
+        facility_class = normalize_facility_class(facility_class)
+        if facility_class in COMMON_FACILITY_CLASSES:
+            facility_class = ''
+        source = f"{annex}/{facility_class}" if facility_class else annex
+        entry = (limit, normalize_unit(unit) or limit_unit, source)
+        for key in _substance_aliases(substance):
+            self._entries.setdefault((annex, key), {}).setdefault(facility_class, entry)
+        self.annexes.add(annex)
+        return True
+    
+    def add_table(self, table, annex=None):
+        """기준표 DataFrame 추가 ('별표' 컬럼이 있으면 행마다 그 값을 사용)"""
+        added = 0
+        for record in table.fillna('').to_dict('records'):
+            row_annex = str(record.get('별표', '') or annex or '').strip()
+            if not row_annex or not record.get('물질명'):
+                continue
+            added += self.add(
+                row_annex.replace(' ', ''), record['물질명'], record.get('기준값', ''),
+                record.get('시설구분', ''), record.get('단위', '')
+            )
+        return added
+    
+    def add_file(self, path_or_file, filename=None):
+        """기준표 파일(CSV/엑셀, 경로 또는 업로드 파일 객체) 추가. 별표는 파일명에서 판단"""
+        filename = filename or getattr(path_or_file, 'name', None) or str(path_or_file)
+        annex = _annex_from_filename(filename)
+        if filename.lower().endswith('.csv'):
+            table = pd.read_csv(path_or_file, dtype=str, encoding='utf-8-sig')
+        else:
+            table = pd.read_excel(path_or_file, dtype=str)
+        table.columns = [str(column).strip() for column in table.columns]
+        return self.add_table(table, annex)
+    
+    def lookup(self, annexes, substance, facility=''):
+        """적용 기준 (기준값, 단위, 출처) 또는 None
+        
+        시설구분은 정확히 같은 항목 → 행의 시설 문구에 포함된 항목(긴 이름 우선) → 공통 기준 순으로 찾고,
+        여러 별표가 적용되면 가장 엄격한(작은) 기준을 쓴다.
+        """
+        facility = normalize_facility_class(facility)
+        best = None
+        for annex in annexes:
+            for key in _substance_aliases(substance):
+                classes = self._entries.get((annex, key))
+                if classes:
+                    entry = _match_facility(classes, facility)
+                    if entry and (best is None or entry[0] < best[0]):
+                        best = entry
+                    break
+        return best
+
+def _match_facility(classes, facility):
+    if facility in classes:
+        return classes[facility]
+    for facility_class in sorted(classes, key=len, reverse=True):
+        if facility_class and facility_class in facility:
+            return classes[facility_class]
+    return classes.get('')
+
+def _annex_from_filename(filename):
+    match = re.search(r'별표\s*(\d+)', os.path.basename(filename))
+    return f"별표{match.group(1)}" if match else None
+
+def load_standards(directory=DEFAULT_STANDARDS_DIR):
+    """디렉터리의 별표 기준표 파일을 읽어 StandardsIndex 생성 (디렉터리가 없으면 빈 인덱스)"""
+    index = StandardsIndex()
+    if directory and os.path.isdir(directory):
+        for filename in sorted(os.listdir(directory)):
+            if filename.lower().endswith(STANDARDS_EXTENSIONS) and _annex_from_filename(filename):
+                index.add_file(os.path.join(directory, filename))
+    return index
+
+def _facility_texts(data):
+    """행마다 헤더명에 '시설'이 들어간 원본 열의 값 (없으면 빈 문자열)"""
+    if isinstance(data, RowStore):
+        return data.header_values(FACILITY_HEADER_KEYWORD)
+    texts = []
+    for row in data:
+        header = row.get(HEADER_KEY) or []
+        original_row = row.get(ORIGINAL_ROW_KEY) or []
+        j = next((j for j, header_name in enumerate(header) if FACILITY_HEADER_KEYWORD in ''.join(str(header_name or '').split())), None)
+        texts.append(str(original_row[j]) if j is not None and j < len(original_row) and original_row[j] is not None else '')
+    return texts
+
+def _row_annexes(basis_values):
+    for basis in basis_values:
+        annexes = basis_annexes(basis)
+        if annexes:
+            return annexes
+    return ()
+
+def match_standards(data, index):
+    """행마다 적용 기준을 찾고 농도와 비교한 결과 컬럼 {컬럼명: 값 목록} 반환
+    
+    (별표 목록, 물질명, 시설구분) 조합을 먼저 모아 고유 조합만 조회한 뒤 행으로 펼친다.
+    미만/이하/범위 농도는 수치가 상한이므로, 상한이 기준을 넘어도 초과가 아니라 판정불가로 둔다
+    (범위는 하한까지 기준을 넘으면 초과).
+    """
+    length = len(data)
+    annexes = [_row_annexes(values) for values in iter_field_values(data, BASIS_COLUMNS)]
+    substances = [values[0] for values in iter_field_values(data, ['물질명'])]
+    facilities = _facility_texts(data)
+    
+    keys = list(zip(annexes, substances, facilities))
+    codes, unique_keys = pd.factorize(pd.Series(keys, dtype=object))
+    resolved = [index.lookup(*key) if key[0] else None for key in unique_keys]
+    
+    limits = np.full(len(resolved), np.nan)
+    limit_units = np.empty(len(resolved), dtype=object)
+    sources = np.empty(len(resolved), dtype=object)
+    for position, entry in enumerate(resolved):
+        limit_units[position] = entry[1] if entry else ''
+        sources[position] = entry[2] if entry else ''
+        if entry:
+            limits[position] = entry[0]
+    row_limits = limits[codes] if length else limits[:0]
+    row_limit_units = limit_units[codes] if length else limit_units[:0]
+    
+    values, units, statuses = numeric_columns(data, '농도')
+    values = np.asarray(values, dtype=np.float64)
+    has_limit = ~np.isnan(row_limits)
+    has_value = np.fromiter((status in VALUE_STATUSES for status in statuses), dtype=bool, count=length)
+    upper_bound = np.fromiter((status in UPPER_BOUND_STATUSES for status in statuses), dtype=bool, count=length)
+    unit_mismatch = np.fromiter(
+        (bool(unit and limit_unit and unit != limit_unit) for unit, limit_unit in zip(units, row_limit_units)),
+        dtype=bool, count=length
+    )
+    
+    judgements = np.full(length, '', dtype=object)
+    judgements[has_limit] = JUDGEMENT_NO_VALUE
+    comparable = has_limit & has_value & ~unit_mismatch
+    judgements[has_limit & has_value & unit_mismatch] = JUDGEMENT_UNIT_MISMATCH
+    judgements[comparable] = JUDGEMENT_OK
+    above = comparable & (values > np.where(has_limit, row_limits, np.inf))
+    judgements[above & ~upper_bound] = JUDGEMENT_EXCEEDED
+    judgements[above & upper_bound] = JUDGEMENT_UNCERTAIN
+    ranges = np.flatnonzero(above & upper_bound).tolist()
+    ranges = [position for position in ranges if statuses[position] == STATUS_RANGE]
+    if ranges:
+        texts = data.column('농도') if isinstance(data, RowStore) else [row.get('농도', '') for row in data]
+        for position in ranges:
+            low, _ = range_bounds(texts[position])
+            if low > row_limits[position]:
+                judgements[position] = JUDGEMENT_EXCEEDED
+    
+    return {
+        LIMIT_COLUMN: row_limits.tolist(),
+        LIMIT_UNIT_COLUMN: row_limit_units.tolist(),
+        LIMIT_SOURCE_COLUMN: (sources[codes] if length else sources[:0]).tolist(),
+        JUDGEMENT_COLUMN: judgements.tolist(),
+    }
+
+def attach_standards(data, index):
+    """match_standards 결과를 행에 붙이고 기준 초과 행 수를 반환
+    
+    RowStore에는 컬럼으로, 행 딕셔너리 목록에는 키로 추가한다.
+    """
+    columns = match_standards(data, index)
+    if isinstance(data, RowStore):
+        data.attach_columns(columns)
+    else:
+        for row, values in zip(data, zip(*columns.values())):
+            row.update(zip(columns, values))
+    return sum(judgement == JUDGEMENT_EXCEEDED for judgement in columns[JUDGEMENT_COLUMN])
@@ -0,0 +1,204 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from numeric_values import NUMERIC_FIELDS, STATUS_FAILED, numeric_columns, parse_numeric_column, status_key
+from row_store import RowStore
+from standards import JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED, LIMIT_COLUMN, LIMIT_SOURCE_COLUMN, LIMIT_UNIT_COLUMN
+
+# 검증 규칙이 읽는 컬럼과 이슈 보고에 쓰는 컬럼
+CHECK_COLUMNS = [
+    '배출구번호', '물질명', '농도', '배출량', '최대배출기준', '허가배출기준', '최대배출기준근거', '테이블타입',
+    LIMIT_COLUMN, LIMIT_UNIT_COLUMN, LIMIT_SOURCE_COLUMN, JUDGEMENT_COLUMN
+]
+REPORT_COLUMNS = ['원본배출구', '물질명', '페이지', '테이블타입']
+
+REQUIRED_FIELDS = ['배출구번호', '물질명']
+# 수치 필드는 수집 시 파싱된 상태 컬럼(농도상태 등)으로 검증
+STATUS_COLUMNS = [status_key(field) for field in NUMERIC_FIELDS]
+
+OUTLET_FORMAT_PATTERN = re.compile(r'^#?[A-Z]+\d*$')
+
+ISSUE_SEPARATOR = ', '
+
+# 검증 규칙 레지스트리: ColumnFrame → (이슈 행 bool 배열, 문제점 문자열 또는 행별 문자열 배열)
+# 등록 순서가 곧 한 행의 문제점이 나열되는 순서다.
+VALIDATION_RULES = []
+
+def register_rule(rule):
+    """검증 규칙 등록 (데코레이터로도 사용)"""
+    VALIDATION_RULES.append(rule)
+    return rule
+
+def _present(value):
+    """행 단위 검증의 bool(값)과 같은 판정 (NaN 결측값은 비어 있는 것으로 봄)"""
+    return bool(value) and value == value
+
+class ColumnFrame:
+    """검증용 컬럼 저장소
+    
+    컬럼마다 값을 한 번만 인코딩(factorize)하여 (코드 배열, 고유값)으로 보관한다.
+    규칙의 판정 함수는 고유값에만 적용되고, 결과는 코드 배열 인덱싱으로 전체 행에 펼쳐진다.
+    배출구번호·물질명·기준값처럼 반복이 많은 컬럼에서는 정규식 호출이 고유값 수로 줄어든다.
+    """
+    
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+        self._encoded = {}
+    
+    def __len__(self):
+        return self.length
+    
+    def encoded(self, name):
+        """컬럼의 (코드 배열, 고유값 목록)"""
+        if name not in self._encoded:
+            codes, uniques = pd.factorize(np.asarray(self.columns[name], dtype=object), use_na_sentinel=False)
+            self._encoded[name] = (codes, list(uniques))
+        return self._encoded[name]
+    
+    def apply(self, name, func, dtype=bool):
+        """고유값마다 func을 한 번 적용한 결과를 행 배열로 반환"""
+        codes, uniques = self.encoded(name)
+        return np.fromiter((func(value) for value in uniques), dtype=dtype, count=len(uniques))[codes]
+    
+    def messages(self, name, mask, func):
+        """mask에 해당하는 행의 값에만 func을 적용한 문자열 배열 (나머지는 None)"""
+        codes, uniques = self.encoded(name)
+        by_code = np.full(len(uniques), None, dtype=object)
+        for code in np.unique(codes[mask]).tolist():
+            by_code[code] = func(uniques[code])
+        return by_code[codes]
+    
+    def present(self, name):
+        return self.apply(name, _present)
+    
+    def equals(self, name, target):
+        return self.apply(name, lambda value: value == target)
+    
+    def values(self, name):
+        return self.columns[name]
+
+def _required_rule(field):
+    def check(frame):
+        return (
+            frame.apply(field, lambda value: not _present(value) or str(value).strip() == ''),
+            f"필수 필드 누락: {field}"
+        )
+    return check
+
+def _numeric_rule(field):
+    def check(frame):
+        mask = frame.equals(status_key(field), STATUS_FAILED)
+        return mask, frame.messages(field, mask, lambda value: f"숫자 형식 오류: {field} = {value}")
+    return check
+
+# 필수 필드 체크
+for _field in REQUIRED_FIELDS:
+    register_rule(_required_rule(_field))
+
+@register_rule
+def check_outlet_format(frame):
+    """배출구 번호 형식 체크"""
+    mask = frame.apply('배출구번호', lambda value: _present(value) and not OUTLET_FORMAT_PATTERN.match(str(value)))
+    return mask, frame.messages('배출구번호', mask, lambda value: f"배출구번호 형식 오류: {value}")
+
+# 숫자 필드 검증 (천 단위 쉼표, 범위, '-', '이하' 등은 numeric_values.parse_numeric이 해석)
+for _field in NUMERIC_FIELDS:
+    register_rule(_numeric_rule(_field))
+
+@register_rule
+def check_basis_present(frame):
+    """배출기준과 근거 일치성 체크"""
+    return frame.present('최대배출기준') & ~frame.present('최대배출기준근거'), "최대배출기준 근거 누락"
+
+@register_rule
+def check_standards_value(frame):
+    """테이블 타입별 추가 검증: 배출기준 테이블에는 기준값이 있어야 함"""
+    has_standard = frame.present('최대배출기준') | frame.present('허가배출기준')
+    return frame.equals('테이블타입', 'emission_standards') & ~has_standard, "배출기준 테이블에 기준값 없음"
+
+@register_rule
+def check_standards_exceeded(frame):
+    """적용 배출기준 초과 (standards.attach_standards로 기준을 붙인 데이터만 해당)"""
+    mask = frame.equals(JUDGEMENT_COLUMN, JUDGEMENT_EXCEEDED)
+    messages = np.full(len(frame), None, dtype=object)
+    for position in np.flatnonzero(mask).tolist():
+        messages[position] = (
+            f"배출기준 초과: 농도 {frame.values('농도')[position]} > "
+            f"{frame.values(LIMIT_COLUMN)[position]:g}{frame.values(LIMIT_UNIT_COLUMN)[position]} "
+            f"({frame.values(LIMIT_SOURCE_COLUMN)[position]})"
+        )
+    return mask, messages
+
+def build_column_frame(data, columns=None):
+    """RowStore, 행 딕셔너리 목록 또는 DataFrame에서 검증에 필요한 컬럼만 뽑아 ColumnFrame 생성"""
+    columns = columns or list(dict.fromkeys(CHECK_COLUMNS + REPORT_COLUMNS))
+    
+    if isinstance(data, RowStore):
+        extracted = {
+            column: data.column(column) if column in data.fields or column in data.extra else [''] * len(data)
+            for column in columns
+        }
+        for field in NUMERIC_FIELDS:
+            extracted[status_key(field)] = data.column(status_key(field))
+        return ColumnFrame(extracted, len(data))
+    
+    if isinstance(data, pd.DataFrame):
+        extracted = {}
+        for column in columns + STATUS_COLUMNS:
+            if column in data:
+                series = data[column].astype(object)
+                extracted[column] = series.where(series.notna(), '').tolist()
+            elif column not in STATUS_COLUMNS:
+                extracted[column] = [''] * len(data)
+        for field in NUMERIC_FIELDS:
+            if status_key(field) not in extracted:
+                extracted[status_key(field)] = parse_numeric_column(extracted[field])[2]
+        return ColumnFrame(extracted, len(data))
+    
+    extracted = {column: [row.get(column, '') for row in data] for column in columns}
+    for field in NUMERIC_FIELDS:
+        extracted[status_key(field)] = numeric_columns(data, field)[2]
+    return ColumnFrame(extracted, len(data))
+
+def validate_data_accuracy(data, row_offset=0, rules=None):
+    """데이터 정확성 검증 및 불확실한 데이터 기록 (컬럼 단위 검증)
+    
+    각 규칙은 행마다가 아니라 컬럼 전체에 대해 한 번씩 실행되고, 이슈가 있는 행에만
+    문제점 문자열을 이어 붙인다. data는 RowStore, 행 딕셔너리 목록, DataFrame 모두 받는다.
+    스트리밍 추출처럼 행을 나누어 검증할 때는 앞서 검증한 행 수를 row_offset으로 넘겨
+    행번호가 전체 기준으로 이어지게 한다.
+    """
+    if len(data) == 0:
+        return []
+    
+    frame = build_column_frame(data)
+    issues = np.full(len(frame), '', dtype=object)
+    
+    for rule in rules or VALIDATION_RULES:
+        mask, message = rule(frame)
+        if not mask.any():
+            continue
+        
+        current = issues[mask]
+        prefix = np.where(current == '', current, current + ISSUE_SEPARATOR)
+        if isinstance(message, np.ndarray):
+            message = message[mask]
+        issues[mask] = prefix + message
+    
+    positions = np.flatnonzero(issues != '').tolist()
+    
+    validation_issues = []
+    for position in positions:
+        validation_issues.append({
+            '행번호': row_offset + position + 1,
+            '배출구': frame.values('원본배출구')[position],
+            '물질명': frame.values('물질명')[position],
+            '페이지': frame.values('페이지')[position],
+            '테이블타입': frame.values('테이블타입')[position],
+            '문제점': issues[position]
+        })
+    
+    return validation_issues
@@ -1,15 +1,26 @@
 import streamlit as st
 import pandas as pd
-import pdfplumber
-from io import BytesIO
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-import re
 from datetime import datetime
+from io import BytesIO
+import time
 import warnings
+from pdf_extractor import DEFAULT_WORKERS, EXTRACT_TIME_KEY, MIN_PARALLEL_PAGES
+from extraction_cache import ExtractionCache
+from standards import load_standards
+from profiling import StageProfiler
+from extraction_profiles import PROFILE_AUTO, PROFILE_CHOICES, PROFILE_DEFAULT, PROFILES
+from pdf_io import MEMORY_LIMIT, SpooledUpload, current_memory_bytes
+from page_supervisor import DEFAULT_PAGE_TIMEOUT, PageSupervision, unfinished_pages
+from pipeline import PLAN_LABEL, REVIEW_LABEL, process_uploads
+from bulk_export import available_formats
+from preview import DEFAULT_PAGE_SIZE, FILTER_OUTLET, FILTER_SUBSTANCE, FILTER_TABLE_TYPE, PAGE_SIZES
+from jobs import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JobManager
 warnings.filterwarnings('ignore')
 
+# 세션에 기억하는 현재 작업 ID와 진행 상황 갱신 간격 (초)
+JOB_STATE_KEY = 'job_id'
+POLL_INTERVAL = 0.5
+
 # 페이지 설정
 st.set_page_config(
     page_title="배출구 데이터 추출 웹 서비스",
@@ -17,427 +28,44 @@ st.set_page_config(
     layout="wide"
 )
 
-def detect_table_structure(table):
-    """테이블 구조를 분석하여 타입을 결정"""
-    if not table or len(table) < 2:
-        return "unknown"
-    
-    # 첫 번째 행에서 구조 분석
-    first_row = table[0] if table[0] else []
-    second_row = table[1] if len(table) > 1 and table[1] else []
-    
-    # 헤더 키워드 확인
-    header_text = ' '.join([str(cell) for cell in first_row + second_row if cell])
-    
-    if any(keyword in header_text for keyword in ['배출구', '물질명', '농도', '배출량']):
-        if '최대배출기준' in header_text or '허가배출기준' in header_text:
-            return "emission_standards"  # 배출기준 테이블
-        else:
-            return "emission_data"  # 기본 배출 데이터 테이블
-    elif '허가조건' in header_text or '조건' in header_text:
-        return "permit_conditions"  # 허가조건 테이블
-    else:
-        return "general"  # 일반 테이블
+@st.cache_resource
+def get_extraction_cache():
+    """세션 간에 공유되는 추출 결과 캐시"""
+    return ExtractionCache()
 
-def extract_complex_table_data(table, table_type, page_num, table_idx):
-    """복잡한 테이블 구조에서 데이터 추출"""
-    extracted_data = []
-    
-    if table_type == "emission_standards":
-        # 배출기준 테이블 처리
-        header_row_idx = None
-        
-        # 헤더 찾기 (복합 헤더 고려)
-        for i, row in enumerate(table):
-            if row and any(cell and ('배출구' in str(cell) or '물질명' in str(cell)) for cell in row):
-                header_row_idx = i
-                break
-        
-        if header_row_idx is not None:
-            # 복합 헤더 처리
-            headers = []
-            if header_row_idx + 1 < len(table):
-                # 두 행으로 구성된 헤더인지 확인
-                main_headers = table[header_row_idx]
-                sub_headers = table[header_row_idx + 1] if header_row_idx + 1 < len(table) else []
-                
-                for i, main_header in enumerate(main_headers):
-                    if main_header:
-                        headers.append(str(main_header))
-                    elif i < len(sub_headers) and sub_headers[i]:
-                        headers.append(str(sub_headers[i]))
-                    else:
-                        headers.append(f"컬럼{i+1}")
-                
-                # 데이터 행 처리
-                data_start_idx = header_row_idx + 2 if sub_headers else header_row_idx + 1
-                
-                for row_idx in range(data_start_idx, len(table)):
-                    row = table[row_idx]
-                    if row and any(cell for cell in row):
-                        # 배출구 번호 확인
-                        first_cell = str(row[0]) if row[0] else ""
-                        if first_cell.startswith('#') or any(char.isalpha() for char in first_cell):
-                            row_data = {
-                                '페이지': page_num,
-                                '테이블': table_idx + 1,
-                                '테이블타입': table_type,
-                                '원본행': row,
-                                '헤더': headers
-                            }
-                            
-                            # 각 컬럼 데이터 매핑
-                            for col_idx, header in enumerate(headers):
-                                if col_idx < len(row):
-                                    value = str(row[col_idx]) if row[col_idx] is not None else ""
-                                    row_data[header] = value
-                            
-                            extracted_data.append(row_data)
-    
-    elif table_type == "emission_data":
-        # 기본 배출 데이터 테이블 처리
-        for i, row in enumerate(table):
-            if row and any(cell and ('배출구' in str(cell) or '#' in str(cell)) for cell in row):
-                # 데이터 행 처리
-                for data_row in table[i:]:
-                    if data_row and len(data_row) > 0:
-                        first_cell = str(data_row[0]) if data_row[0] else ""
-                        if first_cell.startswith('#'):
-                            row_data = {
-                                '페이지': page_num,
-                                '테이블': table_idx + 1,
-                                '테이블타입': table_type,
-                                '원본행': data_row
-                            }
-                            extracted_data.append(row_data)
-                break
-    
-    return extracted_data
+@st.cache_resource
+def get_job_manager():
+    """서버 전체에서 공유하는 백그라운드 작업 관리자 (동시 실행 작업 수 제한)"""
+    return JobManager()
 
-def extract_table_from_pdf(pdf_file, selected_outlets=['#A', '#B', '#C']):
-    """PDF에서 배출구 데이터를 추출하는 함수 (개선됨)"""
-    all_data = []
-    page_info = []
-    raw_table_data = []
-    
-    with pdfplumber.open(pdf_file) as pdf:
-        total_pages = len(pdf.pages)
-        
-        for page_num, page in enumerate(pdf.pages, 1):
-            # 진행률 표시
-            progress = page_num / total_pages
-            st.progress(progress, text=f"페이지 {page_num}/{total_pages} 처리 중...")
-            
-            # 테이블 추출
-            tables = page.extract_tables()
-            page_tables_count = 0
-            page_data_count = 0
-            
-            if tables:
-                for table_idx, table in enumerate(tables):
-                    if table and len(table) > 0:
-                        page_tables_count += 1
-                        
-                        # 테이블 구조 분석
-                        table_type = detect_table_structure(table)
-                        
-                        # 복잡한 테이블 데이터 추출
-                        complex_data = extract_complex_table_data(table, table_type, page_num, table_idx)
-                        raw_table_data.extend(complex_data)
-                        
-                        # 기존 로직으로 기본 데이터 추출
-                        header_row = None
-                        for i, row in enumerate(table):
-                            if row and any(cell and ('배출구' in str(cell) or '물질명' in str(cell) or '농도' in str(cell)) for cell in row):
-                                header_row = i
-                                break
-                        
-                        if header_row is not None:
-                            headers = table[header_row]
-                            data_rows = table[header_row + 1:]
-                            
-                            # 선택된 배출구 타입으로 필터링
-                            for row in data_rows:
-                                if row and len(row) > 0:
-                                    first_cell = str(row[0]) if row[0] else ""
-                                    
-                                    # 선택된 배출구 타입 확인
-                                    for outlet_type in selected_outlets:
-                                        if first_cell.startswith(outlet_type):
-                                            # 배출구 번호 추출 (더 정교한 패턴)
-                                            outlet_patterns = [
-                                                r'(#[A-Z]+\d*)',  # #A1, #B2 등
-                                                r'(#[A-Z]+)',     # #A, #B 등
-                                                r'([A-Z]+\d*)',   # A1, B2 등
-                                            ]
-                                            
-                                            outlet_number = first_cell
-                                            for pattern in outlet_patterns:
-                                                match = re.match(pattern, first_cell)
-                                                if match:
-                                                    outlet_number = match.group(1)
-                                                    break
-                                            
-                                            # 기본 데이터 구조
-                                            row_data = {
-                                                '페이지': page_num,
-                                                '테이블': table_idx + 1,
-                                                '테이블타입': table_type,
-                                                '배출구타입': outlet_type,
-                                                '배출구번호': outlet_number,
-                                                '원본배출구': first_cell,
-                                                '물질명': '',
-                                                '농도': '',
-                                                '배출량': '',
-                                                '최대배출기준': '',
-                                                '허가배출기준': '',
-                                                '최대배출기준근거': '',
-                                                '허가배출기준근거': '',
-                                                '비고': '',
-                                                '단위': '',
-                                                '원본행': row,
-                                                '헤더': headers
-                                            }
-                                            
-                                            # 헤더와 데이터 매칭 (개선된 로직)
-                                            for j, header in enumerate(headers):
-                                                if j < len(row) and header:
-                                                    header_str = str(header).strip().lower()
-                                                    value = str(row[j]) if row[j] is not None else ""
-                                                    
-                                                    # 더 정교한 컬럼 매핑
-                                                    if any(keyword in header_str for keyword in ['물질명', '오염물질', '항목']):
-                                                        row_data['물질명'] = value
-                                                    elif any(keyword in header_str for keyword in ['농도', '배출농도']):
-                                                        row_data['농도'] = value
-                                                    elif any(keyword in header_str for keyword in ['배출량', '연간배출량']):
-                                                        row_data['배출량'] = value
-                                                    elif any(keyword in header_str for keyword in ['단위']):
-                                                        row_data['단위'] = value
-                                                    elif '최대배출기준' in header_str:
-                                                        row_data['최대배출기준'] = value
-                                                    elif '허가배출기준' in header_str:
-                                                        row_data['허가배출기준'] = value
-                                                    elif '근거' in header_str:
-                                                        if '최대' in header_str:
-                                                            row_data['최대배출기준근거'] = process_emission_basis(value)
-                                                        elif '허가' in header_str:
-                                                            row_data['허가배출기준근거'] = process_emission_basis(value)
-                                                        else:
-                                                            row_data['최대배출기준근거'] = process_emission_basis(value)
-                                                    elif '비고' in header_str:
-                                                        # 비고에서 최대배출기준 관련 내용 제외
-                                                        if value and '최대배출기준' not in value:
-                                                            row_data['비고'] = value
-                                                    
-                                                    # 원본 헤더명으로도 저장
-                                                    row_data[str(header)] = value
-                                            
-                                            all_data.append(row_data)
-                                            page_data_count += 1
-                                            break
-            
-            page_info.append({
-                '페이지': page_num,
-                '테이블수': page_tables_count,
-                '추출행수': page_data_count,
-                '원시데이터수': len([d for d in raw_table_data if d['페이지'] == page_num])
-            })
-    
-    return all_data, page_info, raw_table_data
+@st.cache_resource
+def get_default_standards():
+    """기준표 디렉터리(EMISSION_STANDARDS_DIR)에서 한 번만 읽은 배출기준 인덱스"""
+    return load_standards()
 
-def process_emission_basis(basis_text):
-    """배출기준 근거 처리 함수 (개선됨)"""
-    if not basis_text:
-        return ""
-    
-    basis_text = str(basis_text).strip()
-    
-    # 다양한 별표 패턴 처리
-    patterns = [
-        (r'별표\s*8.*?15', "별표8과15.xlsx"),
-        (r'별표\s*15.*?8', "별표8과15.xlsx"),
-        (r'별표.*?8', "별표8.xlsx"),
-        (r'별표.*?15', "별표15.xlsx"),
-    ]
-    
-    for pattern, replacement in patterns:
-        if re.search(pattern, basis_text, re.IGNORECASE):
-            return replacement
-    
-    # 그 외의 경우 원본 그대로 반환
-    return basis_text
+@st.cache_resource(max_entries=8)
+def load_uploaded_standards(uploads):
+    """기본 기준표에 업로드한 기준표((파일명, 내용) 튜플)를 더한 인덱스 (같은 업로드는 한 번만 읽음)"""
+    index = load_standards()
+    for name, content in uploads:
+        index.add_file(BytesIO(content), filename=name)
+    return index
 
-def validate_data_accuracy(data):
-    """데이터 정확성 검증 및 불확실한 데이터 기록 (개선됨)"""
-    validation_issues = []
-    
-    for idx, row in enumerate(data):
-        issues = []
-        
-        # 필수 필드 체크
-        required_fields = ['배출구번호', '물질명']
-        for field in required_fields:
-            if not row.get(field) or str(row[field]).strip() == '':
-                issues.append(f"필수 필드 누락: {field}")
-        
-        # 배출구 번호 형식 체크
-        outlet_num = row.get('배출구번호', '')
-        if outlet_num and not re.match(r'^#?[A-Z]+\d*$', outlet_num):
-            issues.append(f"배출구번호 형식 오류: {outlet_num}")
-        
-        # 숫자 필드 검증
-        numeric_fields = ['농도', '배출량', '최대배출기준', '허가배출기준']
-        for field in numeric_fields:
-            value = row.get(field, '')
-            if value and value != '-':
-                # 숫자, 쉼표, 점, 하이픈, 슬래시, 공백만 허용
-                clean_value = str(value).replace(',', '').replace(' ', '').replace('/', '').replace('-', '')
-                if clean_value and not re.match(r'^[\d.]+$', clean_value):
-                    issues.append(f"숫자 형식 오류: {field} = {value}")
-        
-        # 배출기준과 근거 일치성 체크
-        if row.get('최대배출기준') and not row.get('최대배출기준근거'):
-            issues.append("최대배출기준 근거 누락")
-        
-        # 테이블 타입별 추가 검증
-        table_type = row.get('테이블타입', '')
-        if table_type == 'emission_standards':
-            if not (row.get('최대배출기준') or row.get('허가배출기준')):
-                issues.append("배출기준 테이블에 기준값 없음")
-        
-        if issues:
-            validation_issues.append({
-                '행번호': idx + 1,
-                '배출구': row.get('원본배출구', ''),
-                '물질명': row.get('물질명', ''),
-                '페이지': row.get('페이지', ''),
-                '테이블타입': table_type,
-                '문제점': ', '.join(issues)
-            })
-    
-    return validation_issues
-
-def create_standardized_excel(plan_data, review_data, validation_issues, comparison_results, unmatched_items, raw_data=None):
-    """표준화된 엑셀 파일 생성 (개선됨)"""
-    
-    # 새 워크북 생성
-    wb = openpyxl.Workbook()
-    
-    # 기본 시트 제거
-    wb.remove(wb.active)
-    
-    # 스타일 정의
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 1. 통합 데이터 시트
-    ws_integrated = wb.create_sheet("통합데이터")
-    
-    # 헤더 설정 (확장됨)
-    headers = [
-        '구분', '페이지', '테이블', '테이블타입', '배출구번호', '원본배출구', '물질명', 
-        '농도', '배출량', '단위', '최대배출기준', '허가배출기준', 
-        '최대배출기준근거', '허가배출기준근거', '비고'
-    ]
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws_integrated.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-        cell.alignment = Alignment(horizontal='center')
-    
-    # 계획서 데이터 추가
-    row = 2
-    for data_row in plan_data:
-        ws_integrated.cell(row=row, column=1, value="계획서")
-        ws_integrated.cell(row=row, column=2, value=data_row.get('페이지', ''))
-        ws_integrated.cell(row=row, column=3, value=data_row.get('테이블', ''))
-        ws_integrated.cell(row=row, column=4, value=data_row.get('테이블타입', ''))
-        ws_integrated.cell(row=row, column=5, value=data_row.get('배출구번호', ''))
-        ws_integrated.cell(row=row, column=6, value=data_row.get('원본배출구', ''))
-        ws_integrated.cell(row=row, column=7, value=data_row.get('물질명', ''))
-        ws_integrated.cell(row=row, column=8, value=data_row.get('농도', ''))
-        ws_integrated.cell(row=row, column=9, value=data_row.get('배출량', ''))
-        ws_integrated.cell(row=row, column=10, value=data_row.get('단위', ''))
-        ws_integrated.cell(row=row, column=11, value=data_row.get('최대배출기준', ''))
-        ws_integrated.cell(row=row, column=12, value=data_row.get('허가배출기준', ''))
-        ws_integrated.cell(row=row, column=13, value=data_row.get('최대배출기준근거', ''))
-        ws_integrated.cell(row=row, column=14, value=data_row.get('허가배출기준근거', ''))
-        ws_integrated.cell(row=row, column=15, value=data_row.get('비고', ''))
-        
-        # 테이블 타입별 색상 적용
-        table_type = data_row.get('테이블타입', '')
-        if table_type == 'emission_standards':
-            type_color = PatternFill(start_color="E8F5E8", end_color="E8F5E8", fill_type="solid")
-        elif table_type == 'emission_data':
-            type_color = PatternFill(start_color="E8F0FF", end_color="E8F0FF", fill_type="solid")
-        else:
-            type_color = PatternFill(start_color="FFF8E1", end_color="FFF8E1", fill_type="solid")
-        
-        # 테두리 및 색상 적용
-        for col in range(1, 16):
-            cell = ws_integrated.cell(row=row, column=col)
-            cell.border = border
-            if col == 4:  # 테이블타입 컬럼
-                cell.fill = type_color
-        
-        row += 1
-    
-    # 검토서 데이터 추가 (동일한 방식)
-    for data_row in review_data:
-        ws_integrated.cell(row=row, column=1, value="검토서")
-        # ... (계획서와 동일한 로직)
-        row += 1
-    
-    # 열 너비 조정
-    column_widths = [8, 6, 6, 12, 12, 15, 20, 10, 10, 8, 15, 15, 20, 20, 25]
-    for col, width in enumerate(column_widths, 1):
-        ws_integrated.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
-    
-    # 2. 원시 데이터 시트 (새로 추가)
-    if raw_data:
-        ws_raw = wb.create_sheet("원시데이터")
-        
-        raw_headers = ['페이지', '테이블', '테이블타입', '원본행데이터', '헤더정보']
-        for col, header in enumerate(raw_headers, 1):
-            cell = ws_raw.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = PatternFill(start_color="FF9800", end_color="FF9800", fill_type="solid")
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center')
-        
-        for row_idx, raw_row in enumerate(raw_data, 2):
-            ws_raw.cell(row=row_idx, column=1, value=raw_row.get('페이지', ''))
-            ws_raw.cell(row=row_idx, column=2, value=raw_row.get('테이블', ''))
-            ws_raw.cell(row=row_idx, column=3, value=raw_row.get('테이블타입', ''))
-            ws_raw.cell(row=row_idx, column=4, value=str(raw_row.get('원본행', '')))
-            ws_raw.cell(row=row_idx, column=5, value=str(raw_row.get('헤더', '')))
-            
-            for col in range(1, 6):
-                ws_raw.cell(row=row_idx, column=col).border = border
-    
-    # 기존 시트들 (데이터검증, 비교결과 등) 추가
-    # ... (기존 코드와 동일)
-    
-    # 메모리에서 파일 생성
-    output = BytesIO()
-    wb.save(output)
-    output.seek(0)
-    
-    return output
+def build_standards_index(uploaded_files):
+    """업로드한 기준표가 있으면 기본 기준표에 더한 인덱스를, 없으면 공유 인덱스를 반환
+    
+    작업 진행 중에는 화면이 0.5초마다 다시 실행되므로 엑셀을 매번 읽지 않도록 파일명·내용으로 캐시한다.
+    """
+    if not uploaded_files:
+        return get_default_standards()
+    uploads = tuple((uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files)
+    return load_uploaded_standards(uploads)
 
 # 메인 애플리케이션 (기존과 동일하지만 raw_data 추가)
 def main():
     st.title("📊 PDF 배출구 데이터 추출 및 정리 웹 서비스")
     st.markdown("---")
+    job_manager = get_job_manager()
     
     # 사이드바 설정
     with st.sidebar:
@@ -452,6 +80,99 @@ def main():
             help="여러 타입을 선택할 수 있습니다."
         )
         
+        # 문서 형태별 추출 프로파일
+        st.subheader("문서 형태")
+        profile = st.selectbox(
+            "추출 프로파일",
+            options=PROFILE_CHOICES,
+            index=PROFILE_CHOICES.index(PROFILE_DEFAULT),
+            format_func=lambda name: "자동 감지 (앞쪽 페이지 기준)" if name == PROFILE_AUTO else PROFILES[name].description,
+            help="문서 형태에 맞춘 테이블 탐색 설정과 헤더 키워드를 사용합니다. 자동 감지는 앞쪽 몇 페이지의 키워드로 형태를 판단합니다."
+        )
+        
+        # 병렬 처리 설정
+        st.subheader("처리 옵션")
+        workers = st.number_input(
+            "병렬 처리 워커 수",
+            min_value=1,
+            max_value=DEFAULT_WORKERS,
+            value=DEFAULT_WORKERS,
+            help=f"{MIN_PARALLEL_PAGES}쪽 이상인 PDF는 페이지를 여러 프로세스에 나누어 동시에 추출합니다. "
+                 "그보다 작은 문서는 프로세스 기동 비용이 더 커서 순차 처리합니다. 1이면 항상 순차 처리합니다."
+        )
+        use_cache = st.checkbox(
+            "추출 결과 캐시 사용",
+            value=True,
+            help="같은 PDF를 다시 처리하거나 배출구 타입만 바꾸면 저장된 테이블 파싱 결과를 재사용합니다."
+        )
+        strict = st.checkbox(
+            "엄격 모드 (감사용)",
+            value=False,
+            help="페이지 사전 필터를 끄고 모든 페이지에서 테이블을 추출합니다. 배출 테이블 키워드가 없는 페이지도 검사합니다."
+        )
+        supervise = st.checkbox(
+            "페이지 감시 (멈춘 페이지 건너뛰기·이어서 처리)",
+            value=False,
+            help="페이지마다 제한 시간과 메모리 예산을 두고 별도 프로세스에서 추출합니다. 넘긴 페이지는 건너뛰고 "
+                 "페이지별 처리 현황에 남깁니다. 끝난 페이지는 디스크에 저장되어, 중단된 뒤 같은 파일을 다시 "
+                 "처리하면 남은 페이지부터 이어서 처리합니다."
+        )
+        page_timeout = DEFAULT_PAGE_TIMEOUT
+        if supervise:
+            page_timeout = st.number_input(
+                "페이지당 제한 시간(초)",
+                min_value=1.0,
+                value=DEFAULT_PAGE_TIMEOUT or 120.0,
+                step=10.0
+            )
+        track_memory = st.checkbox(
+            "메모리 사용량 계측",
+            value=False,
+            help="단계별 최대 메모리를 tracemalloc으로 기록합니다 (📈 통계 탭). 켜면 처리가 느려지고, "
+                 "다른 작업이 동시에 실행되면 값이 섞일 수 있습니다. 처리 시간은 항상 기록됩니다."
+        )
+        
+        # 출력 파일 (서식 있는 엑셀은 대용량에서 가장 느린 단계이므로 끌 수 있음)
+        st.subheader("출력 파일")
+        excel = st.checkbox(
+            "정리양식.xlsx 생성",
+            value=True,
+            help="서식이 있는 엑셀 파일을 만듭니다. 대용량 문서에서 데이터만 필요하면 끄고 대량 내보내기를 사용하세요."
+        )
+        export_format = st.selectbox(
+            "대량 내보내기",
+            options=[None] + list(available_formats()),
+            format_func=lambda fmt: "사용 안 함" if fmt is None else fmt.upper(),
+            help="통합데이터·원시데이터·검증이슈·페이지통계를 서식 없는 Parquet/CSV/JSONL 파일로 묶어 zip으로 받습니다."
+        )
+        
+        if st.button("🗑️ 캐시 비우기"):
+            get_extraction_cache().clear()
+            st.success("캐시를 비웠습니다.")
+        
+        job_counts = job_manager.counts()
+        st.caption(
+            f"서버 작업: 실행 {job_counts[JOB_RUNNING]}/{job_manager.max_workers}, 대기 {job_counts[JOB_QUEUED]}"
+        )
+        memory_usage = current_memory_bytes()
+        if MEMORY_LIMIT and memory_usage is not None:
+            st.caption(f"서버 메모리: {memory_usage / 1e6:,.0f}MB / 상한 {MEMORY_LIMIT / 1e6:,.0f}MB")
+        
+        # 배출기준표
+        st.subheader("배출기준표 (별표8/별표15)")
+        standards_files = st.file_uploader(
+            "기준표 파일 (CSV/엑셀)",
+            type=['csv', 'xlsx', 'xls'],
+            accept_multiple_files=True,
+            key="standards_files",
+            help="파일명에 별표 번호를 넣어 주세요 (예: 별표8.xlsx). 컬럼: 물질명, 기준값, 시설구분(선택), 단위(선택)"
+        )
+        standards_index = build_standards_index(standards_files)
+        if len(standards_index):
+            st.caption(f"기준 {len(standards_index)}건 로드됨 ({', '.join(sorted(standards_index.annexes))})")
+        else:
+            st.caption("기준표가 없어 배출기준 초과 판정을 건너뜁니다.")
+        
         st.markdown("---")
         st.markdown("""
         ### 📋 지원 파일 형태
@@ -499,107 +220,250 @@ def main():
         st.markdown("---")
         
         if st.button("🚀 데이터 추출 및 정리 시작", type="primary"):
-            with st.spinner("PDF 파일을 처리하고 있습니다..."):
-                
-                # 계획서 데이터 추출 (개선된 함수 사용)
-                st.info("📖 계획서.PDF 데이터 추출 중...")
-                plan_data, plan_page_info, plan_raw_data = extract_table_from_pdf(plan_file, outlet_types)
-                
-                # 검토서 데이터 추출 (있는 경우)
-                review_data = []
-                review_page_info = []
-                review_raw_data = []
-                if review_file:
-                    st.info("📖 검토서.PDF 데이터 추출 중...")
-                    review_data, review_page_info, review_raw_data = extract_table_from_pdf(review_file, outlet_types)
-                
-                # 데이터 검증
-                st.info("🔍 데이터 정확성 검증 중...")
-                plan_validation = validate_data_accuracy(plan_data)
-                review_validation = validate_data_accuracy(review_data) if review_data else []
-                all_validation_issues = plan_validation + review_validation
-                
-                # 결과 표시
-                st.success("✅ 데이터 처리 완료!")
-                
-                # 통계 정보 (확장됨)
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("계획서 추출 건수", len(plan_data))
-                with col2:
-                    st.metric("검토서 추출 건수", len(review_data))
-                with col3:
-                    st.metric("원시 데이터", len(plan_raw_data) + len(review_raw_data))
-                with col4:
-                    st.metric("검증 이슈", len(all_validation_issues))
-                
-                # 테이블 타입별 통계
-                if plan_data:
-                    type_stats = {}
-                    for data in plan_data:
-                        table_type = data.get('테이블타입', 'unknown')
-                        type_stats[table_type] = type_stats.get(table_type, 0) + 1
-                    
-                    st.subheader("📊 테이블 타입별 통계")
-                    type_cols = st.columns(len(type_stats))
-                    for i, (type_name, count) in enumerate(type_stats.items()):
-                        with type_cols[i]:
-                            st.metric(f"{type_name}", count)
-                
-                # 탭으로 결과 표시
-                tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 통합 데이터", "🔍 원시 데이터", "⚠️ 검증 이슈", "📈 통계", "💾 다운로드"])
-                
-                with tab1:
-                    st.subheader("통합 데이터 미리보기")
-                    if plan_data:
-                        plan_df = pd.DataFrame(plan_data)
-                        st.dataframe(plan_df, use_container_width=True)
-                
-                with tab2:
-                    st.subheader("원시 데이터 (디버깅용)")
-                    if plan_raw_data:
-                        st.write("**계획서 원시 데이터:**")
-                        raw_df = pd.DataFrame(plan_raw_data)
-                        st.dataframe(raw_df, use_container_width=True)
-                
-                with tab3:
-                    st.subheader("데이터 검증 이슈")
-                    if all_validation_issues:
-                        st.warning(f"⚠️ {len(all_validation_issues)}개의 검증 이슈가 발견되었습니다.")
-                        issues_df = pd.DataFrame(all_validation_issues)
-                        st.dataframe(issues_df, use_container_width=True)
-                    else:
-                        st.success("✅ 검증 이슈가 없습니다.")
-                
-                with tab4:
-                    st.subheader("처리 통계")
-                    if plan_page_info:
-                        st.write("**페이지별 처리 현황:**")
-                        page_df = pd.DataFrame(plan_page_info)
-                        st.dataframe(page_df, use_container_width=True)
-                
-                with tab5:
-                    st.subheader("📥 정리양식.xlsx 다운로드")
-                    
-                    with st.spinner("엑셀 파일을 생성하고 있습니다..."):
-                        excel_file = create_standardized_excel(
-                            plan_data, review_data, all_validation_issues, 
-                            [], [], plan_raw_data + review_raw_data
-                        )
-                    
-                    # 파일명 생성
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"정리양식_{timestamp}.xlsx"
-                    
-                    st.download_button(
-                        label="📥 정리양식.xlsx 다운로드",
-                        data=excel_file.getvalue(),
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        type="primary"
-                    )
-                    
-                    st.success(f"✅ {filename} 파일이 준비되었습니다!")
+            # 단계별 처리 시간 (메모리는 선택 시에만 계측)
+            profiler = StageProfiler(
+                track_memory=track_memory, 계획서=plan_file.name, 검토서=review_file.name if review_file else '',
+                배출구타입=outlet_types, 워커수=workers, 캐시사용=use_cache, 엄격모드=strict, 추출프로파일=profile,
+                엑셀생성=excel, 대량내보내기=export_format or '', 페이지감시=page_timeout if supervise else ''
+            )
+            job = job_manager.submit(
+                process_uploads, SpooledUpload(plan_file), SpooledUpload(review_file) if review_file else None,
+                list(outlet_types),
+                standards_index=standards_index if len(standards_index) else None,
+                workers=workers, cache=get_extraction_cache() if use_cache else None, strict=strict, profile=profile,
+                profiler=profiler, preview=True, excel=excel, export_format=export_format,
+                supervision=PageSupervision(page_timeout=page_timeout) if supervise else None, label=plan_file.name
+            )
+            st.session_state[JOB_STATE_KEY] = job.id
+    
+    show_job(job_manager, st.session_state.get(JOB_STATE_KEY))
+
+def show_job(job_manager, job_id):
+    """세션의 작업 상태 표시: 진행 중이면 진행률을 갱신하고, 끝났으면 보관된 결과를 표시"""
+    if not job_id:
+        return
+    
+    job = job_manager.get(job_id)
+    if job is None:
+        st.info("이전 처리 결과가 보관 기간이 지나 삭제되었습니다. 다시 처리해 주세요.")
+        return
+    
+    if not job.done:
+        st.markdown("---")
+        if job.status == JOB_QUEUED:
+            st.info(f"⏳ 대기 중입니다 (앞선 작업 {job_manager.queue_position(job)}개). 동시에 처리할 수 있는 작업 수를 초과했습니다.")
+        st.progress(job.progress, text=f"{job.message} ({job.elapsed():.0f}초 경과)")
+        # 동시에 처리 중인 문서(계획서/검토서)별 진행률
+        for part, (part_progress, part_message) in list(job.parts.items()):
+            st.progress(part_progress, text=f"{part}: {part_message}")
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
+    
+    if job.status == JOB_FAILED:
+        st.error(f"❌ 처리 중 오류가 발생했습니다: {job.error}")
+        with st.expander("오류 상세"):
+            st.code(job.message)
+        return
+    
+    show_results(job)
+
+def show_preview(table, key):
+    """미리보기 표를 필터·페이지 단위로 표시 (브라우저에는 현재 페이지의 행만 전송)"""
+    if not len(table):
+        st.info("표시할 행이 없습니다.")
+        return
+    
+    filter_cols = st.columns([2, 2, 3, 1, 1])
+    filters = {}
+    if table.has_filter(FILTER_OUTLET):
+        with filter_cols[0]:
+            filters['outlet'] = st.text_input("배출구번호 검색", key=f"{key}_outlet")
+    if table.has_filter(FILTER_SUBSTANCE):
+        with filter_cols[1]:
+            filters['substance'] = st.text_input("물질명 검색", key=f"{key}_substance")
+    if table.has_filter(FILTER_TABLE_TYPE):
+        with filter_cols[2]:
+            filters['table_types'] = st.multiselect("테이블타입", table.choices(FILTER_TABLE_TYPE), key=f"{key}_types")
+    with filter_cols[3]:
+        page_size = st.selectbox("쪽당 행", PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key=f"{key}_size")
+    with filter_cols[4]:
+        number = st.number_input("쪽", min_value=1, value=1, step=1, key=f"{key}_page")
+    
+    page = table.page(number, page_size, **filters)
+    if page.total:
+        st.caption(
+            f"{page.total:,}행 중 {page.start + 1:,}–{page.start + len(page.frame):,}행 ({page.number}/{page.page_count}쪽)"
+        )
+    else:
+        st.caption(f"조건에 맞는 행이 없습니다 (전체 {len(table):,}행)")
+    st.dataframe(page.frame, use_container_width=True, hide_index=True)
+
+def choose_document(previews, key, suffix=''):
+    """검토서가 있으면 계획서/검토서 중 표시할 문서 선택"""
+    labels = [label for label in (PLAN_LABEL, REVIEW_LABEL) if len(previews[f"{label}{suffix}"])] or [PLAN_LABEL]
+    if len(labels) == 1:
+        return labels[0]
+    return st.radio("문서", labels, horizontal=True, key=key)
+
+def show_results(job):
+    """완료된 작업의 결과 표시 (다시 실행되어도 작업에 보관된 결과와 엑셀 파일을 재사용)"""
+    result = job.result
+    plan_data, plan_page_info, plan_raw_data = result['plan_data'], result['plan_page_info'], result['plan_raw_data']
+    review_data, review_raw_data = result['review_data'], result['review_raw_data']
+    all_validation_issues = result['validation_issues']
+    comparison_results, unmatched_items = result['comparison_results'], result['unmatched_items']
+    profiler = result['profiler']
+    previews = result['previews']
+    
+    st.markdown("---")
+    for label, cache_hit in result['cache_hits'].items():
+        if cache_hit:
+            st.caption(f"⚡ {label}: 저장된 테이블 파싱 결과를 재사용했습니다 (배출구 필터링만 다시 적용).")
+    st.caption("📐 추출 프로파일: " + ", ".join(
+        f"{label} {name}" for label, name in result['extraction_profiles'].items()
+    ))
+    
+    # 결과 표시
+    st.success(f"✅ 데이터 처리 완료! ({job.label}, {job.elapsed():.1f}초)")
+    for label, page_info in ((PLAN_LABEL, plan_page_info), (REVIEW_LABEL, result['review_page_info'])):
+        unfinished = unfinished_pages(page_info)
+        if unfinished:
+            st.warning(
+                f"⚠️ {label}: {len(unfinished)}개 페이지를 처리하지 못했습니다 (페이지 "
+                + ", ".join(str(info['페이지']) for info in unfinished)
+                + "). 사유는 📈 통계 탭의 페이지별 처리 현황에 있습니다."
+            )
+    
+    # 통계 정보 (확장됨)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("계획서 추출 건수", len(plan_data))
+    with col2:
+        st.metric("검토서 추출 건수", len(review_data))
+    with col3:
+        st.metric("원시 데이터", len(plan_raw_data) + len(review_raw_data))
+    with col4:
+        st.metric("검증 이슈", len(all_validation_issues))
+    if result['standards_applied']:
+        st.caption(f"📏 배출기준 초과 {result['exceeded_count']}건")
+    
+    # 테이블 타입별 통계
+    if plan_data:
+        type_stats = {}
+        for table_type in plan_data.column('테이블타입'):
+            type_stats[table_type] = type_stats.get(table_type, 0) + 1
+        
+        st.subheader("📊 테이블 타입별 통계")
+        type_cols = st.columns(len(type_stats))
+        for i, (type_name, count) in enumerate(type_stats.items()):
+            with type_cols[i]:
+                st.metric(f"{type_name}", count)
+    
+    # 탭으로 결과 표시
+    tab1, tab2, tab3, tab_compare, tab4, tab5 = st.tabs(["📊 통합 데이터", "🔍 원시 데이터", "⚠️ 검증 이슈", "🔀 비교 결과", "📈 통계", "💾 다운로드"])
+    
+    with tab1:
+        st.subheader("통합 데이터 미리보기")
+        if plan_data or review_data:
+            label = choose_document(previews, "preview_data_document")
+            show_preview(previews[label], "preview_data")
+    
+    with tab2:
+        st.subheader("원시 데이터 (디버깅용)")
+        if plan_raw_data or review_raw_data:
+            label = choose_document(previews, "preview_raw_document", " 원시")
+            st.write(f"**{label} 원시 데이터:**")
+            show_preview(previews[f"{label} 원시"], "preview_raw")
+    
+    with tab3:
+        st.subheader("데이터 검증 이슈")
+        if all_validation_issues:
+            st.warning(f"⚠️ {len(all_validation_issues)}개의 검증 이슈가 발견되었습니다.")
+            show_preview(previews['검증이슈'], "preview_issues")
+        else:
+            st.success("✅ 검증 이슈가 없습니다.")
+    
+    with tab_compare:
+        st.subheader("계획서-검토서 비교 결과")
+        if not review_data:
+            st.info("검토서를 업로드하면 배출구번호·물질명 기준으로 계획서와 비교합니다.")
+        else:
+            compare_cols = st.columns(2)
+            with compare_cols[0]:
+                st.metric("값 차이", len(comparison_results))
+            with compare_cols[1]:
+                st.metric("한쪽에만 있는 항목", len(unmatched_items))
+            
+            if comparison_results:
+                st.write("**값이 다른 항목:**")
+                show_preview(previews['비교결과'], "preview_comparison")
+            if unmatched_items:
+                st.write("**한쪽에만 있는 항목:**")
+                show_preview(previews['미매칭'], "preview_unmatched")
+            if not comparison_results and not unmatched_items:
+                st.success("✅ 계획서와 검토서의 값이 모두 일치합니다.")
+    
+    with tab4:
+        st.subheader("처리 통계")
+        
+        # 단계별 처리 시간·메모리
+        st.write(f"**단계별 처리 시간** (전체 {profiler.total_time():.2f}초):")
+        st.dataframe(pd.DataFrame(profiler.stages), use_container_width=True)
+        st.download_button(
+            label="📥 처리 프로파일(JSON) 다운로드",
+            data=profiler.to_json().encode('utf-8'),
+            file_name=f"처리프로파일_{datetime.fromtimestamp(job.finished).strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+        
+        if plan_page_info:
+            # 페이지 사전 필터 통계
+            filter_counts = pd.Series([info['사전필터'] for info in plan_page_info]).value_counts()
+            filter_cols = st.columns(3)
+            for i, filter_result in enumerate(['통과', '건너뜀', '미적용']):
+                with filter_cols[i]:
+                    st.metric(f"사전필터 {filter_result}", int(filter_counts.get(filter_result, 0)))
+            
+            st.write("**페이지별 처리 현황:**")
+            page_df = pd.DataFrame(plan_page_info)
+            st.dataframe(page_df, use_container_width=True)
+            
+            if page_df[EXTRACT_TIME_KEY].gt(0).any():  # 캐시 적중이면 모두 0
+                st.write("**추출 시간이 긴 페이지 (상위 5개):**")
+                slowest_pages = page_df.sort_values(EXTRACT_TIME_KEY, ascending=False).head(5)
+                st.dataframe(slowest_pages, use_container_width=True)
+    
+    with tab5:
+        # 파일명 생성 (작업 완료 시각 기준이라 다시 실행되어도 같은 이름)
+        timestamp = datetime.fromtimestamp(job.finished).strftime("%Y%m%d_%H%M%S")
+        
+        if result['excel_bytes'] is not None:
+            st.subheader("📥 정리양식.xlsx 다운로드")
+            filename = f"정리양식_{timestamp}.xlsx"
+            
+            st.download_button(
+                label="📥 정리양식.xlsx 다운로드",
+                data=result['excel_bytes'],
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                type="primary"
+            )
+            
+            st.success(f"✅ {filename} 파일이 준비되었습니다!")
+        
+        if result.get('export_bytes') is not None:
+            export_format = result['export_format']
+            st.subheader(f"📦 대량 내보내기 ({export_format.upper()})")
+            st.caption("통합데이터·원시데이터·검증이슈·페이지통계 파일을 zip 하나로 묶었습니다 ('구분' 컬럼: 계획서/검토서).")
+            st.download_button(
+                label=f"📦 데이터_{export_format}.zip 다운로드",
+                data=result['export_bytes'],
+                file_name=f"데이터_{export_format}_{timestamp}.zip",
+                mime="application/zip"
+            )
+        
+        if result['excel_bytes'] is None and result.get('export_bytes') is None:
+            st.info("출력 파일을 만들지 않도록 설정되어 있습니다 (사이드바 '출력 파일').")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file